@@ -1,6 +1,7 @@
 import pygame
 from pygame.locals import *
 import random
+from Code.game_clock import LOGIC_DT
 
 
 class AnimatedPlayer(pygame.sprite.Sprite):
@@ -12,7 +13,8 @@ class AnimatedPlayer(pygame.sprite.Sprite):
         self.y = 0
         self.height = 80
         self.width = 80
-        self.speed = 4  # Reduced for better control
+        self.speed_per_second = 60  # Pixels per second (reduced for better control)
+        self.speed = round(self.speed_per_second * LOGIC_DT)  # Pixels per logic tick
         self.frame = 0
         self.state = 0  # 0=up, 1=down, 2=right, 3=left, 4-7=idle states
         self.buffer = 15
@@ -33,8 +35,48 @@ class AnimatedPlayer(pygame.sprite.Sprite):
         self.display_width = int(self.width * self.scale)
         self.display_height = int(self.height * self.scale)
 
-    def update_position(self, screen_width, screen_height):
-        """Update player position based on key presses"""
+        # Pre-scaled animation frames indexed by (state, frame)
+        self.num_states = 8
+        self.num_frames = 8
+        self.frames = {}
+        self.frames_size = None
+        self.build_frame_atlas()
+
+    def build_frame_atlas(self):
+        """Slice, trim, scale and convert every animation frame once"""
+        self.frames = {}
+        display_ready = pygame.display.get_surface() is not None
+
+        for state in range(self.num_states):
+            for frame in range(self.num_frames):
+                sprite_rect = Rect(
+                    frame * self.width + self.buffer,
+                    state * self.height + self.buffer,
+                    self.width - self.buffer,
+                    self.height - self.buffer
+                )
+                try:
+                    current_sprite = self.spriteSheet.subsurface(sprite_rect)
+                    scaled_sprite = pygame.transform.scale(current_sprite,
+                                                           (self.display_width, self.display_height))
+                    if display_ready:
+                        scaled_sprite = scaled_sprite.convert_alpha()
+                    self.frames[(state, frame)] = scaled_sprite
+                except (ValueError, pygame.error):
+                    # Frame is outside the sprite sheet - draw_at_screen_position falls back
+                    self.frames[(state, frame)] = None
+
+        self.frames_size = (self.display_width, self.display_height)
+
+    def set_scale(self, scale):
+        """Change the display scale and rebuild the frame atlas"""
+        self.scale = scale
+        self.display_width = int(self.width * self.scale)
+        self.display_height = int(self.height * self.scale)
+        self.build_frame_atlas()
+
+    def update_position(self, screen_width, screen_height, can_move_to=None):
+        """Update player position based on key presses (can_move_to(x, y) can refuse a blocked step)"""
         # Reset to idle states if no movement
         if self.state == 0:
             self.state = 4  # Up idle
@@ -48,59 +90,57 @@ class AnimatedPlayer(pygame.sprite.Sprite):
         pressed_keys = pygame.key.get_pressed()
         moved = False
 
-        # Movement with bounds checking
+        # Movement with bounds checking - each direction is checked on its own so the player slides along walls
         if self.y > 0:
             if pressed_keys[K_UP]:
-                self.y -= self.speed
                 self.state = 0
-                moved = True
+                moved = self.try_move(0, -self.speed, can_move_to) or moved
 
         if self.y < screen_height - self.display_height:
             if pressed_keys[K_DOWN]:
-                self.y += self.speed
                 self.state = 1
-                moved = True
+                moved = self.try_move(0, self.speed, can_move_to) or moved
 
         if self.x < screen_width - self.display_width:
             if pressed_keys[K_RIGHT]:
-                self.x += self.speed
                 self.state = 2
-                moved = True
+                moved = self.try_move(self.speed, 0, can_move_to) or moved
 
         if self.x > 0:
             if pressed_keys[K_LEFT]:
-                self.x -= self.speed
                 self.state = 3
-                moved = True
+                moved = self.try_move(-self.speed, 0, can_move_to) or moved
 
         return moved
 
+    def try_move(self, dx, dy, can_move_to=None):
+        """Move by (dx, dy) unless the destination is blocked"""
+        if can_move_to and not can_move_to(self.x + dx, self.y + dy):
+            return False
+        self.x += dx
+        self.y += dy
+        return True
+
     def draw(self, screen):
         """Draw the animated character at current position"""
         self.draw_at_screen_position(screen, self.x, self.y)
 
-    def draw_at_screen_position(self, screen, screen_x, screen_y):
-        """Draw the animated character at specified screen position"""
-        # Animate frames
+    def advance_animation(self):
+        """Step the walk/idle animation by one frame (called once per logic tick)"""
         self.frame += 1
         if self.frame >= 8:
             self.frame = 0
 
-        # Get current sprite from sheet
-        sprite_rect = Rect(
-            self.frame * self.width + self.buffer,
-            self.state * self.height + self.buffer,
-            self.width - self.buffer,
-            self.height - self.buffer
-        )
-
-        try:
-            current_sprite = self.spriteSheet.subsurface(sprite_rect)
-            # Scale down the sprite
-            scaled_sprite = pygame.transform.scale(current_sprite,
-                                                   (self.display_width, self.display_height))
-            screen.blit(scaled_sprite, (screen_x, screen_y))
-        except:
+    def draw_at_screen_position(self, screen, screen_x, screen_y):
+        """Draw the animated character at specified screen position"""
+        # Rebuild the atlas if the display size was changed directly
+        if self.frames_size != (self.display_width, self.display_height):
+            self.build_frame_atlas()
+
+        current_sprite = self.frames.get((self.state, self.frame))
+        if current_sprite is not None:
+            screen.blit(current_sprite, (screen_x, screen_y))
+        else:
             # Fallback drawing - draw a simple character representation (larger)
             # Body
             pygame.draw.circle(screen, (220, 180, 140),
@@ -0,0 +1,78 @@
+import json
+import time
+from pathlib import Path
+
+
+def load_autosave_config():
+    """Read auto_save and save_interval (seconds) from assets/game_config.json, returns (enabled, interval)"""
+    try:
+        config_file = Path(__file__).parent.parent / 'assets' / 'game_config.json'
+        with open(config_file, 'r') as f:
+            settings = json.load(f).get("settings", {})
+        return bool(settings.get("auto_save", True)), float(settings.get("save_interval", 30))
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Could not read autosave settings: {e}")
+        return True, 30.0
+
+
+class AutosaveScheduler:
+    """Saves the subsystems marked dirty once per save interval instead of on every change
+
+    Saving only takes a snapshot on the game thread - the writing happens on the save queue thread.
+    With auto_save off every change is saved straight away, as before.
+    """
+
+    def __init__(self, enabled=True, interval=30.0, clock=time.monotonic):
+        self.enabled = enabled
+        self.interval = interval
+        self.clock = clock
+        self.savers = {}  # subsystem name -> save function, saved in registration order
+        self.dirty = set()
+        self.next_save = clock()
+
+        # Statistics
+        self.requests = 0
+        self.saves = 0
+
+    def register(self, name, save):
+        """Add a subsystem and the function that saves it"""
+        self.savers[name] = save
+
+    def mark_dirty(self, name):
+        """Note a subsystem changed - it is saved at the next interval (now if autosave is off)"""
+        self.requests += 1
+        if not self.enabled:
+            self.save(name)
+            return
+        self.dirty.add(name)
+
+    def update(self):
+        """Once per frame - save the dirty subsystems if the interval is up"""
+        if self.dirty and self.clock() >= self.next_save:
+            self.flush()
+
+    def flush(self):
+        """Save every dirty subsystem now (level change, character switch, quit, crash)"""
+        for name in self.savers:
+            if name in self.dirty:
+                self.save(name)
+        self.next_save = self.clock() + self.interval
+
+    def save(self, name):
+        """Save one subsystem"""
+        self.dirty.discard(name)
+        self.saves += 1
+        try:
+            self.savers[name]()
+        except Exception as e:
+            print(f"Autosave of {name} failed: {e}")
+
+    def get_stats(self):
+        """Get scheduler counters"""
+        return {
+            "enabled": self.enabled,
+            "interval": self.interval,
+            "dirty": sorted(self.dirty),
+            "requests": self.requests,
+            "saves": self.saves
+        }
@@ -0,0 +1,182 @@
+import copy
+
+MISSING = object()
+
+# Keys journaled as "+N" instead of the new value
+COUNTER_KEYS = ("Credits", "Experience_Points")
+# Keys journaled as equipment changes
+EQUIP_PREFIXES = ("Weapon", "Armor_Slot")
+
+
+class TrackedDict(dict):
+    """dict that remembers which keys changed since the journal last looked, and their values before"""
+    nested = ()  # Keys whose dict values are tracked too
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.before = {}  # key -> value before the first change since the last collect (MISSING if new)
+        for key in self.nested:
+            value = super().get(key)
+            if type(value) is dict:
+                super().__setitem__(key, TrackedDict(value))
+
+    def note(self, key):
+        """Remember a key's value before it changes"""
+        if key not in self.before:
+            self.before[key] = super().get(key, MISSING)
+
+    def __setitem__(self, key, value):
+        if key in self.nested and type(value) is dict:
+            value = TrackedDict(value)
+        self.note(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.note(key)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self.note(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.before.setdefault(key, value)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        for key in list(self):
+            self.note(key)
+        super().clear()
+
+    def __deepcopy__(self, memo):
+        # Snapshots are plain dicts
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class CharacterRecord(TrackedDict):
+    """Tracked character data - the inventory is tracked per item"""
+    nested = ("Inventory",)
+
+
+class CharacterJournal:
+    """Append-only journal of typed character deltas, compacted into a full snapshot every so often
+
+    Entries are {"seq", "op", ...} with op one of add (counters +N), item / item_remove (inventory),
+    equip (weapon and armor slots), set and remove (anything else). A snapshot records the last entry
+    it includes as Journal_Seq, so replaying a journal that wasn't cleared yet never applies one twice.
+    """
+
+    def __init__(self, compact_every=100):
+        self.compact_every = compact_every  # Journal entries between snapshots
+        self.seq = 0  # Last entry handed out
+        self.snapshot_seq = 0  # Last entry included in a snapshot
+
+    def track(self, data):
+        """Get character data as a CharacterRecord so its changes are recorded"""
+        return data if isinstance(data, CharacterRecord) else CharacterRecord(data)
+
+    def load(self, data, entries):
+        """Replay journal entries newer than the snapshot onto it, returns the tracked data"""
+        data = dict(data)
+        self.snapshot_seq = self.seq = data.get("Journal_Seq", 0)
+        for entry in entries:
+            if entry["seq"] > self.seq:
+                self.apply(data, entry)
+                self.seq = entry["seq"]
+        return self.track(data)
+
+    def needs_snapshot(self):
+        """Check if enough entries have piled up to compact them into a snapshot"""
+        return self.seq - self.snapshot_seq >= self.compact_every
+
+    def snapshot(self, data):
+        """Mark the data as including every entry so far (the next save writes it whole)"""
+        dict.__setitem__(data, "Journal_Seq", self.seq)  # Not a change to journal
+        self.snapshot_seq = self.seq
+        data.before.clear()
+        inventory = data.get("Inventory")
+        if isinstance(inventory, TrackedDict):
+            inventory.before.clear()
+        return data
+
+    def collect(self, data):
+        """Get the journal entries for everything changed since the last collect"""
+        entries = []
+        for key, old in data.before.items():
+            new = data.get(key, MISSING)
+            if key == "Inventory" and old is new:
+                continue  # Same inventory, items are collected below
+            if new is MISSING:
+                entries.append({"op": "remove", "key": key})
+            elif old == new:
+                continue
+            elif key in COUNTER_KEYS and isinstance(old, (int, float)) and isinstance(new, (int, float)):
+                entries.append({"op": "add", "key": key, "amount": new - old})
+            elif key.startswith(EQUIP_PREFIXES):
+                entries.append({"op": "equip", "slot": key, "item": new})
+            else:
+                entries.append({"op": "set", "key": key, "value": copy.deepcopy(new)})
+        data.before.clear()
+
+        inventory = data.get("Inventory")
+        if isinstance(inventory, TrackedDict):
+            for name, old in inventory.before.items():
+                new = inventory.get(name, MISSING)
+                if new is MISSING:
+                    entries.append({"op": "item_remove", "name": name})
+                elif new != old:
+                    entries.append({"op": "item", "name": name, "count": new})
+            inventory.before.clear()
+
+        for entry in entries:
+            self.seq += 1
+            entry["seq"] = self.seq
+        return entries
+
+    @staticmethod
+    def apply(data, entry):
+        """Apply one journal entry to plain character data"""
+        op = entry["op"]
+        if op == "add":
+            data[entry["key"]] = data.get(entry["key"], 0) + entry["amount"]
+        elif op == "item":
+            data.setdefault("Inventory", {})[entry["name"]] = entry["count"]
+        elif op == "item_remove":
+            data.get("Inventory", {}).pop(entry["name"], None)
+        elif op == "equip":
+            data[entry["slot"]] = entry["item"]
+        elif op == "set":
+            data[entry["key"]] = entry["value"]
+        elif op == "remove":
+            data.pop(entry["key"], None)
+
+    @classmethod
+    def merge(cls, old, new):
+        """Combine two queued save records for one character (SaveQueue merge) - nothing queued is dropped
+
+        Records are ("journal", entries, roster summary) or ("snapshot", data, progression).
+        """
+        if new[0] == "snapshot":
+            return new
+        if old[0] == "journal":
+            return "journal", old[1] + new[1], new[2]
+        data = old[1]
+        for entry in new[1]:
+            cls.apply(data, entry)
+            data["Journal_Seq"] = entry["seq"]
+        return "snapshot", data, old[2]
@@ -0,0 +1,387 @@
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+
+from Code.tile_map import EnhancedTileMap, TILE_COORDS, BLOCKING_TILES
+
+CHUNK_FORMAT = 1
+
+
+def write_chunked_map(map_lines, map_dir, chunk_size=32):
+    """Split map text lines into a chunk directory (meta.json + one text file per chunk)"""
+    map_dir = Path(map_dir)
+    map_dir.mkdir(parents=True, exist_ok=True)
+    width = max((len(line) for line in map_lines), default=0)
+    height = len(map_lines)
+
+    with open(map_dir / "meta.json", 'w') as f:
+        json.dump({"format": CHUNK_FORMAT, "width": width, "height": height, "chunk_size": chunk_size}, f, indent=4)
+
+    for cy in range((height + chunk_size - 1) // chunk_size):
+        for cx in range((width + chunk_size - 1) // chunk_size):
+            rows = [line[cx * chunk_size:(cx + 1) * chunk_size]
+                    for line in map_lines[cy * chunk_size:(cy + 1) * chunk_size]]
+            with open(map_dir / f"chunk_{cx}_{cy}.txt", 'w') as f:
+                f.write("\n".join(rows) + "\n")
+    print(f"Wrote chunked map {width}x{height} tiles to {map_dir}")
+
+
+class MapChunk:
+    """One square block of tiles - map characters, walkability and (once baked) its pre-rendered surface"""
+
+    def __init__(self, cx, cy, rows, walkable):
+        self.cx = cx
+        self.cy = cy
+        self.rows = rows  # chunk_size strings of map characters, padded with ' '
+        self.walkable = walkable  # chunk_size * chunk_size bytes, row-major, 1 = walkable
+        self.surface = None
+        self.baking = None  # Surface being baked a few rows per frame
+        self.baked_rows = 0
+
+
+class ChunkedTileMap(EnhancedTileMap):
+    """Tile map split into chunks that are loaded, baked and evicted around the camera
+
+    Small maps (map.txt) are split in memory; large worlds are read chunk by chunk from a directory
+    written by write_chunked_map(). A background thread reads the chunks coming into view and works out
+    their walkability; the main thread bakes their surfaces a few milliseconds per frame (pygame surfaces
+    stay on one thread). The rest are dropped least-recently-used first so memory stays bounded whatever
+    the world size. Tile edits are kept in an overlay and applied again whenever a chunk is reloaded.
+    """
+
+    def __init__(self, sprite_sheet_path="overworldSmall2.png", chunk_size=32, max_chunks=20, threaded=True,
+                 bake_budget=0.002):
+        super().__init__(sprite_sheet_path)
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks  # Loaded chunks kept before least-recently-used ones are dropped
+        self.bake_budget = bake_budget  # Seconds per frame spent baking chunks ahead of the view
+        self.prefetch_margin = chunk_size * self.tile_size // 2  # Pixels beyond the view to bake ahead
+        self.map_dir = None  # Chunk directory, or None when the chunks come from memory
+        self.map_lines = None  # In-memory map text
+
+        self.chunks = OrderedDict()  # (cx, cy) -> MapChunk, most recently used last
+        self.wanted = set()  # Chunks around the current view - never evicted
+        self.generation = 0  # Bumped per map so late results from the previous one are dropped
+        self.edits = {}  # (cx, cy) -> {(local row, local column): map character} set with set_tile()
+
+        # Background loading
+        self.threaded = threaded
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.requested = set()
+        self.worker = None
+
+        # Statistics
+        self.chunks_loaded = 0
+        self.chunks_baked = 0
+        self.sync_bakes = 0  # Chunks that had to be baked outside the frame budget (a possible hitch)
+        self.evictions = 0
+
+    # ----- Loading -----
+
+    def load_map_from_file(self, map_file_path):
+        """Open a chunk directory, or split a text map file into in-memory chunks. Returns the map itself"""
+        path = Path(map_file_path)
+        self.clear_chunks()
+        if path.is_dir() and (path / "meta.json").exists():
+            with open(path / "meta.json", 'r') as f:
+                meta = json.load(f)
+            self.map_dir = path
+            self.map_lines = None
+            self.map_width = meta["width"]
+            self.map_height = meta["height"]
+            self.chunk_size = meta.get("chunk_size", self.chunk_size)
+            self.prefetch_margin = self.chunk_size * self.tile_size // 2
+            print(f"Opened chunked map {self.map_width}x{self.map_height} tiles ({self.chunk_size}-tile chunks)")
+        else:
+            try:
+                with open(path, 'r') as f:
+                    map_lines = [line.rstrip('\n') for line in f.readlines()]
+            except FileNotFoundError:
+                print(f"Map file {map_file_path} not found, creating Zelda-style map")
+                self.create_zelda_style_map()
+                with open(path, 'r') as f:
+                    map_lines = [line.rstrip('\n') for line in f.readlines()]
+            self.map_dir = None
+            # Same clipping as the single-surface map: the first map_height lines, map_width characters each
+            self.map_lines = [line[:self.map_width] for line in map_lines[:self.map_height]]
+        return self
+
+    def read_chunk_rows(self, cx, cy):
+        """Read a chunk's map characters from disk or memory, padded to a full square"""
+        size = self.chunk_size
+        if self.map_dir is not None:
+            try:
+                with open(self.map_dir / f"chunk_{cx}_{cy}.txt", 'r') as f:
+                    rows = [line.rstrip('\n') for line in f.readlines()][:size]
+            except FileNotFoundError:
+                rows = []  # Sparse worlds - missing chunks are plain grass
+        else:
+            rows = [line[cx * size:(cx + 1) * size] for line in self.map_lines[cy * size:(cy + 1) * size]]
+        rows = [row[:size].ljust(size) for row in rows]
+        rows.extend([' ' * size] * (size - len(rows)))
+        return rows
+
+    def load_chunk(self, cx, cy):
+        """Build a chunk's data from the map (no surface, no edits) - safe to call from the worker thread"""
+        rows = self.read_chunk_rows(cx, cy)
+        size = self.chunk_size
+        walkable = bytearray(b'\x01' * (size * size))
+        for row_index, row in enumerate(rows):
+            for column, char in enumerate(row):
+                if char in BLOCKING_TILES:
+                    walkable[row_index * size + column] = 0
+        return MapChunk(cx, cy, rows, walkable)
+
+    def apply_edits(self, chunk):
+        """Put the tiles changed with set_tile() back into a freshly loaded chunk (main thread)"""
+        size = self.chunk_size
+        for (local_row, local_column), tile in self.edits.get((chunk.cx, chunk.cy), {}).items():
+            line = chunk.rows[local_row]
+            chunk.rows[local_row] = line[:local_column] + tile + line[local_column + 1:]
+            chunk.walkable[local_row * size + local_column] = 0 if tile in BLOCKING_TILES else 1
+        return chunk
+
+    def bake_chunk(self, chunk, deadline=None):
+        """Render a chunk's tiles (clipped to the map edge), stopping after a row once past deadline - main thread only
+
+        Returns True once the chunk has its surface; a bake that ran out of time carries on from the next row.
+        """
+        size = self.chunk_size
+        tile_size = self.tile_size
+        columns = min(size, self.map_width - chunk.cx * size)
+        rows = min(size, self.map_height - chunk.cy * size)
+        if chunk.baking is None:
+            chunk.baking = pygame.Surface((columns * tile_size, rows * tile_size))
+            chunk.baking.fill((34, 139, 34))
+            chunk.baked_rows = 0
+        surface = chunk.baking
+        while chunk.baked_rows < rows:
+            row = chunk.baked_rows
+            line = chunk.rows[row]
+            for column in range(columns):
+                surface.blit(self.tiles, (column * tile_size, row * tile_size),
+                             TILE_COORDS.get(line[column], (0, 0, 24, 24)))
+            chunk.baked_rows += 1
+            if deadline is not None and time.perf_counter() >= deadline and chunk.baked_rows < rows:
+                return False
+
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        chunk.surface = surface
+        chunk.baking = None
+        return True
+
+    def get_chunk(self, cx, cy):
+        """Get a chunk's data, loading it now if needed (walkability queries must always be answered)"""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.apply_edits(self.load_chunk(cx, cy))
+            self.chunks_loaded += 1
+            self.add_chunk(key, chunk)
+        else:
+            self.chunks.move_to_end(key)
+        return chunk
+
+    def add_chunk(self, key, chunk):
+        """Add a chunk to the cache and drop the least recently used ones over the limit"""
+        self.chunks[key] = chunk
+        if len(self.chunks) <= self.max_chunks:
+            return
+        for old_key in list(self.chunks):
+            if len(self.chunks) <= self.max_chunks:
+                break
+            if old_key in self.wanted or old_key == key:
+                continue
+            del self.chunks[old_key]
+            self.evictions += 1
+
+    def clear_chunks(self):
+        """Forget every loaded chunk and tile edit (new map)"""
+        self.generation += 1
+        self.chunks.clear()
+        self.edits.clear()
+        self.wanted.clear()
+        self.requested.clear()
+        while not self.requests.empty():
+            try:
+                self.requests.get_nowait()
+            except queue.Empty:
+                break
+
+    # ----- Background streaming -----
+
+    def start_worker(self):
+        """Start the loading thread on first use"""
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.worker_loop, name="chunk-loader", daemon=True)
+            self.worker.start()
+
+    def worker_loop(self):
+        """Read requested chunks (file I/O and walkability only) until close() sends None"""
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            generation, key = request
+            try:
+                self.results.put((generation, key, self.load_chunk(*key)))
+            except Exception as e:
+                print(f"Could not load map chunk {key}: {e}")
+                self.results.put((generation, key, None))
+
+    def request_chunk(self, key):
+        """Ask the worker for a chunk"""
+        if key in self.requested:
+            return
+        self.requested.add(key)
+        self.start_worker()
+        self.requests.put((self.generation, key))
+
+    def install_results(self):
+        """Move chunks read by the worker into the cache (unbaked, with the tile edits applied)"""
+        while True:
+            try:
+                generation, key, chunk = self.results.get_nowait()
+            except queue.Empty:
+                return
+            if generation != self.generation:
+                continue  # Read for a map that has since been replaced
+            self.requested.discard(key)
+            if chunk is None or key in self.chunks:
+                continue  # Failed, or loaded on demand in the meantime
+            self.add_chunk(key, self.apply_edits(chunk))
+
+    def bake_pending(self, keys):
+        """Bake loaded chunks that have no surface yet, until this frame's bake budget is used up"""
+        deadline = time.perf_counter() + self.bake_budget
+        for key in keys:
+            chunk = self.chunks.get(key)
+            if chunk is not None and chunk.surface is None:
+                if not self.bake_chunk(chunk, deadline):
+                    return
+                self.chunks_baked += 1
+                if time.perf_counter() >= deadline:
+                    return
+
+    def get_chunk_range(self, left, top, right, bottom):
+        """Get the chunk keys overlapping a world pixel rectangle (clipped to the map)"""
+        chunk_pixels = self.chunk_size * self.tile_size
+        last_cx = (self.map_width - 1) // self.chunk_size
+        last_cy = (self.map_height - 1) // self.chunk_size
+        first_x = max(0, int(left) // chunk_pixels)
+        first_y = max(0, int(top) // chunk_pixels)
+        last_x = min(last_cx, int(right - 1) // chunk_pixels)
+        last_y = min(last_cy, int(bottom - 1) // chunk_pixels)
+        return [(cx, cy) for cy in range(first_y, last_y + 1) for cx in range(first_x, last_x + 1)]
+
+    def update_streaming(self, left, top, right, bottom):
+        """Keep the chunks around a view loaded and baked ahead of time, returns the visible keys"""
+        self.install_results()
+        margin = self.prefetch_margin
+        visible = self.get_chunk_range(left, top, right, bottom)
+        nearby = self.get_chunk_range(left - margin, top - margin, right + margin, bottom + margin)
+        self.wanted = set(nearby)
+        if self.threaded:
+            for key in nearby:
+                if key not in self.chunks:
+                    self.request_chunk(key)
+        self.bake_pending(visible + nearby)
+        return visible
+
+    def close(self):
+        """Stop the loading thread"""
+        if self.worker is not None:
+            self.requests.put(None)
+            self.worker.join(timeout=1.0)
+            self.worker = None
+
+    # ----- EnhancedTileMap API -----
+
+    def set_tile(self, tile_map, row, column, tile):
+        """Change one tile (map character) and re-render just that cell of its chunk - kept if the chunk is dropped"""
+        if not (0 <= row < self.map_height and 0 <= column < self.map_width) or not isinstance(tile, str):
+            return False
+        size = self.chunk_size
+        key = (column // size, row // size)
+        local_row = row % size
+        local_column = column % size
+        self.edits.setdefault(key, {})[(local_row, local_column)] = tile[0]
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.get_chunk(*key)  # Loads with the edit applied
+            return True
+        self.chunks.move_to_end(key)
+        line = chunk.rows[local_row]
+        chunk.rows[local_row] = line[:local_column] + tile[0] + line[local_column + 1:]
+        chunk.walkable[local_row * size + local_column] = 0 if tile[0] in BLOCKING_TILES else 1
+        surface = chunk.surface
+        if surface is None and chunk.baking is not None and local_row < chunk.baked_rows:
+            surface = chunk.baking  # Row already baked - rows still to come pick the edit up from chunk.rows
+        if surface is not None:
+            surface.blit(self.tiles, (local_column * self.tile_size, local_row * self.tile_size),
+                         TILE_COORDS.get(tile[0], (0, 0, 24, 24)))
+        return True
+
+    def draw(self, tile_map, screen, offset_x=0, offset_y=0):
+        """Draw the chunks under the screen (offsets are the negated camera position)"""
+        left = -offset_x
+        top = -offset_y
+        chunk_pixels = self.chunk_size * self.tile_size
+        for key in self.update_streaming(left, top, left + screen.get_width(), top + screen.get_height()):
+            chunk = self.get_chunk(*key)
+            if chunk.surface is None:
+                # Not baked in time (first frame, teleport) - bake it now rather than leave a hole
+                self.bake_chunk(chunk)
+                self.sync_bakes += 1
+            screen.blit(chunk.surface, (key[0] * chunk_pixels + offset_x, key[1] * chunk_pixels + offset_y))
+
+    def is_position_walkable(self, world_x, world_y):
+        """Check if a position is walkable (for collision detection)"""
+        tile_x, tile_y = self.get_tile_at_position(int(world_x), int(world_y))
+
+        if tile_x is None or tile_y is None:
+            return False  # Outside the map boundary
+
+        size = self.chunk_size
+        chunk = self.get_chunk(tile_x // size, tile_y // size)
+        return chunk.walkable[(tile_y % size) * size + tile_x % size] == 1
+
+    def is_area_walkable(self, world_x, world_y, width, height):
+        """Check if every tile under a rectangle is walkable (may span several chunks)"""
+        world_width, world_height = self.get_world_pixel_size()
+        if world_x < 0 or world_y < 0 or world_x + width > world_width or world_y + height > world_height:
+            return False  # Map boundary
+
+        size = self.chunk_size
+        tile_size = self.tile_size
+        first_column = int(world_x) // tile_size
+        last_column = int(world_x + width - 1) // tile_size
+        for row in range(int(world_y) // tile_size, int(world_y + height - 1) // tile_size + 1):
+            cy, local_row = divmod(row, size)
+            column = first_column
+            while column <= last_column:
+                cx, local_column = divmod(column, size)
+                end = min(last_column, cx * size + size - 1)
+                start = local_row * size + local_column
+                if 0 in self.get_chunk(cx, cy).walkable[start:start + end - column + 1]:
+                    return False
+                column = end + 1
+        return True
+
+    def get_stats(self):
+        """Get chunk cache counters"""
+        return {
+            "loaded": len(self.chunks),
+            "baked": sum(1 for chunk in self.chunks.values() if chunk.surface is not None),
+            "chunks_loaded": self.chunks_loaded,
+            "chunks_baked": self.chunks_baked,
+            "sync_bakes": self.sync_bakes,
+            "evictions": self.evictions
+        }
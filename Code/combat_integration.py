@@ -172,7 +172,7 @@ class CombatIntegration:
 
         # If victory, deactivate the enemy in the world
         if result == "victory" and hasattr(self.game_manager, 'current_enemy_obj'):
-            self.game_manager.current_enemy_obj.active = False
+            self.game_manager.deactivate_object(self.game_manager.current_enemy_obj)
 
     def draw_combat(self, screen):
         """Draw combat interface"""
@@ -214,7 +214,8 @@ def integrate_combat_with_game_states(game_manager):
 
         if collision_type == "enemy" and collision_obj:
             # Start combat instead of simple collision
-            collision_obj.active = False  # Remove from world temporarily
+            # Remove from world temporarily
+            game_manager.deactivate_object(collision_obj)
             game_manager.current_enemy_obj = collision_obj
 
             # Start advanced combat
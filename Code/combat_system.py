@@ -2,6 +2,7 @@ import pygame
 import random
 import math
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks
 
 
 class CombatText:
@@ -625,7 +626,7 @@ class CombatManager:
                 if self.selected_action == 0:  # Attack
                     self.player_attack()
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 elif self.selected_action == 1:  # Cast Spell
                     # Get available spells
                     if self.character_manager.character_data:
@@ -649,7 +650,7 @@ class CombatManager:
                         return "run_success"
                     else:
                         self.player_turn = False
-                        self.action_delay = 30
+                        self.action_delay = seconds_to_ticks(2)
 
         elif self.combat_phase == "select_spell":
             aspect = self.character_manager.character_data.get("Aspect1", "fire_level_1")
@@ -664,7 +665,7 @@ class CombatManager:
                 spell = spells[self.selected_spell]
                 if self.player_cast_spell(spell):
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 self.combat_phase = "select_action"
             elif key == pygame.K_ESCAPE:
                 self.combat_phase = "select_action"
@@ -681,7 +682,7 @@ class CombatManager:
                 item_name = usable_items[self.selected_item]
                 if self.player_use_item(item_name):
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 self.combat_phase = "select_action"
             elif key == pygame.K_ESCAPE:
                 self.combat_phase = "select_action"
@@ -714,7 +715,7 @@ class CombatManager:
             self.enemy_turn()
             self.process_status_effects()
             self.player_turn = True
-            self.action_delay = 30
+            self.action_delay = seconds_to_ticks(2)
 
         return "continue"
 
@@ -7,6 +7,7 @@ import pygame
 import json
 import random
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks
 
 
 class CraftingMaterial:
@@ -221,8 +222,7 @@ class CraftingIntegration:
         pygame.draw.rect(screen, MENU_ACCENT, (panel_x, panel_y, panel_width, panel_height), 3)
 
         # Title
-        title_font = pygame.font.Font(None, 36)
-        title = title_font.render("Crafting Workshop", True, MENU_SELECTED)
+        title = render_text(get_font(36), "Crafting Workshop", MENU_SELECTED)
         title_rect = title.get_rect(center=(panel_x + panel_width // 2, panel_y + 30))
         screen.blit(title, title_rect)
 
@@ -230,15 +230,15 @@ class CraftingIntegration:
         available_recipes = self.crafting_manager.get_available_recipes()
 
         if not available_recipes:
-            no_recipes = pygame.font.Font(None, 24).render("No recipes available at your level", True, RED)
+            no_recipes = render_text(get_font(24), "No recipes available at your level", RED)
             no_recipes_rect = no_recipes.get_rect(center=(panel_x + panel_width // 2, panel_y + panel_height // 2))
             screen.blit(no_recipes, no_recipes_rect)
             return
 
         # Recipe list
         recipe_y_start = panel_y + 70
-        recipe_font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
+        recipe_font = get_font(20)
+        small_font = get_font(16)
 
         visible_recipes = available_recipes[self.crafting_manager.scroll_offset:self.crafting_manager.scroll_offset + self.crafting_manager.max_visible_recipes]
 
@@ -255,16 +255,16 @@ class CraftingIntegration:
             # Recipe name
             can_craft = self.crafting_manager.can_craft_recipe(recipe)
             name_color = GREEN if can_craft else RED
-            name_text = recipe_font.render(recipe.name, True, name_color)
+            name_text = render_text(recipe_font, recipe.name, name_color)
             screen.blit(name_text, (panel_x + 20, recipe_y))
 
             # Required materials
             materials_text = ", ".join([f"{name} ({qty})" for name, qty in recipe.materials_required.items()])
-            materials_surface = small_font.render(f"Requires: {materials_text}", True, MENU_TEXT)
+            materials_surface = render_text(small_font, f"Requires: {materials_text}", MENU_TEXT)
             screen.blit(materials_surface, (panel_x + 20, recipe_y + 20))
 
             # Level requirement
-            level_text = small_font.render(f"Level {recipe.level_required}", True, YELLOW)
+            level_text = render_text(small_font, f"Level {recipe.level_required}", YELLOW)
             screen.blit(level_text, (panel_x + panel_width - 100, recipe_y))
 
         # Instructions
@@ -275,9 +275,9 @@ class CraftingIntegration:
         ]
 
         instruction_y = panel_y + panel_height - 80
-        instruction_font = pygame.font.Font(None, 18)
+        instruction_font = get_font(18)
         for instruction in instructions:
-            instruction_surface = instruction_font.render(instruction, True, LIGHT_BLUE)
+            instruction_surface = render_text(instruction_font, instruction, LIGHT_BLUE)
             screen.blit(instruction_surface, (panel_x + 20, instruction_y))
             instruction_y += 20
 
@@ -285,7 +285,7 @@ class CraftingIntegration:
 class CraftingNode:
     """Harvestable crafting material node on the world map"""
 
-    def __init__(self, x, y, material_name, respawn_time=3000):
+    def __init__(self, x, y, material_name, timers, respawn_time=3000):
         import math
         self.x = x
         self.y = y
@@ -293,9 +293,9 @@ class CraftingNode:
         self.height = 25
         self.material_name = material_name
         self.active = True
-        self.respawn_timer = 0
         # self.max_respawn_time = respawn_time  # 5 minutes at 15 FPS
-        self.max_respawn_time = 3000  # 5 minutes at 15 FPS
+        self.max_respawn_time = seconds_to_ticks(200)
+        self.timers = timers  # TimerWheel that respawns the node
 
         # Material colors based on type
         material_colors = {
@@ -323,18 +323,15 @@ class CraftingNode:
         else:
             self.rarity = "Legendary"
 
-    def update(self):
-        """Update respawn timer"""
-        if not self.active and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.active = True
+    def respawn(self):
+        """Timer callback - make the node harvestable again"""
+        self.active = True
 
     def harvest(self):
         """Harvest the material and start respawn timer"""
         if self.active:
             self.active = False
-            self.respawn_timer = self.max_respawn_time
+            self.timers.schedule(self.max_respawn_time, self.respawn)
             return self.material_name
         return None
 
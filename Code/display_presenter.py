@@ -0,0 +1,125 @@
+import pygame
+
+
+class DirtyRectPresenter:
+    """Opt-in dirty-rectangle presentation for mostly static screens (menus, inventory, store...)
+
+    Static screens only change on input (handled as a full redraw) and in the animated areas they report
+    with watch()/mark_dirty(). A frame with nothing reported is neither drawn nor presented. With
+    diff_frames the frame is also compared with the last one (debug fallback for screens that forget).
+    """
+
+    def __init__(self, static_states=(), band_height=20, diff_frames=False):
+        self.enabled = False
+        self.static_states = set(static_states)
+        self.band_height = band_height  # Rows per horizontal band when diffing frames
+        self.diff_frames = diff_frames
+
+        self.pending_rects = []  # Rectangles reported by screens since the last present
+        self.watched = {}  # watch() name -> value drawn in its rect on the last frame
+        self.full_update = True
+        self.previous_frame = None
+        self.previous_state = None
+
+        # Statistics
+        self.frames_flipped = 0
+        self.frames_updated = 0
+        self.frames_skipped = 0
+
+    def set_enabled(self, enabled):
+        """Turn dirty-rect mode on or off"""
+        self.enabled = bool(enabled)
+        self.invalidate()
+
+    def is_active(self, state):
+        """Check if a state is presented with dirty rects"""
+        return self.enabled and state in self.static_states
+
+    def mark_dirty(self, rect):
+        """Report a changed screen rectangle to present on the next frame"""
+        self.pending_rects.append(pygame.Rect(rect))
+
+    def watch(self, name, value, rect):
+        """Report rect as changed when the value drawn there (animation frame, etc.) differs from the last frame"""
+        if self.watched.get(name) != value:
+            self.watched[name] = value
+            self.mark_dirty(rect)
+
+    def invalidate(self):
+        """Force the next frame to be drawn and presented in full (input, state change, window exposed, etc.)"""
+        self.full_update = True
+        self.previous_frame = None
+
+    def needs_redraw(self, state):
+        """Check if the frame has to be drawn - False means the screen still shows it"""
+        if not self.is_active(state):
+            return True
+        if state != self.previous_state:
+            self.invalidate()
+        return self.full_update or bool(self.pending_rects) or self.diff_frames
+
+    def present(self, screen, state=None):
+        """Present the frame: flip, update only the reported rectangles, or nothing at all"""
+        if not self.is_active(state):
+            pygame.display.flip()
+            self.frames_flipped += 1
+            self.previous_state = state
+            self.previous_frame = None
+            self.pending_rects = []
+            return
+
+        rects = self.pending_rects
+        frame = None
+        if self.diff_frames:
+            frame = screen.get_buffer().raw
+            if self.previous_frame is not None and len(frame) == len(self.previous_frame):
+                rects = rects + self.get_changed_rects(screen, frame)
+
+        if self.full_update or state != self.previous_state:
+            pygame.display.flip()
+            self.frames_flipped += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.frames_updated += 1
+        else:
+            # Nothing changed - skip presenting entirely
+            self.frames_skipped += 1
+
+        self.full_update = False
+        self.pending_rects = []
+        self.previous_frame = frame
+        self.previous_state = state
+
+    def skip(self, state):
+        """Count a frame that wasn't drawn because nothing changed"""
+        self.frames_skipped += 1
+        self.previous_state = state
+
+    def get_changed_rects(self, screen, frame):
+        """Compare the frame with the last one in horizontal bands, returns merged full-width rects"""
+        pitch = screen.get_pitch()
+        width, height = screen.get_size()
+        current = memoryview(frame)
+        previous = memoryview(self.previous_frame)
+
+        rects = []
+        for band_y in range(0, height, self.band_height):
+            band_rows = min(self.band_height, height - band_y)
+            start = band_y * pitch
+            end = start + band_rows * pitch
+            if current[start:end] != previous[start:end]:
+                # Extend the previous rect if the bands touch
+                if rects and rects[-1].bottom == band_y:
+                    rects[-1].height += band_rows
+                else:
+                    rects.append(pygame.Rect(0, band_y, width, band_rows))
+        return rects
+
+    def get_stats(self):
+        """Get presentation counters"""
+        return {
+            "enabled": self.enabled,
+            "flipped": self.frames_flipped,
+            "updated": self.frames_updated,
+            "skipped": self.frames_skipped
+        }
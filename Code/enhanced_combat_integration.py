@@ -9,6 +9,7 @@ import os
 from Code.enhanced_combat_system import EnhancedCombatManager, SoundManager
 from Code.game_data import CharacterManager
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks, ticks_to_seconds
 
 
 class GameState:
@@ -35,13 +36,37 @@ class EnhancedCombatIntegration:
         self.in_combat = False
         self.combat_result = None
 
-        # Combat entry/exit cooldowns
-        self.combat_entry_cooldown = 0
-        self.post_combat_invulnerability = 0
+        # Combat entry/exit cooldowns live on the game's timer wheel (saved with the character)
+        self.timers = game_manager.timer_wheel
 
         # World sound effects
         self.footstep_timer = 0
 
+    @property
+    def combat_entry_cooldown(self):
+        """Ticks before another combat can start"""
+        return self.timers.remaining("combat_entry_cooldown")
+
+    @combat_entry_cooldown.setter
+    def combat_entry_cooldown(self, ticks):
+        self.set_cooldown("combat_entry_cooldown", ticks)
+
+    @property
+    def post_combat_invulnerability(self):
+        """Ticks of enemy immunity left after a combat"""
+        return self.timers.remaining("post_combat_invulnerability")
+
+    @post_combat_invulnerability.setter
+    def post_combat_invulnerability(self, ticks):
+        self.set_cooldown("post_combat_invulnerability", ticks)
+
+    def set_cooldown(self, key, ticks):
+        """Start (or clear, with 0) a persistent cooldown timer"""
+        if ticks > 0:
+            self.timers.schedule(ticks, key=key, persist=True)
+        else:
+            self.timers.cancel(key)
+
     def start_combat(self, enemy_data):
         """Start combat with enhanced entry effects"""
         if self.combat_entry_cooldown > 0:
@@ -60,7 +85,7 @@ class EnhancedCombatIntegration:
         self.combat_result = None
 
         # Set cooldown to prevent immediate re-entry
-        self.combat_entry_cooldown = 60  # 4 seconds at 15 FPS
+        self.combat_entry_cooldown = seconds_to_ticks(4)
 
         return True
 
@@ -166,7 +191,7 @@ class EnhancedCombatIntegration:
         self.game_manager.character_manager.save_character()
 
         # Set post-combat invulnerability
-        self.post_combat_invulnerability = 120  # 8 seconds
+        self.post_combat_invulnerability = seconds_to_ticks(8)
 
     def handle_defeat(self):
         """Handle combat defeat with enhanced consequences"""
@@ -200,7 +225,7 @@ class EnhancedCombatIntegration:
         self.game_manager.character_manager.save_character()
 
         # Set longer invulnerability after defeat
-        self.post_combat_invulnerability = 180  # 12 seconds
+        self.post_combat_invulnerability = seconds_to_ticks(12)
 
     def give_random_item(self, enemy_level, enemy_name):
         """Give player a random item reward based on enemy difficulty"""
@@ -284,7 +309,7 @@ class EnhancedCombatIntegration:
 
         # If victory, deactivate the enemy in the world
         if result == "victory" and hasattr(self.game_manager, 'current_enemy_obj'):
-            self.game_manager.current_enemy_obj.active = False
+            self.game_manager.deactivate_object(self.game_manager.current_enemy_obj)
 
         # Play world music if available
         try:
@@ -294,14 +319,7 @@ class EnhancedCombatIntegration:
             print(f"Could not load world music: {e}")
 
     def update_world_sounds(self):
-        """Update world sound effects"""
-        # Update cooldowns
-        if self.combat_entry_cooldown > 0:
-            self.combat_entry_cooldown -= 1
-
-        if self.post_combat_invulnerability > 0:
-            self.post_combat_invulnerability -= 1
-
+        """Update world sound effects (cooldowns run on the timer wheel)"""
         # Footstep sounds when player moves
         if hasattr(self.game_manager, 'animated_player'):
             # Check if player is moving (simple detection based on animation state)
@@ -311,7 +329,7 @@ class EnhancedCombatIntegration:
                     self.footstep_timer -= 1
                     if self.footstep_timer <= 0:
                         self.sound_manager.play_sound("footstep", 0.3)  # Quiet footsteps
-                        self.footstep_timer = 20  # Reset timer
+                        self.footstep_timer = seconds_to_ticks(1.33)  # Reset timer
 
     def can_enter_combat(self):
         """Check if player can enter combat (not in cooldown)"""
@@ -369,7 +387,7 @@ class EnhancedCombatIntegration:
 
         # Show post-combat invulnerability status on world screen
         if not self.in_combat and self.post_combat_invulnerability > 0:
-            invuln_seconds = self.post_combat_invulnerability // 15  # Convert frames to seconds
+            invuln_seconds = ticks_to_seconds(self.post_combat_invulnerability)
             if invuln_seconds > 0:
                 invuln_text = font.render(f"Combat Immunity: {invuln_seconds}s", True, GREEN)
                 screen.blit(invuln_text, (10, screen.get_height() - 40))
@@ -386,7 +404,7 @@ class EnhancedCombatIntegration:
 
         # Show post-combat immunity
         if self.post_combat_invulnerability > 0:
-            immunity_seconds = self.post_combat_invulnerability // 15
+            immunity_seconds = ticks_to_seconds(self.post_combat_invulnerability)
             immunity_text = font.render(f"Combat Immunity: {immunity_seconds}s", True, GREEN)
             screen.blit(immunity_text, (10, screen.get_height() - 40))
 
@@ -444,7 +462,8 @@ def integrate_enhanced_combat_with_game_states(game_manager):
         if collision_type == "enemy" and collision_obj:
             # Check if we can enter combat (cooldowns, etc.)
             if combat_integration.can_enter_combat():
-                collision_obj.active = False  # Remove from world temporarily
+                # Remove from world temporarily
+                game_manager.deactivate_object(collision_obj)
                 game_manager.current_enemy_obj = collision_obj
 
                 # Start enhanced combat
@@ -519,13 +538,15 @@ def integrate_enhanced_combat_with_game_states(game_manager):
         if (hasattr(game_manager, 'combat_integration') and
                 game_manager.combat_integration.in_combat):
 
-            result = game_manager.combat_integration.update_combat()
+            with game_manager.profiler.section("combat"):
+                result = game_manager.combat_integration.update_combat()
             if result in ["victory", "defeat", "escaped"]:
                 game_manager.current_state = GameState.GAME_BOARD
 
         # Update world sounds and cooldowns
         if hasattr(game_manager, 'combat_integration'):
-            game_manager.combat_integration.update_world_sounds()
+            with game_manager.profiler.section("audio"):
+                game_manager.combat_integration.update_world_sounds()
 
     def enhanced_draw_game_board():
         """Enhanced game board drawing with combat HUD additions"""
@@ -5,6 +5,7 @@ import random
 import math
 import os
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks
 
 # Get the directory where your script is located
 script_dir = Path(__file__).parent
@@ -96,7 +97,7 @@ class CombatText:
         self.text = str(text)
         self.text_type = text_type
         self.timer = 60
-        self.font = pygame.font.Font(None, 28)
+        self.font = get_font(28)
         self.world_pos = world_pos
 
         # Set color based on text type
@@ -140,8 +141,7 @@ class CombatText:
             draw_x = self.x
             draw_y = self.y
 
-        text_surface = self.font.render(self.text, True, self.color)
-        text_surface.set_alpha(self.alpha)
+        text_surface = render_text(self.font, self.text, self.color, alpha=self.alpha)
         screen.blit(text_surface, (draw_x, draw_y))
 
 
@@ -489,15 +489,8 @@ class EnhancedCombatText(CombatText):
         draw_x += random.uniform(-self.shake, self.shake) if self.shake > 0 else 0
         draw_y += random.uniform(-self.shake, self.shake) + self.bounce if self.shake > 0 else draw_y + self.bounce
 
-        # Scale font based on text type
-        font_size = int(28 * self.scale)
-        if font_size != 28:
-            try:
-                font = pygame.font.Font(None, font_size)
-            except:
-                font = self.font
-        else:
-            font = self.font
+        # Scale font based on text type (shared registry, so no new Font per draw)
+        font = get_font(int(28 * self.scale))
 
         # Draw outline for special effects
         if self.outline:
@@ -505,21 +498,18 @@ class EnhancedCombatText(CombatText):
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
                         try:
-                            outline_surface = font.render(self.text, True, BLACK)
-                            outline_surface.set_alpha(self.alpha)
+                            outline_surface = render_text(font, self.text, BLACK, alpha=self.alpha)
                             screen.blit(outline_surface, (int(draw_x + dx), int(draw_y + dy)))
                         except:
                             pass
 
         # Draw main text
         try:
-            text_surface = font.render(self.text, True, self.color)
-            text_surface.set_alpha(self.alpha)
+            text_surface = render_text(font, self.text, self.color, alpha=self.alpha)
             screen.blit(text_surface, (int(draw_x), int(draw_y)))
         except:
             # Fallback if there are any rendering issues
-            fallback_surface = self.font.render(str(self.text), True, self.color)
-            fallback_surface.set_alpha(self.alpha)
+            fallback_surface = render_text(self.font, self.text, self.color, alpha=self.alpha)
             screen.blit(fallback_surface, (int(draw_x), int(draw_y)))
 
 
@@ -1006,7 +996,7 @@ class EnhancedCombatManager:
             self.enemy_turn()
             self.process_status_effects()
             self.player_turn = True
-            self.action_delay = 30
+            self.action_delay = seconds_to_ticks(2)
 
         return "continue"
 
@@ -1028,7 +1018,7 @@ class EnhancedCombatManager:
                 if self.selected_action == 0:  # Attack
                     self.player_attack()
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 elif self.selected_action == 1:  # Cast Spell
                     if self.character_manager.character_data:
                         aspect = self.character_manager.character_data.get("Aspect1", "fire_level_1")
@@ -1051,7 +1041,7 @@ class EnhancedCombatManager:
                         return "run_success"
                     else:
                         self.player_turn = False
-                        self.action_delay = 30
+                        self.action_delay = seconds_to_ticks(2)
 
         elif self.combat_phase == "select_spell":
             aspect = self.character_manager.character_data.get("Aspect1", "fire_level_1")
@@ -1068,7 +1058,7 @@ class EnhancedCombatManager:
                 spell = spells[self.selected_spell]
                 if self.player_cast_spell(spell):
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 self.combat_phase = "select_action"
             elif key == pygame.K_ESCAPE:
                 self.sound_manager.play_sound("menu_move")
@@ -1088,7 +1078,7 @@ class EnhancedCombatManager:
                 item_name = usable_items[self.selected_item]
                 if self.player_use_item(item_name):
                     self.player_turn = False
-                    self.action_delay = 30
+                    self.action_delay = seconds_to_ticks(2)
                 self.combat_phase = "select_action"
             elif key == pygame.K_ESCAPE:
                 self.sound_manager.play_sound("menu_move")
@@ -0,0 +1,243 @@
+from array import array
+from functools import partial
+
+from Code.timer_wheel import TimerWheel
+
+# Kind ids stored in the kind column
+KIND_IDS = {
+    "tree": 0, "rock": 1, "metal": 2, "stream": 3, "brush": 4,
+    "rest": 5, "enemy": 6, "treasure": 7, "shop": 8, "dungeon": 9
+}
+FREE_SLOT = -1
+
+
+class StoredField:
+    """Attribute kept in the object's EntityStore column - reads and writes go straight to the array
+
+    Objects that aren't in a store (being built, or kept by the level cache) hold their values in a
+    small dict instead, which is moved into the columns when they are added.
+    """
+
+    def __init__(self, column, flag=False):
+        self.column = column
+        self.flag = flag  # Stored as 0/1, read back as a bool
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            try:
+                return obj._values[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        value = store.columns[self.column][obj._index]
+        return value == 1 if self.flag else value
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj._values[self.name] = value
+        else:
+            store.set_value(self.column, obj._index, value)
+
+
+class StoredEntity:
+    """Base for world objects whose position, size and active flag are kept in an EntityStore
+
+    The objects are thin views: no __dict__, just their slot in the store and their own fixed fields.
+    """
+    __slots__ = ("_store", "_index", "_values")
+    stored_fields = {"x": "x", "y": "y", "width": "width", "height": "height", "active": "active"}
+
+    x = StoredField("x")
+    y = StoredField("y")
+    width = StoredField("width")
+    height = StoredField("height")
+    active = StoredField("active", flag=True)
+
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        obj._store = None
+        obj._index = -1
+        obj._values = {}  # Field values while the object isn't in a store
+        return obj
+
+
+class HarvestableEntity(StoredEntity):
+    """Stored world object with a harvest flag and respawn timer (trees, rocks, metal, streams, brushes)"""
+    __slots__ = ()
+    stored_fields = dict(StoredEntity.stored_fields, harvestable="harvestable", respawn_timer="timer")
+
+    harvestable = StoredField("harvestable", flag=True)
+    respawn_timer = StoredField("timer")
+
+
+class EntityStore:
+    """Struct-of-arrays storage for world objects - one contiguous array per field, objects are views on a slot"""
+
+    def __init__(self, timers=None):
+        self.kind = array('b')
+        self.x = array('i')
+        self.y = array('i')
+        self.width = array('h')
+        self.height = array('h')
+        self.active = array('b')
+        self.harvestable = array('b')
+        self.timer = array('i')  # Respawn time in logic ticks while waiting to respawn, else 0
+        self.columns = {"kind": self.kind, "x": self.x, "y": self.y, "width": self.width, "height": self.height,
+                        "active": self.active, "harvestable": self.harvestable, "timer": self.timer}
+
+        self.objects = []  # View object for each slot (None for freed slots)
+        self.timers = timers if timers is not None else TimerWheel()
+        self.respawns = {}  # slot -> pending respawn timer
+
+        # Per-kind counters kept up to date on every add/remove/activation change
+        self.kind_counts = [0] * len(KIND_IDS)
+        self.active_counts = [0] * len(KIND_IDS)
+        self.listeners = {}  # kind id -> callbacks(obj, active) for activation changes
+
+    def __len__(self):
+        return len(self.objects)
+
+    def clear(self):
+        """Detach every object and empty the store (level change)"""
+        for obj in self.objects:
+            if obj is not None:
+                self.detach(obj)
+        for column in self.columns.values():
+            del column[:]
+        self.objects = []
+        for timer in self.respawns.values():
+            self.timers.cancel(timer)
+        self.respawns.clear()
+        self.kind_counts = [0] * len(KIND_IDS)
+        self.active_counts = [0] * len(KIND_IDS)
+
+    def add(self, obj, kind):
+        """Move an object's fields into the store, returns its slot index"""
+        if obj._store is not None:
+            obj._store.remove(obj)
+
+        values = {name: getattr(obj, name) for name in obj.stored_fields}
+        index = len(self.objects)
+        kind_id = KIND_IDS[kind]
+        self.kind_counts[kind_id] += 1
+        if values["active"]:
+            self.active_counts[kind_id] += 1
+        self.kind.append(kind_id)
+        self.x.append(int(values["x"]))
+        self.y.append(int(values["y"]))
+        self.width.append(int(values["width"]))
+        self.height.append(int(values["height"]))
+        self.active.append(1 if values["active"] else 0)
+        self.harvestable.append(1 if values.get("harvestable", False) else 0)
+        self.timer.append(int(values.get("respawn_timer", 0)))
+        self.objects.append(obj)
+
+        # From here on the object reads and writes its slot
+        obj._store = self
+        obj._index = index
+        obj._values = None
+        self.schedule_respawn(index)
+        return index
+
+    def add_all(self, objects, kind):
+        """Add a list of objects of the same kind"""
+        for obj in objects:
+            self.add(obj, kind)
+
+    def detach(self, obj):
+        """Copy an object's fields out of its slot so it works without the store (level cache)"""
+        obj._values = {name: getattr(obj, name) for name in obj.stored_fields}
+        obj._store = None
+
+    def remove(self, obj):
+        """Take an object out of the store, leaving a free slot so other indices don't change"""
+        index = obj._index
+        if obj._store is not self:
+            return
+        self.detach(obj)
+        kind_id = self.kind[index]
+        self.kind_counts[kind_id] -= 1
+        if self.active[index]:
+            self.active_counts[kind_id] -= 1
+        self.objects[index] = None
+        self.kind[index] = FREE_SLOT
+        self.active[index] = 0
+        timer = self.respawns.pop(index, None)
+        if timer:
+            self.timers.cancel(timer)
+
+    def set_value(self, column, index, value):
+        """Write one field (called by the views)"""
+        if column in ("active", "harvestable"):
+            value = 1 if value else 0
+        else:
+            value = int(value)
+        if column == "active" and self.active[index] != value:
+            self.active[index] = value
+            self.on_active_changed(index, value)
+            return
+        self.columns[column][index] = value
+
+        if column == "timer" or column == "harvestable":
+            self.schedule_respawn(index)
+
+    def schedule_respawn(self, index):
+        """Start, restart or cancel a slot's respawn timer to match its harvest flag and respawn time"""
+        timer = self.respawns.pop(index, None)
+        if timer:
+            self.timers.cancel(timer)
+        if self.timer[index] > 0 and not self.harvestable[index]:
+            self.respawns[index] = self.timers.schedule(self.timer[index], partial(self.respawn, index))
+
+    def respawn(self, index):
+        """Timer callback - make a harvested object harvestable again"""
+        self.respawns.pop(index, None)
+        self.timer[index] = 0
+        self.harvestable[index] = 1
+
+    def get_respawn_remaining(self, obj):
+        """Get the logic ticks until a harvested object respawns (0 if it isn't waiting)"""
+        timer = self.respawns.get(obj._index) if obj._store is self else None
+        return self.timers.remaining(timer) if timer else 0
+
+    def subscribe(self, kind, callback):
+        """Call callback(obj, active) whenever an object of a kind is activated or deactivated"""
+        self.listeners.setdefault(KIND_IDS[kind], []).append(callback)
+
+    def unsubscribe(self, kind, callback):
+        """Stop calling a subscribed callback"""
+        callbacks = self.listeners.get(KIND_IDS[kind], [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def on_active_changed(self, index, active):
+        """Update the counters for an activation change and tell the subscribers"""
+        kind_id = self.kind[index]
+        self.active_counts[kind_id] += 1 if active else -1
+        for callback in self.listeners.get(kind_id, ()):
+            callback(self.objects[index], bool(active))
+
+    def count_active(self, kind):
+        """Count active objects of a kind"""
+        return self.active_counts[KIND_IDS[kind]]
+
+    def count(self, kind):
+        """Count stored objects of a kind"""
+        return self.kind_counts[KIND_IDS[kind]]
+
+    def cull(self, left, top, right, bottom):
+        """Get the active objects overlapping a world rectangle, in store order"""
+        objects = self.objects
+        visible = []
+        for index, (x, y, width, height, active) in enumerate(
+                zip(self.x, self.y, self.width, self.height, self.active)):
+            if active and x < right and x + width > left and y < bottom and y + height > top:
+                visible.append(objects[index])
+        return visible
@@ -0,0 +1,216 @@
+import json
+import time
+from collections import deque
+from pathlib import Path
+
+import pygame
+from Code.ui_components import *
+
+
+def load_debug_config(config_file=None):
+    """Read the profiler/debug switches from assets/game_config.json"""
+    if config_file is None:
+        config_file = Path(__file__).parent.parent / 'assets' / 'game_config.json'
+
+    flags = {
+        "show_fps": False,
+        "show_debug_info": False,
+        "show_object_counts": False,
+        "show_collision_boxes": False,
+        "diff_dirty_rects": False  # Debug fallback: find changed areas by comparing frames
+    }
+    try:
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+        settings = config.get("settings", {})
+        debug = config.get("debug", {})
+        flags["show_fps"] = bool(settings.get("show_fps", False))
+        flags["show_debug_info"] = bool(settings.get("show_debug_info", False))
+        flags["show_object_counts"] = bool(debug.get("show_object_counts", False))
+        flags["show_collision_boxes"] = bool(debug.get("show_collision_boxes", False))
+        flags["diff_dirty_rects"] = bool(debug.get("diff_dirty_rects", False))
+    except (OSError, ValueError) as e:
+        print(f"Could not read debug config: {e}")
+    return flags
+
+
+class _NullSection:
+    """Do-nothing section used while the profiler is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class _ProfileSection:
+    """Times one named phase and adds it to the current frame"""
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        current = self.profiler.current_frame
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame profiler with rolling percentiles and a debug overlay"""
+
+    def __init__(self, flags=None, history=120):
+        flags = flags or {}
+        self.config_flags = dict(flags)  # As read from game_config.json
+        self.show_fps = flags.get("show_fps", False)
+        self.show_debug_info = flags.get("show_debug_info", False)
+        self.show_object_counts = flags.get("show_object_counts", False)
+        self.show_collision_boxes = flags.get("show_collision_boxes", False)
+
+        self.history = history
+        self.frame_times = deque(maxlen=history)
+        self.phase_times = {}  # phase name -> deque of seconds per frame
+        self.sections = {}
+        self.current_frame = {}
+        self.frame_start = 0.0
+
+        self.font = get_font(18)
+
+    @property
+    def enabled(self):
+        """Timing only runs while something is being displayed"""
+        return self.show_fps or self.show_debug_info or self.show_object_counts
+
+    def toggle(self):
+        """Toggle the full debug overlay"""
+        self.show_debug_info = not self.show_debug_info
+        print(f"Profiler overlay: {'ON' if self.show_debug_info else 'OFF'}")
+
+    def section(self, name):
+        """Get a context manager that times a phase: `with profiler.section("tile_map"):`"""
+        if not self.enabled:
+            return NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = _ProfileSection(self, name)
+            self.sections[name] = section
+            self.phase_times[name] = deque(maxlen=self.history)
+        return section
+
+    def begin_frame(self):
+        """Mark the start of a render frame"""
+        if not self.enabled:
+            return
+        self.frame_start = time.perf_counter()
+        self.current_frame = {}
+
+    def end_frame(self):
+        """Mark the end of a render frame and push its timings into the rolling history"""
+        if not self.enabled or not self.frame_start:
+            return
+        self.frame_times.append(time.perf_counter() - self.frame_start)
+        for name, times in self.phase_times.items():
+            times.append(self.current_frame.get(name, 0.0))
+        self.frame_start = 0.0
+
+    @staticmethod
+    def percentile(values, percent):
+        """Get a percentile (0-100) of a list of values"""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def get_phase_stats(self):
+        """Get (name, avg ms, p95 ms, max ms) for every phase, slowest first"""
+        stats = []
+        for name, times in self.phase_times.items():
+            if not times:
+                continue
+            values = list(times)
+            stats.append((name,
+                          sum(values) / len(values) * 1000,
+                          self.percentile(values, 95) * 1000,
+                          max(values) * 1000))
+        stats.sort(key=lambda item: item[1], reverse=True)
+        return stats
+
+    def draw_overlay(self, screen, fps, object_counts=None):
+        """Draw FPS, frame-time graph, per-phase timings and object counts in the top-right corner"""
+        if not self.enabled:
+            return
+
+        lines = [(f"FPS: {fps:.1f}", WHITE)]
+        frame_values = list(self.frame_times)
+        if self.show_debug_info and frame_values:
+            lines.append((f"Frame ms  p50 {self.percentile(frame_values, 50) * 1000:.1f}"
+                          f"  p95 {self.percentile(frame_values, 95) * 1000:.1f}"
+                          f"  p99 {self.percentile(frame_values, 99) * 1000:.1f}", WHITE))
+            for name, average, p95, worst in self.get_phase_stats():
+                lines.append((f"{name:<14}{average:6.2f} {p95:6.2f} {worst:6.2f}", LIGHT_BLUE))
+        if self.show_object_counts and object_counts:
+            for name, count in object_counts.items():
+                lines.append((f"{name}: {count}", GRAY))
+
+        graph_height = 40 if self.show_debug_info else 0
+        panel_width = 260
+        panel_height = 10 + len(lines) * 16 + (graph_height + 6 if graph_height else 0)
+        panel_x = screen.get_width() - panel_width - 10
+
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        y = 5
+        for text, color in lines:
+            panel.blit(render_text(self.font, text, color), (6, y))
+            y += 16
+
+        if graph_height:
+            self.draw_frame_graph(panel, pygame.Rect(6, y + 2, panel_width - 12, graph_height), frame_values)
+
+        screen.blit(panel, (panel_x, 10))
+
+    def draw_frame_graph(self, surface, rect, frame_values):
+        """Draw a bar graph of recent frame times (scale: rect height = 100 ms)"""
+        pygame.draw.rect(surface, (40, 40, 40), rect)
+        bar_width = max(1, rect.width // self.history)
+        for i, value in enumerate(frame_values):
+            ms = value * 1000
+            bar_height = min(rect.height, int(rect.height * ms / 100))
+            color = GREEN if ms <= 1000 / 60 else (ORANGE if ms <= 1000 / 15 else RED)
+            pygame.draw.rect(surface, color, (rect.x + i * bar_width, rect.bottom - bar_height,
+                                              bar_width, bar_height))
+
+        # Reference lines for 60 FPS and the 15 Hz logic rate
+        for ms in (1000 / 60, 1000 / 15):
+            line_y = rect.bottom - int(rect.height * ms / 100)
+            pygame.draw.line(surface, WHITE, (rect.x, line_y), (rect.right - 1, line_y))
+
+    def draw_collision_boxes(self, screen, camera, objects):
+        """Outline the collision rectangles of world objects"""
+        if not self.show_collision_boxes:
+            return
+        for obj in objects:
+            if not getattr(obj, 'active', True):
+                continue
+            if hasattr(obj, 'get_rect'):
+                rect = obj.get_rect()
+            elif hasattr(obj, 'rect'):
+                rect = obj.rect
+            else:
+                continue
+            screen_x, screen_y = camera.world_to_screen(rect.x, rect.y)
+            blocking = hasattr(obj, 'is_blocking') and obj.is_blocking()
+            color = (255, 0, 255) if blocking else YELLOW
+            pygame.draw.rect(screen, color, (screen_x, screen_y, rect.width, rect.height), 1)
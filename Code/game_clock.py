@@ -0,0 +1,53 @@
+import pygame
+
+# Game logic always runs at this rate, whatever the render frame rate is
+LOGIC_HZ = 15
+LOGIC_DT = 1.0 / LOGIC_HZ
+
+
+def seconds_to_ticks(seconds):
+    """Convert a duration in seconds to logic ticks"""
+    return int(round(seconds * LOGIC_HZ))
+
+
+def ticks_to_seconds(ticks):
+    """Convert logic ticks to whole seconds (rounded down)"""
+    return max(0, int(ticks) // LOGIC_HZ)
+
+
+class FixedTimestepClock:
+    """Fixed-timestep simulation clock: logic runs in LOGIC_DT steps, rendering at its own rate"""
+
+    def __init__(self, render_fps=60, logic_hz=LOGIC_HZ, max_steps_per_frame=5):
+        self.clock = pygame.time.Clock()
+        self.render_fps = render_fps
+        self.logic_dt = 1.0 / logic_hz
+        self.max_steps_per_frame = max_steps_per_frame  # Avoid a spiral of death after a stall
+        self.accumulator = self.logic_dt  # Run one logic step on the very first frame
+        self.total_steps = 0
+
+    def set_render_fps(self, render_fps):
+        """Change the render frame rate cap (0 = uncapped)"""
+        self.render_fps = max(0, int(render_fps))
+
+    def tick(self):
+        """Wait for the next render frame, returns how many logic steps to run before drawing"""
+        elapsed = self.clock.tick(self.render_fps) / 1000.0
+        self.accumulator += elapsed
+
+        steps = int(self.accumulator / self.logic_dt)
+        if steps > self.max_steps_per_frame:
+            # Too far behind - drop the extra time instead of trying to catch up
+            steps = self.max_steps_per_frame
+            self.accumulator = steps * self.logic_dt
+        self.accumulator -= steps * self.logic_dt
+        self.total_steps += steps
+        return steps
+
+    def get_alpha(self):
+        """How far rendering is between the last two logic steps (0.0 - 1.0)"""
+        return min(1.0, self.accumulator / self.logic_dt)
+
+    def get_fps(self):
+        """Get the measured render frame rate"""
+        return self.clock.get_fps()
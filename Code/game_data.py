@@ -1,8 +1,12 @@
 import json
 import os
 import random
+from functools import partial
 from pathlib import Path
 
+from Code.save_storage import JsonFileStorage, get_roster_entry
+from Code.character_journal import CharacterJournal
+
 
 def roll_dice(num, sides):
     """Roll dice for random events"""
@@ -12,9 +16,15 @@ def roll_dice(num, sides):
 class CharacterManager:
     """Manages character data, stats, and progression"""
 
-    def __init__(self):
+    def __init__(self, timers=None, save_queue=None, storage=None):
         self.character_data = {}
         self.character_file = ""
+        self.timers = timers  # TimerWheel whose cooldowns are saved with the character
+        self.save_queue = save_queue  # SaveQueue for write-behind saves (None = write straight away)
+        self.storage = storage if storage is not None else JsonFileStorage()  # JSON files or SQLite
+        self.level_manager = None  # Its progression is saved together with the character
+        self.journal = CharacterJournal()  # Saves write what changed; a full snapshot every so often
+        self.autosave = None  # AutosaveScheduler - saves are batched to its interval when set
 
     def create_sample_character(self):
         """Create a sample character for testing"""
@@ -55,22 +65,65 @@ class CharacterManager:
 
     def load_character(self, char_file):
         """Load character from file"""
+        if self.autosave is not None:
+            self.autosave.flush()  # Unsaved changes of the current character first
+        if self.save_queue is not None:
+            self.save_queue.flush(wait=True)  # The file may still have a save on its way
         try:
-            with open(char_file, 'r') as f:
-                self.character_data = json.load(f)
-                self.character_file = char_file
-                print(f"Successfully loaded character: {self.character_data.get('Name', 'Unknown')}")
-                return True
+            data = self.storage.load_character(char_file)
+            if data is None:
+                raise FileNotFoundError(f"No character {char_file}")
+            self.journal = CharacterJournal()
+            self.character_data = self.journal.load(data, self.storage.load_journal(char_file))
+            self.character_file = char_file
+            if self.timers is not None:
+                self.timers.load_state(self.character_data.get("Pending_Timers", {}))
+            print(f"Successfully loaded character: {self.character_data.get('Name', 'Unknown')}")
+            return True
         except Exception as e:
             print(f"Failed to load character from {char_file}: {e}")
             return False
 
     def save_character(self):
-        """Save current character to file"""
+        """Save current character (at the next autosave when there is an autosave scheduler)"""
+        if self.autosave is not None:
+            if not (self.character_file and self.character_data):
+                return False
+            self.autosave.mark_dirty("character")
+            return True
+        return self.save_character_now()
+
+    def save_character_now(self):
+        """Save current character (queued when there is a save queue, so the game never waits on disk)
+
+        Only the changes since the last save are written, as journal entries; every so often (and for
+        data that isn't tracked yet) the whole character is written with its progression instead.
+        """
         if self.character_file and self.character_data:
             try:
-                with open(self.character_file, 'w') as f:
-                    json.dump(self.character_data, f, indent=4)
+                if self.timers is not None:
+                    self.character_data["Pending_Timers"] = self.timers.save_state()
+
+                tracked = self.journal.track(self.character_data)
+                if tracked is self.character_data:
+                    entries = self.journal.collect(tracked)
+                else:
+                    entries = None  # New character data - start a fresh journal with a snapshot
+                    self.journal = CharacterJournal()
+                self.character_data = tracked
+                if entries is None or self.journal.needs_snapshot():
+                    progression = self.level_manager.get_progression_record() if self.level_manager else None
+                    record = ("snapshot", self.journal.snapshot(tracked), progression)
+                elif entries:
+                    record = ("journal", entries, get_roster_entry(tracked))
+                else:
+                    return True  # Nothing changed
+
+                if self.save_queue is not None:
+                    self.save_queue.save(self.character_file, record, partial(self.write_save, self.character_file),
+                                         CharacterJournal.merge)
+                else:
+                    self.write_save(self.character_file, record)
                 print(f"Character saved: {self.character_data.get('Name', 'Unknown')}")
                 return True
             except Exception as e:
@@ -78,21 +131,22 @@ class CharacterManager:
                 return False
         return False
 
+    def write_save(self, char_file, record):
+        """Write a save record: ("journal", entries, roster summary) or ("snapshot", data, progression)"""
+        if record[0] == "journal":
+            self.storage.append_journal(char_file, record[1], record[2])
+        else:
+            self.storage.save_character(char_file, record[1], record[2])
+
     def get_character_list(self):
         """Get list of available characters"""
-        # chars_dir = "../Characters"
-        # Get the directory where your script is located
-        script_dir = Path(__file__).parent
-
-        # Build paths
-        chars_dir = script_dir.parent / 'Characters'
-        # demon_file = enemies_dir / 'demon_level_1.json'
+        return self.storage.list_characters() + ["New Character"]
 
-        if os.path.exists(chars_dir):
-            chars = [f for f in os.listdir(chars_dir) if f.endswith('.json')]
-            chars.append("New Character")
-            return chars
-        return ["New Character"]
+    def get_roster(self):
+        """Get the saved characters' preview entries (file, name, race, class, level, credits, last_played)"""
+        if self.save_queue is not None:
+            self.save_queue.flush(wait=True)  # Include saves still on their way
+        return self.storage.get_roster()
 
     def get_player_level(self):
         """Calculate player level from XP"""
@@ -715,6 +769,7 @@ def create_sample_files():
                 "max_level": 50,
                 "xp_per_level": 150,
                 "save_interval": 30,
+                "save_backend": "json",
                 "difficulty_scaling": 1.2
             },
             "balance": {
@@ -6,6 +6,7 @@ Handles inventory operations, item usage, equipment bonuses, and store transacti
 import pygame
 import random
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks
 
 
 class InventoryManager:
@@ -694,7 +695,7 @@ class StoreIntegration:
             self.game_manager.camera.update(self.game_manager.animated_player.x, self.game_manager.animated_player.y)
 
             # Set exit cooldown
-            self.exit_cooldown = 30
+            self.exit_cooldown = seconds_to_ticks(2)
             return "exit_store"
         elif isinstance(result, dict):
             if result["result"] == "purchased":
@@ -0,0 +1,224 @@
+import json
+import os
+from collections import OrderedDict
+
+from Code.ui_components import Tree, Rock, Metal, Stream, Brush, Enemy, Treasure, Shop, Dungeon
+from Code.rest_system import EnhancedRestArea
+
+# Extra constructor/state attributes saved per kind (position, active and harvest state are always saved)
+OBJECT_FIELDS = {
+    "tree": ("tree_type",),
+    "rock": ("rock_type",),
+    "metal": ("metal_type",),
+    "stream": ("flow_offset",),
+    "brush": (),
+    "enemy": ("enemy_data",),
+    "treasure": ("value",),
+    "shop": (),
+    "rest": (),
+    "dungeon": ()
+}
+
+
+def save_object(kind, obj):
+    """Get a JSON record for a world object"""
+    record = {"x": obj.x, "y": obj.y, "active": bool(obj.active)}
+    if hasattr(obj, 'harvestable'):
+        record["harvestable"] = bool(obj.harvestable)
+    for name in OBJECT_FIELDS[kind]:
+        record[name] = getattr(obj, name)
+    return record
+
+
+def load_object(kind, record, rest_manager):
+    """Rebuild a world object from its JSON record"""
+    x, y = record["x"], record["y"]
+    if kind == "tree":
+        obj = Tree(x, y, record["tree_type"])
+    elif kind == "rock":
+        obj = Rock(x, y, record["rock_type"])
+    elif kind == "metal":
+        obj = Metal(x, y, record["metal_type"])
+    elif kind == "stream":
+        obj = Stream(x, y)
+        obj.flow_offset = record["flow_offset"]
+    elif kind == "brush":
+        obj = Brush(x, y)
+    elif kind == "enemy":
+        obj = Enemy(x, y, record["enemy_data"])
+    elif kind == "treasure":
+        obj = Treasure(x, y, record["value"])
+    elif kind == "shop":
+        obj = Shop(x, y)
+    elif kind == "rest":
+        obj = EnhancedRestArea(x, y, rest_manager)
+    else:
+        obj = Dungeon(x, y)
+    obj.active = record["active"]
+    if "harvestable" in record:
+        obj.harvestable = record["harvestable"]
+    return obj
+
+
+class LevelInstance:
+    """World objects of one visited level, with the respawn timers they had when the player left"""
+
+    def __init__(self, content, objects, respawns, tick):
+        self.content = content  # generate_level_content() result
+        self.objects = objects  # kind -> list of objects
+        self.respawns = respawns  # (object, logic ticks left) for harvested objects waiting to respawn
+        self.tick = tick  # Timer wheel tick when the level was left
+
+    def to_dict(self):
+        """Get the instance as JSON data"""
+        respawns = {id(obj): ticks for obj, ticks in self.respawns}
+        objects = {}
+        for kind, found in self.objects.items():
+            records = []
+            for obj in found:
+                record = save_object(kind, obj)
+                if id(obj) in respawns:
+                    record["respawn"] = respawns[id(obj)]
+                records.append(record)
+            objects[kind] = records
+        return {"content": self.content, "objects": objects, "tick": self.tick}
+
+    @classmethod
+    def from_dict(cls, data, rest_manager):
+        """Rebuild an instance from JSON data"""
+        objects = {}
+        respawns = []
+        for kind, records in data["objects"].items():
+            objects[kind] = []
+            for record in records:
+                obj = load_object(kind, record, rest_manager)
+                objects[kind].append(obj)
+                if record.get("respawn"):
+                    respawns.append((obj, record["respawn"]))
+        return cls(data["content"], objects, respawns, data["tick"])
+
+
+class LevelInstanceCache:
+    """LRU cache of visited levels keyed by level key ("1-2") - going back to a recent level restores it as left
+
+    The last `capacity` levels stay in memory as live objects. With a cache_dir, levels pushed out are
+    written there as JSON and rebuilt when visited again; the directory only lives for one session.
+    """
+
+    def __init__(self, rest_manager, capacity=4, cache_dir=None):
+        self.rest_manager = rest_manager  # Rest areas rebuilt from disk need it
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        self.instances = OrderedDict()  # level key -> LevelInstance, least recently used first
+
+        # Statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.clear()
+
+    def get_path(self, key):
+        """Get the disk file for a level key"""
+        return os.path.join(self.cache_dir, f"level_{key}.json")
+
+    def put(self, key, instance):
+        """Store a level instance, pushing the least recently used ones out past capacity"""
+        self.instances[key] = instance
+        self.instances.move_to_end(key)
+        while len(self.instances) > self.capacity:
+            old_key, old_instance = self.instances.popitem(last=False)
+            self.evictions += 1
+            if self.cache_dir:
+                self.write(old_key, old_instance)
+
+    def get(self, key):
+        """Take a level's instance out of the cache (memory first, then disk), or None if it isn't cached"""
+        instance = self.instances.pop(key, None)
+        if instance is not None:
+            self.hits += 1
+            return instance
+
+        instance = self.read(key)
+        if instance is not None:
+            self.disk_hits += 1
+            return instance
+
+        self.misses += 1
+        return None
+
+    def discard(self, key):
+        """Forget a level (it is generated fresh next time)"""
+        self.instances.pop(key, None)
+        if self.cache_dir and os.path.exists(self.get_path(key)):
+            os.remove(self.get_path(key))
+
+    def write(self, key, instance):
+        """Write an evicted instance to disk"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.get_path(key), 'w') as f:
+                json.dump(instance.to_dict(), f)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not write level {key} to the level cache: {e}")
+
+    def read(self, key):
+        """Read (and remove) an instance written to disk, or None"""
+        if not self.cache_dir:
+            return None
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            return LevelInstance.from_dict(data, self.rest_manager)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Could not read level {key} from the level cache: {e}")
+            return None
+        finally:
+            os.remove(path)
+
+    def to_dict(self):
+        """Get every cached level as JSON data (level key -> instance data), least recently used first"""
+        levels = {}
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)]
+            for path in sorted(paths, key=os.path.getmtime):  # Evicted least recently used first
+                name = os.path.basename(path)
+                if name.startswith("level_") and name.endswith(".json"):
+                    try:
+                        with open(path, 'r') as f:
+                            levels[name[len("level_"):-len(".json")]] = json.load(f)
+                    except (OSError, ValueError) as e:
+                        print(f"Could not read {name} from the level cache: {e}")
+        for key, instance in self.instances.items():
+            levels[key] = instance.to_dict()
+        return levels
+
+    def load_dict(self, levels, tick):
+        """Put saved levels back in the cache, their respawn timers counting from timer wheel tick"""
+        for key, data in levels.items():
+            try:
+                self.put(key, LevelInstance.from_dict(dict(data, tick=tick), self.rest_manager))
+            except (KeyError, ValueError, TypeError) as e:
+                print(f"Could not restore level {key}: {e}")
+
+    def clear(self):
+        """Forget every level (new session or character)"""
+        self.instances.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.startswith("level_") and name.endswith(".json"):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def get_stats(self):
+        """Get cache counters"""
+        return {
+            "in_memory": len(self.instances),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -2,7 +2,12 @@ import pygame
 import json
 import os
 import random
+from functools import partial
+from pathlib import Path
 from Code.ui_components import *
+from Code.terrain_generator import TerrainGenerator, GENERATOR_VERSION
+from Code.chunked_tile_map import write_chunked_map
+from Code.save_storage import JsonFileStorage
 
 
 class WorldLevel:
@@ -39,7 +44,10 @@ class WorldLevel:
 class LevelManager:
     """Manages world levels and progression"""
 
-    def __init__(self, character_name=None):
+    def __init__(self, character_name=None, storage=None, save_queue=None):
+        self.storage = storage if storage is not None else JsonFileStorage()  # JSON files or SQLite
+        self.save_queue = save_queue  # SaveQueue for write-behind saves (None = write straight away)
+        self.autosave = None  # AutosaveScheduler - saves are batched to its interval when set
         self.current_world = 1
         self.current_level = 1
         self.levels = {}
@@ -60,6 +68,8 @@ class LevelManager:
     def set_character(self, character_name):
         """Update character name and reload progression for character-specific progress"""
         if character_name != self.character_name:
+            if self.autosave is not None:
+                self.autosave.flush()  # The last character's progression first
             self.character_name = character_name
             if character_name:
                 self.progression_file = f"SaveProgression/progression_{character_name.replace(' ', '_').replace('.json', '')}.json"
@@ -126,12 +136,11 @@ class LevelManager:
     def load_progression(self):
         """Load player progression from file"""
         try:
-            if os.path.exists(self.progression_file):
-                with open(self.progression_file, 'r') as f:
-                    data = json.load(f)
-                    self.current_world = data.get("current_world", 1)
-                    self.current_level = data.get("current_level", 1)
-                    self.unlocked_levels = set(data.get("unlocked_levels", ["1-1"]))
+            data = self.storage.load_progression(self.progression_file)
+            if data is not None:
+                self.current_world = data.get("current_world", 1)
+                self.current_level = data.get("current_level", 1)
+                self.unlocked_levels = set(data.get("unlocked_levels", ["1-1"]))
         except Exception as e:
             print(f"Error loading progression: {e}")
             # Reset to defaults
@@ -140,18 +149,32 @@ class LevelManager:
             self.unlocked_levels = {"1-1"}
 
     def save_progression(self):
-        """Save player progression to file"""
+        """Save player progression (at the next autosave when there is an autosave scheduler)"""
+        if self.autosave is not None:
+            self.autosave.mark_dirty("progression")
+        else:
+            self.save_progression_now()
+
+    def save_progression_now(self):
+        """Save player progression to file (queued when there is a save queue)"""
         try:
-            data = {
-                "current_world": self.current_world,
-                "current_level": self.current_level,
-                "unlocked_levels": list(self.unlocked_levels)
-            }
-            with open(self.progression_file, 'w') as f:
-                json.dump(data, f, indent=4)
+            progression_file, data = self.get_progression_record()
+            if self.save_queue is not None:
+                self.save_queue.save(progression_file, data, partial(self.storage.save_progression, progression_file))
+            else:
+                self.storage.save_progression(progression_file, data)
         except Exception as e:
             print(f"Error saving progression: {e}")
 
+    def get_progression_record(self):
+        """Get (progression file, progression data) - saved along with the character"""
+        data = {
+            "current_world": self.current_world,
+            "current_level": self.current_level,
+            "unlocked_levels": sorted(self.unlocked_levels)
+        }
+        return self.progression_file, data
+
     def get_current_level_key(self):
         """Get current level as key string"""
         return f"{self.current_world}-{self.current_level}"
@@ -231,8 +254,36 @@ class LevelManager:
 class WorldLevelGenerator:
     """Generates world content based on level properties"""
 
-    def __init__(self, level_manager):
+    def __init__(self, level_manager, map_seed=0, map_cache_dir=None):
         self.level_manager = level_manager
+        self.map_seed = map_seed  # Same seed, same maps for every level
+        if map_cache_dir is None:
+            map_cache_dir = Path(__file__).parent.parent / 'assets' / 'generated_maps'
+        self.map_cache_dir = Path(map_cache_dir)
+
+    def get_level_map(self, world_level, width, height, clear_zones):
+        """Get a level's generated tile map, returns (chunked map directory, suggested object points)
+
+        Maps are cached on disk by level, seed, size and generator version, so each one is generated once.
+        """
+        level_key = f"{world_level.world}-{world_level.level}"
+        map_dir = self.map_cache_dir / f"{level_key}_seed{self.map_seed}_{width}x{height}_v{GENERATOR_VERSION}"
+        points_file = map_dir / "points.json"
+
+        if points_file.exists():
+            try:
+                with open(points_file, 'r') as f:
+                    points = json.load(f)
+                return map_dir, {name: [tuple(point) for point in found] for name, found in points.items()}
+            except (OSError, ValueError) as e:
+                print(f"Could not read cached map {map_dir}: {e}")
+
+        generator = TerrainGenerator(self._get_map_theme(world_level), f"{level_key}:{self.map_seed}")
+        lines, points = generator.generate(width, height, clear_zones)
+        write_chunked_map(lines, map_dir)
+        with open(points_file, 'w') as f:  # Written last - marks the cache entry as complete
+            json.dump(points, f)
+        return map_dir, points
 
     def generate_level_content(self, world_level):
         """Generate specific content for a world level"""
@@ -401,6 +452,14 @@ class LevelSelectScreen:
         """Update animations"""
         self.animation_timer += 1
 
+    def get_selection_pulse(self):
+        """Get how far the selected level is grown on this animation frame"""
+        return int(10 * abs(math.sin(self.animation_timer * 0.15)))
+
+    def get_level_rect(self, index):
+        """Get the background rectangle of a level in the list"""
+        return pygame.Rect(50, 180 + index * 45, self.screen_width - 100, 40)
+
     def draw(self, screen):
         """Draw level selection screen"""
         screen.fill(MENU_BG)
@@ -479,7 +538,7 @@ class LevelSelectScreen:
             y_pos = start_y + i * level_height
 
             # Level background
-            level_rect = pygame.Rect(50, y_pos, self.screen_width - 100, level_height - 5)
+            level_rect = self.get_level_rect(i)
 
             is_selected = (i + 1) == self.selected_level
             is_current = (level.world == self.level_manager.current_world and
@@ -487,7 +546,7 @@ class LevelSelectScreen:
 
             if is_selected:
                 # Animated selection
-                pulse = int(10 * abs(math.sin(self.animation_timer * 0.15)))
+                pulse = self.get_selection_pulse()
                 expanded_rect = level_rect.inflate(pulse, pulse // 2)
                 color = MENU_HIGHLIGHT
                 border_color = MENU_SELECTED
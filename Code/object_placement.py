@@ -0,0 +1,159 @@
+import math
+import random
+
+import pygame
+
+
+class ObjectPlacer:
+    """Grid-accelerated Poisson-disk placement for level objects (enemies, treasures, trees, map objects)"""
+
+    def __init__(self, seed=None, cell_size=32, attempts_per_object=30, candidates_per_point=30):
+        # A fixed seed gives the same layout every time; without one, follow the global random state
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.cell_size = cell_size
+        self.attempts_per_object = attempts_per_object  # Random darts per object before filling
+        self.candidates_per_point = candidates_per_point  # Bridson's k
+
+        self.grid = {}  # (cell x, cell y) -> list of (x, y, category)
+        self.cell_offsets = {}  # reach -> neighbour cell offsets, nearest first
+        self.points = []
+        self.exclusion_rects = []
+        self.exclusion_circles = []
+        self.is_area_walkable = None  # Optional terrain check: is_area_walkable(x, y, width, height)
+        self.footprint = (24, 24)
+
+    def add_exclusion_rect(self, rect):
+        """Keep every object's position out of a rectangle (rest area, shop...)"""
+        self.exclusion_rects.append(pygame.Rect(rect))
+
+    def add_exclusion_circle(self, x, y, radius):
+        """Keep every object's position more than radius away from a point (player start...)"""
+        self.exclusion_circles.append((x, y, radius))
+
+    def set_walkability(self, is_area_walkable, footprint=(24, 24)):
+        """Only place objects where a footprint-sized area at the position is walkable terrain"""
+        self.is_area_walkable = is_area_walkable
+        self.footprint = footprint
+
+    def add_point(self, x, y, category):
+        """Record an already placed object so later placements keep their distance"""
+        point = (x, y, category)
+        self.points.append(point)
+        self.grid.setdefault((int(x) // self.cell_size, int(y) // self.cell_size), []).append(point)
+
+    def add_points(self, positions, category):
+        """Record several already placed objects"""
+        for x, y in positions:
+            self.add_point(x, y, category)
+
+    def is_excluded(self, x, y):
+        """Check if a position is inside an exclusion zone"""
+        for rect in self.exclusion_rects:
+            if rect.collidepoint(x, y):
+                return True
+        for zone_x, zone_y, radius in self.exclusion_circles:
+            if (x - zone_x) ** 2 + (y - zone_y) ** 2 <= radius * radius:
+                return True
+        return False
+
+    def get_cell_offsets(self, reach):
+        """Get the neighbour cell offsets within reach, nearest first so rejections are found early"""
+        offsets = self.cell_offsets.get(reach)
+        if offsets is None:
+            offsets = [(dx, dy) for dx in range(-reach, reach + 1) for dy in range(-reach, reach + 1)]
+            offsets.sort(key=lambda offset: offset[0] * offset[0] + offset[1] * offset[1])
+            self.cell_offsets[reach] = offsets
+        return offsets
+
+    def is_free(self, x, y, min_distance, avoid=None):
+        """Check a position against exclusion zones, nearby points (only `avoid` categories if given) and terrain"""
+        if self.is_excluded(x, y):
+            return False
+
+        size = self.cell_size
+        cell_x = int(x) // size
+        cell_y = int(y) // size
+        min_distance_sq = min_distance * min_distance
+        grid = self.grid
+
+        for dx, dy in self.get_cell_offsets(int(math.ceil(min_distance / size))):
+            bucket = grid.get((cell_x + dx, cell_y + dy))
+            if not bucket:
+                continue
+            for px, py, category in bucket:
+                if avoid is not None and category not in avoid:
+                    continue
+                if (px - x) ** 2 + (py - y) ** 2 < min_distance_sq:
+                    return False
+
+        # Terrain last - nearby objects reject most candidates more cheaply
+        if self.is_area_walkable and not self.is_area_walkable(x, y, *self.footprint):
+            return False
+        return True
+
+    def place(self, category, count, min_distance, x_range, y_range, avoid=None, candidates=None):
+        """Place up to count objects at least min_distance apart, returns their (x, y) positions
+
+        candidates are suggested positions (e.g. from the map generator) tried before random ones.
+        """
+        positions = []
+
+        for x, y in candidates or ():
+            if len(positions) >= count:
+                break
+            if x_range[0] <= x <= x_range[1] and y_range[0] <= y <= y_range[1] and \
+                    self.is_free(x, y, min_distance, avoid):
+                self.add_point(x, y, category)
+                positions.append((x, y))
+
+        # Random darts first - each check only looks at nearby grid cells
+        attempts = 0
+        max_attempts = count * self.attempts_per_object
+        while len(positions) < count and attempts < max_attempts:
+            attempts += 1
+            x = self.rng.randint(*x_range)
+            y = self.rng.randint(*y_range)
+            if self.is_free(x, y, min_distance, avoid):
+                self.add_point(x, y, category)
+                positions.append((x, y))
+
+        # Crowded level - sweep the remaining free space instead of giving up
+        if len(positions) < count:
+            positions.extend(self.fill(category, count - len(positions), min_distance, x_range, y_range, avoid))
+
+        if len(positions) < count:
+            print(f"Placement: only {len(positions)} of {count} {category} fit")
+        return positions
+
+    def fill(self, category, count, min_distance, x_range, y_range, avoid=None):
+        """Bridson's Poisson-disk sampling outwards from the existing points until count objects are placed"""
+        positions = []
+        active = [(x, y) for x, y, _ in self.points
+                  if x_range[0] <= x <= x_range[1] and y_range[0] <= y <= y_range[1]]
+        if not active:
+            active.append(((x_range[0] + x_range[1]) // 2, (y_range[0] + y_range[1]) // 2))
+
+        while active and len(positions) < count:
+            index = self.rng.randrange(len(active))
+            origin_x, origin_y = active[index]
+
+            for _ in range(self.candidates_per_point):
+                # Candidate in the annulus between min_distance and 2 * min_distance
+                angle = self.rng.uniform(0, 2 * math.pi)
+                distance = self.rng.uniform(min_distance, 2 * min_distance)
+                x = int(round(origin_x + math.cos(angle) * distance))
+                y = int(round(origin_y + math.sin(angle) * distance))
+                if not (x_range[0] <= x <= x_range[1] and y_range[0] <= y <= y_range[1]):
+                    continue
+                if self.is_free(x, y, min_distance, avoid):
+                    self.add_point(x, y, category)
+                    positions.append((x, y))
+                    active.append((x, y))
+                    break
+            else:
+                # Nothing fits around this point any more
+                active[index] = active[-1]
+                active.pop()
+
+        return positions
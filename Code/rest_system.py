@@ -2,21 +2,34 @@ import pygame
 import random
 import math
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks, ticks_to_seconds
 
 
 class RestManager:
     """Manages rest areas and cooldown timers"""
 
-    def __init__(self, character_manager):
+    def __init__(self, character_manager, timers):
         self.character_manager = character_manager
-        self.rest_cooldown = 0  # Cooldown timer in frames (15 fps)
-        self.cooldown_duration = 2700  # 3 minutes at 15 fps (15 * 60 * 3)
+        self.timers = timers  # Shared TimerWheel - the cooldown is saved with the character
+        self.cooldown_duration = seconds_to_ticks(180)  # 3 minutes
         self.rest_cost = 0  # Free resting
         self.last_rest_message = ""
 
         # UI fonts
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = get_font(24)
+        self.small_font = get_font(20)
+
+    @property
+    def rest_cooldown(self):
+        """Cooldown left in logic ticks"""
+        return self.timers.remaining("rest_cooldown")
+
+    @rest_cooldown.setter
+    def rest_cooldown(self, ticks):
+        if ticks > 0:
+            self.timers.schedule(ticks, key="rest_cooldown", persist=True)
+        else:
+            self.timers.cancel("rest_cooldown")
 
     def can_rest(self):
         """Check if player can rest (not in cooldown)"""
@@ -26,7 +39,7 @@ class RestManager:
         """Get remaining cooldown time in seconds"""
         if self.rest_cooldown <= 0:
             return 0
-        return max(0, self.rest_cooldown // 15)  # Convert frames to seconds
+        return ticks_to_seconds(self.rest_cooldown)
 
     def attempt_rest(self):
         """Attempt to rest and recover HP/MP"""
@@ -105,11 +118,6 @@ class RestManager:
             "mp_gained": mp_gained
         }
 
-    def update(self):
-        """Update cooldown timer"""
-        if self.rest_cooldown > 0:
-            self.rest_cooldown -= 1
-
     def draw_rest_status(self, screen, x, y):
         """Draw rest status information"""
         if self.rest_cooldown > 0:
@@ -121,24 +129,33 @@ class RestManager:
             cooldown_text = f"Rest Cooldown: {minutes:02d}:{seconds:02d}"
             cooldown_color = RED if remaining > 30 else ORANGE
 
-            text_surface = self.small_font.render(cooldown_text, True, cooldown_color)
+            text_surface = render_text(self.small_font, cooldown_text, cooldown_color)
             screen.blit(text_surface, (x, y))
         else:
             # Available status
             available_text = "Rest Available - Walk into a rest area"
-            text_surface = self.small_font.render(available_text, True, GREEN)
+            text_surface = render_text(self.small_font, available_text, GREEN)
             screen.blit(text_surface, (x, y))
 
     def draw_rest_hud(self, screen, width, height):
         """Draw rest HUD element near player info in top-left"""
+        hud_surface, hud_position = self.render_rest_hud()
+        screen.blit(hud_surface, hud_position)
+
+    def get_rest_hud_key(self):
+        """Get the values the rest HUD depends on (cooldown in whole seconds)"""
+        return self.rest_cooldown > 0, self.get_cooldown_time_remaining()
+
+    def render_rest_hud(self):
+        """Render the rest HUD panel to a new surface, returns (surface, position)"""
         # Draw near the player info in top-left area
         hud_x = 10
         hud_y = 140  # Position below the player status overlay
 
         # Background
-        hud_rect = pygame.Rect(hud_x, hud_y, 270, 25)
-        pygame.draw.rect(screen, (0, 0, 0, 128), hud_rect)
-        pygame.draw.rect(screen, UI_BORDER_COLOR, hud_rect, 1)
+        hud_surface = pygame.Surface((270, 25))
+        hud_surface.fill(BLACK)
+        pygame.draw.rect(hud_surface, UI_BORDER_COLOR, hud_surface.get_rect(), 1)
 
         # Rest status
         if self.rest_cooldown > 0:
@@ -152,24 +169,32 @@ class RestManager:
             status_text = "🛌 Rest Available (Bottom-Right Corner)"
             text_color = GREEN
 
-        text_surface = self.small_font.render(status_text, True, text_color)
-        screen.blit(text_surface, (hud_x + 5, hud_y + 5))
+        text_surface = render_text(self.small_font, status_text, text_color)
+        hud_surface.blit(text_surface, (5, 5))
+
+        return hud_surface, (hud_x, hud_y)
 
 
 class EnhancedRestArea(RestArea):
     """Enhanced rest area with visual feedback and interaction"""
+    __slots__ = ("rest_manager", "timers", "interaction_timer", "created_tick")
 
     def __init__(self, x, y, rest_manager):
         super().__init__(x, y)
         self.rest_manager = rest_manager
-        self.interaction_cooldown = 0
-        self.pulse_timer = 0
+        self.timers = rest_manager.timers
+        self.interaction_timer = None
+        self.created_tick = self.timers.now
 
-    def update(self):
-        """Update rest area animations and cooldowns"""
-        if self.interaction_cooldown > 0:
-            self.interaction_cooldown -= 1
-        self.pulse_timer += 1
+    @property
+    def interaction_cooldown(self):
+        """Anti-spam cooldown left in logic ticks"""
+        return self.timers.remaining(self.interaction_timer) if self.interaction_timer else 0
+
+    @property
+    def pulse_timer(self):
+        """Animation ticks since the rest area was created"""
+        return self.timers.now - self.created_tick
 
     def can_interact(self):
         """Check if player can interact with this rest area"""
@@ -182,7 +207,7 @@ class EnhancedRestArea(RestArea):
             return {"success": False, "message": "Just used this rest area!"}
 
         # Set short interaction cooldown to prevent spam
-        self.interaction_cooldown = 30  # 2 seconds
+        self.interaction_timer = self.timers.schedule(seconds_to_ticks(2))
 
         # Attempt rest through rest manager
         return self.rest_manager.attempt_rest()
@@ -246,7 +271,7 @@ class EnhancedRestArea(RestArea):
                            (tent_center_x, tent_center_y + 15), 3)
 
             # Rest label with status - positioned above tent
-            rest_font = pygame.font.Font(None, 14)
+            rest_font = get_font(14)
             if self.can_interact():
                 label_text = "REST"
                 label_color = WHITE
@@ -260,7 +285,7 @@ class EnhancedRestArea(RestArea):
                 label_text = "USED"
                 label_color = GRAY
 
-            text = rest_font.render(label_text, True, label_color)
+            text = render_text(rest_font, label_text, label_color)
             text_rect = text.get_rect(center=(tent_center_x, screen_y - 10))
 
             # Text background
@@ -271,14 +296,12 @@ class EnhancedRestArea(RestArea):
 
             # Interaction hint when available
             if self.can_interact():
-                hint_font = pygame.font.Font(None, 10)
-                hint_text = hint_font.render("Walk into tent", True, WHITE)
-                hint_rect = hint_text.get_rect(center=(tent_center_x, screen_y + 60))
-
                 # Subtle fade effect
                 alpha = int(150 + 100 * abs(math.sin(self.pulse_timer * 0.2)))
+                hint_text = render_text(get_font(10), "Walk into tent", WHITE, alpha=alpha)
+                hint_rect = hint_text.get_rect(center=(tent_center_x, screen_y + 60))
+
                 hint_bg = pygame.Rect(hint_rect.x - 3, hint_rect.y, hint_rect.width + 6, hint_rect.height + 2)
                 pygame.draw.rect(screen, (0, 0, 0, alpha), hint_bg)
 
-                hint_text.set_alpha(alpha)
                 screen.blit(hint_text, hint_rect)
\ No newline at end of file
@@ -0,0 +1,129 @@
+import copy
+import json
+import os
+import threading
+import time
+from functools import partial
+
+
+def write_json_atomic(path, data, indent=4):
+    """Write JSON to a temporary file next to path, then swap it in - a crash never leaves half a file"""
+    text = json.dumps(data, indent=indent)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+class SaveQueue:
+    """Write-behind saves - the game thread hands over a snapshot, a background thread writes it
+
+    Saves under the same key are coalesced: the latest snapshot is written once the key has had no new
+    saves for `delay` seconds, or `max_delay` seconds after the first unwritten one at the latest.
+    """
+
+    def __init__(self, delay=0.5, max_delay=2.0):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.pending = {}  # key -> [snapshot, write, first save time, last save time]
+        self.writing = 0  # Snapshots taken by the worker and not written yet
+        self.condition = threading.Condition()
+        self.flush_requested = False
+        self.running = True
+
+        # Statistics
+        self.requested = 0
+        self.written = 0
+        self.failed = 0
+
+        self.thread = threading.Thread(target=self.worker_loop, name="save-queue", daemon=True)
+        self.thread.start()
+
+    def save(self, key, data, write=None, merge=None):
+        """Queue a save of data - data is copied now, so later changes aren't picked up half-way
+
+        write(snapshot) does the saving on the worker thread; without one, key is a path to write JSON to.
+        A newer snapshot replaces a queued one, unless merge(queued, newer) combines them (journals).
+        """
+        snapshot = copy.deepcopy(data)
+        if write is None:
+            write = partial(write_json_atomic, key)
+        now = time.monotonic()
+        with self.condition:
+            self.requested += 1
+            entry = self.pending.get(key)
+            if entry:
+                entry[0] = merge(entry[0], snapshot) if merge else snapshot
+                entry[1] = write
+                entry[3] = now
+            else:
+                self.pending[key] = [snapshot, write, now, now]
+            self.condition.notify_all()
+
+    def flush(self, wait=False):
+        """Write everything queued now instead of after the debounce - with wait, until it is on disk"""
+        with self.condition:
+            if not self.pending and not self.writing:
+                return
+            self.flush_requested = True
+            self.condition.notify_all()
+            if wait:
+                while (self.pending or self.writing) and self.thread.is_alive():
+                    self.condition.wait(0.1)
+
+    def close(self):
+        """Write everything queued and stop the worker (quit)"""
+        self.flush(wait=True)
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join(timeout=5)
+
+    def get_due(self, now):
+        """Take the snapshots that are due (called with the lock held), returns them and the next due time"""
+        due = []
+        next_due = None
+        for key, (snapshot, write, first, last) in list(self.pending.items()):
+            when = min(last + self.delay, first + self.max_delay)
+            if self.flush_requested or not self.running or when <= now:
+                due.append((key, snapshot, write))
+                del self.pending[key]
+            elif next_due is None or when < next_due:
+                next_due = when
+        if not self.pending:
+            self.flush_requested = False
+        self.writing += len(due)
+        return due, next_due
+
+    def worker_loop(self):
+        """Background thread - wait for due snapshots and write them"""
+        while True:
+            with self.condition:
+                while True:
+                    due, next_due = self.get_due(time.monotonic())
+                    if due or (not self.running and not self.pending):
+                        break
+                    self.condition.wait(None if next_due is None else max(0.0, next_due - time.monotonic()))
+
+            for key, snapshot, write in due:
+                try:
+                    write(snapshot)
+                    self.written += 1
+                except Exception as e:
+                    self.failed += 1
+                    print(f"Failed to save {key}: {e}")
+
+            with self.condition:
+                self.writing -= len(due)
+                self.condition.notify_all()
+                if not self.running and not self.pending:
+                    return
+
+    def get_stats(self):
+        """Get queue counters"""
+        return {
+            "pending": len(self.pending),
+            "requested": self.requested,
+            "written": self.written,
+            "failed": self.failed
+        }
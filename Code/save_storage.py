@@ -0,0 +1,470 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from Code.save_queue import write_json_atomic
+from Code.character_journal import CharacterJournal
+
+# Where the game keeps its saves; paths below are the JSON file paths the game already uses as keys
+CHARACTERS_DIR = Path(__file__).parent.parent / 'Characters'
+DATABASE_FILE = Path(__file__).parent.parent / 'assets' / 'saves.db'
+ROSTER_FILE = Path(__file__).parent.parent / 'assets' / 'character_roster.json'
+LOCAL_USER = "local"  # users row that owns the single-player characters
+
+
+def get_roster_entry(data):
+    """Get the character select preview fields from character data"""
+    return {
+        "name": data.get("Name", "Unknown"),
+        "race": data.get("Race", ""),
+        "class": data.get("Type", ""),
+        "level": data.get("Level", 1),
+        "credits": data.get("Credits", 0)
+    }
+
+
+def load_storage_backend():
+    """Create the save backend named by save_backend in assets/game_config.json ("json" or "sqlite")"""
+    backend = "json"
+    try:
+        config_file = Path(__file__).parent.parent / 'assets' / 'game_config.json'
+        with open(config_file, 'r') as f:
+            backend = json.load(f).get("settings", {}).get("save_backend", "json")
+    except (OSError, ValueError) as e:
+        print(f"Could not read save backend setting: {e}")
+
+    if backend == "sqlite":
+        try:
+            return SQLiteStorage()
+        except sqlite3.Error as e:
+            print(f"Could not open {DATABASE_FILE}, saving to JSON files instead: {e}")
+    return JsonFileStorage()
+
+
+class JsonFileStorage:
+    """Save backend with one JSON file per character (Characters/) and per progression (SaveProgression/)
+
+    A roster index (assets/character_roster.json) keeps each character's preview fields with the file
+    times they were read at; saves update it, and only files whose times changed are parsed again.
+    """
+
+    def __init__(self, roster_file=ROSTER_FILE):
+        self.roster_file = roster_file
+        self.roster = None  # file name -> roster entry, read on first use
+        self.roster_dirty = False
+        self.roster_lock = threading.Lock()  # Saves update the roster from the save queue thread
+
+    def list_characters(self):
+        """Get the character file names"""
+        if os.path.exists(CHARACTERS_DIR):
+            return [f for f in os.listdir(CHARACTERS_DIR) if f.endswith('.json')]
+        return []
+
+    def load_character(self, path):
+        """Get a character's data, or None if there is no such character"""
+        return self.read(path)
+
+    def load_progression(self, path):
+        """Get a progression's data, or None if it was never saved"""
+        return self.read(path)
+
+    def load_world(self, path):
+        """Get a saved world (visited levels as they were left), or None if it was never saved"""
+        return self.read(path)
+
+    def save_character(self, path, data, progression=None):
+        """Save a character and optionally its progression ((path, data)) - the character's journal is cleared"""
+        write_json_atomic(path, data)
+        # The snapshot records the last journal entry it includes, so a crash before this only leaves extra lines
+        if os.path.exists(self.get_journal_path(path)):
+            os.remove(self.get_journal_path(path))
+        if progression:
+            self.save_progression(*progression)
+        self.update_roster(path, get_roster_entry(data))
+
+    @staticmethod
+    def get_journal_path(path):
+        """Get the journal file next to a character file"""
+        return str(Path(path).with_suffix('.journal'))
+
+    def append_journal(self, path, entries, summary=None):
+        """Append journal entries to a character's journal, one JSON line each (summary: new roster fields)"""
+        with open(self.get_journal_path(path), 'a') as f:
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        if summary:
+            self.update_roster(path, summary)
+
+    def load_journal(self, path):
+        """Get a character's journal entries (a line cut short by a crash ends the journal)"""
+        entries = []
+        journal_path = self.get_journal_path(path)
+        if os.path.exists(journal_path):
+            with open(journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        break
+        return entries
+
+    def save_progression(self, path, data):
+        """Save a progression"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_json_atomic(path, data)
+
+    def save_world(self, path, data):
+        """Save a world"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_json_atomic(path, data, indent=None)
+
+    def read(self, path):
+        """Read a JSON file, or None if it doesn't exist"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def get_stamp(self, path):
+        """Get the modification times (ns) of a character file and its journal - a roster entry is stale if they differ"""
+        journal_path = self.get_journal_path(path)
+        return [os.stat(path).st_mtime_ns,
+                os.stat(journal_path).st_mtime_ns if os.path.exists(journal_path) else 0]
+
+    def get_roster_index(self):
+        """Get the roster index, reading the index file on first use (called with the roster lock held)"""
+        if self.roster is None:
+            try:
+                self.roster = self.read(self.roster_file) or {}
+            except (OSError, ValueError) as e:
+                print(f"Rebuilding character roster: {e}")
+                self.roster = {}
+        return self.roster
+
+    def update_roster(self, path, summary):
+        """Record a saved character's preview fields (only for characters in Characters/)"""
+        path = Path(path)
+        if path.resolve().parent != CHARACTERS_DIR.resolve():
+            return
+        with self.roster_lock:
+            self.get_roster_index()[path.name] = dict(summary, file=path.name, last_played=time.time(),
+                                                      stamp=self.get_stamp(path))
+            self.roster_dirty = True
+
+    def get_roster(self):
+        """Get the roster entries sorted by name - only characters changed outside the game are parsed"""
+        with self.roster_lock:
+            roster = self.get_roster_index()
+            names = set(self.list_characters())
+            for name in list(roster):
+                if name not in names:
+                    del roster[name]
+                    self.roster_dirty = True
+
+            for name in names:
+                path = CHARACTERS_DIR / name
+                try:
+                    stamp = self.get_stamp(path)
+                    entry = roster.get(name)
+                    if entry is None or entry.get("stamp") != stamp:
+                        data = CharacterJournal().load(self.read(path), self.load_journal(path))
+                        roster[name] = dict(get_roster_entry(data), file=name, last_played=max(stamp) / 1e9,
+                                            stamp=stamp)
+                        self.roster_dirty = True
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    print(f"Could not read character {name} for the roster: {e}")
+
+            self.write_roster()
+            return sorted(roster.values(), key=lambda entry: str(entry["name"]).lower())
+
+    def write_roster(self):
+        """Write the roster index if it changed (called with the roster lock held)"""
+        if self.roster_dirty:
+            try:
+                write_json_atomic(self.roster_file, self.roster, indent=None)
+                self.roster_dirty = False
+            except OSError as e:
+                print(f"Could not write character roster: {e}")
+
+    def close(self):
+        """Write the roster index"""
+        with self.roster_lock:
+            self.write_roster()
+
+
+class SQLiteStorage(JsonFileStorage):
+    """Save backend on a local SQLite database (WAL mode) - characters and progressions are rows
+
+    Rows are keyed by the stem of the JSON path the game uses ("Characters/vozy.json" -> "vozy"), so the
+    rest of the game doesn't change. Characters that only exist as JSON files (new, copied in or saved
+    with the JSON backend) are stored when the database opens and whenever Characters/ changes;
+    progressions on first load.
+    """
+
+    def __init__(self, db_path=DATABASE_FILE):
+        super().__init__()
+        self.db_path = str(db_path)
+        self.characters_mtime = None  # Characters/ modification time (ns) at the last JSON import
+        # Shared by the game thread and the save queue thread, one statement at a time
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.lock = threading.Lock()
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, commits don't wait on fsync
+            self.create_tables()
+        self.import_json_files()
+
+    def create_tables(self):
+        """Add the local user, the progression, world, journal and roster tables and their indexes if they aren't there yet"""
+        execute = self.connection.execute
+        execute("""CREATE TABLE IF NOT EXISTS users (
+                    id TEXT PRIMARY KEY,
+                    username TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_login TIMESTAMP
+                )""")
+        execute("""CREATE TABLE IF NOT EXISTS characters (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users (id)
+                )""")
+        execute("""CREATE TABLE IF NOT EXISTS progression (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users (id)
+                )""")
+        execute("""CREATE TABLE IF NOT EXISTS worlds (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users (id)
+                )""")
+        execute("""CREATE TABLE IF NOT EXISTS character_journal (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    character_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    entry TEXT NOT NULL
+                )""")
+        execute("""CREATE TABLE IF NOT EXISTS roster (
+                    id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    race TEXT,
+                    class TEXT,
+                    level INTEGER,
+                    credits INTEGER,
+                    last_played REAL,
+                    FOREIGN KEY (id) REFERENCES characters (id)
+                )""")
+        execute("CREATE INDEX IF NOT EXISTS idx_characters_user_name ON characters (user_id, name)")
+        execute("CREATE INDEX IF NOT EXISTS idx_roster_user_name ON roster (user_id, name COLLATE NOCASE)")
+        execute("CREATE INDEX IF NOT EXISTS idx_character_journal ON character_journal (character_id, seq)")
+        execute("INSERT OR IGNORE INTO users (id, username, password_hash) VALUES (?, ?, '')",
+                (LOCAL_USER, LOCAL_USER))
+
+    @staticmethod
+    def get_row_id(path):
+        """Get the row id for a JSON path"""
+        return Path(path).stem
+
+    def list_characters(self):
+        """Get the character file names - one query on the (user_id, name) index"""
+        self.import_json_files()
+        return self.get_character_files()
+
+    def get_character_files(self):
+        """Get the file names of the characters stored in the database"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id FROM characters WHERE user_id = ? ORDER BY name", (LOCAL_USER,)).fetchall()
+        return [f"{row_id}.json" for row_id, in rows]
+
+    def load_character(self, path):
+        """Get a character's data, falling back to (and storing) its JSON file"""
+        with self.lock:
+            row = self.connection.execute("SELECT data FROM characters WHERE id = ? AND user_id = ?",
+                                          (self.get_row_id(path), LOCAL_USER)).fetchone()
+        if row:
+            return json.loads(row[0])
+        data = self.read_json_character(path)
+        if data is not None:
+            self.save_character(path, data)
+        return data
+
+    def read_json_character(self, path):
+        """Read a JSON character with its journal file replayed, or None if there is no file"""
+        data = self.read(path)
+        if data is None:
+            return None
+        return dict(CharacterJournal().load(data, JsonFileStorage.load_journal(self, path)))
+
+    def load_progression(self, path):
+        """Get a progression's data, falling back to (and storing) its JSON file"""
+        with self.lock:
+            row = self.connection.execute("SELECT data FROM progression WHERE id = ? AND user_id = ?",
+                                          (self.get_row_id(path), LOCAL_USER)).fetchone()
+        if row:
+            return json.loads(row[0])
+        data = self.read(path)
+        if data is not None:
+            self.save_progression(path, data)
+        return data
+
+    def load_world(self, path):
+        """Get a saved world, falling back to (and storing) its JSON file"""
+        with self.lock:
+            row = self.connection.execute("SELECT data FROM worlds WHERE id = ? AND user_id = ?",
+                                          (self.get_row_id(path), LOCAL_USER)).fetchone()
+        if row:
+            return json.loads(row[0])
+        data = self.read(path)
+        if data is not None:
+            self.save_world(path, data)
+        return data
+
+    def save_character(self, path, data, progression=None):
+        """Save a character and optionally its progression ((path, data)) in one transaction, clearing its journal"""
+        with self.lock, self.transaction():
+            self.write_character(path, data)
+            self.connection.execute("DELETE FROM character_journal WHERE character_id = ?",
+                                    (self.get_row_id(path),))
+            if progression:
+                self.write_progression(*progression)
+            self.write_roster_entry(self.get_row_id(path), get_roster_entry(data))
+
+    def append_journal(self, path, entries, summary=None):
+        """Append journal entries to a character's journal (summary: new roster fields, same transaction)"""
+        row_id = self.get_row_id(path)
+        with self.lock, self.transaction():
+            self.connection.executemany(
+                "INSERT INTO character_journal (character_id, seq, entry) VALUES (?, ?, ?)",
+                [(row_id, entry["seq"], json.dumps(entry)) for entry in entries])
+            if summary:
+                self.write_roster_entry(row_id, summary)
+
+    def write_roster_entry(self, row_id, summary, last_played=None):
+        """Upsert a roster row (called inside a transaction)"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO roster (id, user_id, name, race, class, level, credits, last_played) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (row_id, LOCAL_USER, summary["name"], summary["race"], summary["class"], summary["level"],
+             summary["credits"], last_played if last_played is not None else time.time()))
+
+    def get_roster(self):
+        """Get the roster entries sorted by name - one indexed query once every character has a row"""
+        self.import_json_files()
+        with self.lock:
+            missing = self.connection.execute(
+                "SELECT id, data, CAST(strftime('%s', updated_at) AS REAL) FROM characters "
+                "WHERE user_id = ? AND id NOT IN (SELECT id FROM roster)", (LOCAL_USER,)).fetchall()
+        for row_id, data, updated in missing:
+            try:
+                data = CharacterJournal().load(json.loads(data), self.load_journal(row_id))
+                with self.lock, self.transaction():
+                    self.write_roster_entry(row_id, get_roster_entry(data), updated)
+            except (ValueError, TypeError, AttributeError) as e:
+                print(f"Could not read character {row_id} for the roster: {e}")
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT id, name, race, class, level, credits, last_played FROM roster "
+                "WHERE user_id = ? ORDER BY name COLLATE NOCASE", (LOCAL_USER,)).fetchall()
+        return [{"file": f"{row_id}.json", "name": name, "race": race, "class": character_class, "level": level,
+                 "credits": credits, "last_played": last_played}
+                for row_id, name, race, character_class, level, credits, last_played in rows]
+
+    def load_journal(self, path):
+        """Get a character's journal entries, oldest first"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT entry FROM character_journal WHERE character_id = ? ORDER BY seq",
+                (self.get_row_id(path),)).fetchall()
+        return [json.loads(entry) for entry, in rows]
+
+    def save_progression(self, path, data):
+        """Save a progression"""
+        with self.lock, self.transaction():
+            self.write_progression(path, data)
+
+    def save_world(self, path, data):
+        """Save a world"""
+        with self.lock, self.transaction():
+            self.connection.execute(
+                "INSERT INTO worlds (id, user_id, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = CURRENT_TIMESTAMP",
+                (self.get_row_id(path), LOCAL_USER, json.dumps(data)))
+
+    def write_character(self, path, data):
+        """Upsert a character row (called inside a transaction)"""
+        self.connection.execute(
+            "INSERT INTO characters (id, user_id, name, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name, data = excluded.data, "
+            "updated_at = CURRENT_TIMESTAMP",
+            (self.get_row_id(path), LOCAL_USER, data.get("Name", self.get_row_id(path)), json.dumps(data)))
+
+    def write_progression(self, path, data):
+        """Upsert a progression row (called inside a transaction)"""
+        self.connection.execute(
+            "INSERT INTO progression (id, user_id, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = CURRENT_TIMESTAMP",
+            (self.get_row_id(path), LOCAL_USER, json.dumps(data)))
+
+    def transaction(self):
+        """Context manager for one write transaction"""
+        return Transaction(self.connection)
+
+    def import_json_files(self):
+        """Store the JSON characters in Characters/ that the database doesn't have yet - only scans the
+        directory when its modification time changed since the last import"""
+        try:
+            mtime = os.stat(CHARACTERS_DIR).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self.characters_mtime:
+            return
+        self.characters_mtime = mtime
+
+        stored = set(self.get_character_files())
+        imported = 0
+        for name in super().list_characters():
+            if name in stored:
+                continue
+            try:
+                data = self.read_json_character(CHARACTERS_DIR / name)
+                if data is not None:
+                    self.save_character(name, data)
+                    imported += 1
+            except (OSError, ValueError) as e:
+                print(f"Could not import character {name}: {e}")
+        if imported:
+            print(f"Imported {imported} characters into {self.db_path}")
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.connection.close()
+
+
+class Transaction:
+    """BEGIN ... COMMIT, or ROLLBACK if the block raises"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
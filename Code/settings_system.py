@@ -25,7 +25,9 @@ class GameSettings:
             "combat_text_enabled": True,
             "screen_shake": True,
             "particle_effects": True,
-            "show_instructions": False
+            "show_instructions": False,
+            "dirty_rect_updates": False,
+            "render_fps": 60
         }
 
         # Current settings (loaded from file or defaults)
@@ -119,6 +121,8 @@ class SettingsScreen:
                     {"key": "fullscreen", "name": "Fullscreen", "type": "boolean"},
                     {"key": "show_fps", "name": "Show FPS", "type": "boolean"},
                     {"key": "show_instructions", "name": "Show Instructions", "type": "boolean"},
+                    {"key": "dirty_rect_updates", "name": "Dirty-Rect Updates", "type": "boolean"},
+                    {"key": "render_fps", "name": "Render FPS", "type": "slider", "min": 15, "max": 120, "step": 15},
                     {"key": "animation_speed", "name": "Animation Speed", "type": "slider", "min": 0.5, "max": 2.0,
                      "step": 0.1}
                 ]
@@ -370,6 +374,8 @@ class SettingsScreen:
                 return difficulty_names.get(value, f"{value:.1f}x")
             elif "volume" in key:
                 return f"{int(value * 100)}%"
+            elif key == "render_fps":
+                return f"{int(value)} FPS"
             else:
                 return f"{value:.1f}"
 
@@ -409,6 +415,13 @@ class SettingsIntegration:
 
         # Apply display settings
         self.game_manager.show_instructions = self.game_settings.get("show_instructions")
+        if hasattr(self.game_manager, 'profiler'):
+            profiler = self.game_manager.profiler
+            profiler.show_fps = bool(self.game_settings.get("show_fps") or profiler.config_flags.get("show_fps"))
+        if hasattr(self.game_manager, 'game_clock'):
+            self.game_manager.game_clock.set_render_fps(self.game_settings.get("render_fps"))
+        if hasattr(self.game_manager, 'display_presenter'):
+            self.game_manager.display_presenter.set_enabled(self.game_settings.get("dirty_rect_updates"))
 
         # Apply gameplay settings - FIXED DIFFICULTY APPLICATION
         difficulty = self.game_settings.get("difficulty_multiplier")
@@ -0,0 +1,217 @@
+import pygame
+
+# Object kinds in collision priority order (register them in this order)
+TREE_KINDS = ("tree",)
+MAP_OBJECT_KINDS = ("rock", "metal", "stream", "brush")
+COLLISION_PRIORITY = TREE_KINDS + MAP_OBJECT_KINDS + ("rest", "enemy", "treasure", "shop")
+HARVEST_KINDS = MAP_OBJECT_KINDS + TREE_KINDS
+INTERACT_KINDS = ("dungeon",)  # Spacebar only, never collided with
+
+_RECT_MASKS = {}  # (width, height) -> solid mask, for objects without a sprite mask
+
+
+def get_rect_mask(width, height):
+    """Get a solid collision mask for a rectangle size"""
+    size = (max(1, int(width)), max(1, int(height)))
+    mask = _RECT_MASKS.get(size)
+    if mask is None:
+        mask = pygame.mask.Mask(size, fill=True)
+        _RECT_MASKS[size] = mask
+    return mask
+
+
+class _GridEntry:
+    """One object registered in the grid"""
+    __slots__ = ("obj", "kind", "rect", "mask", "center", "order", "cells")
+
+    def __init__(self, obj, kind, rect, order):
+        self.obj = obj
+        self.kind = kind
+        self.rect = rect
+        self.mask = SpatialHash.get_object_mask(obj, rect)
+        self.center = (obj.x + obj.width // 2, obj.y + obj.height // 2)  # Used for interaction distance
+        self.order = order  # Registration order - doubles as the collision priority
+        self.cells = ()
+
+
+class SpatialHash:
+    """Uniform grid of world objects so collision and interaction queries only look at nearby cells"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell x, cell y) -> list of entries
+        self.entries = {}  # id(obj) -> entry
+        self.next_order = 0
+
+        # Statistics
+        self.queries = 0
+        self.candidates_checked = 0
+
+    def clear(self):
+        """Remove every object (level change)"""
+        self.cells.clear()
+        self.entries.clear()
+        self.next_order = 0
+
+    @staticmethod
+    def get_object_rect(obj):
+        """Get the rectangle an object collides with"""
+        if hasattr(obj, 'collision_rect'):
+            return obj.collision_rect  # Trees only collide with their trunk
+        if hasattr(obj, 'get_rect'):
+            return pygame.Rect(obj.get_rect())
+        return pygame.Rect(obj.x, obj.y, obj.width, obj.height)
+
+    @staticmethod
+    def get_object_mask(obj, rect):
+        """Get the collision mask of an object (sprite mask from get_mask() when it has one, otherwise solid)"""
+        if hasattr(obj, 'get_mask'):
+            return obj.get_mask()
+        return get_rect_mask(rect.width, rect.height)
+
+    def get_cells(self, rect):
+        """Get the grid cells a rectangle overlaps"""
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def insert(self, obj, kind):
+        """Register an object under a kind from COLLISION_PRIORITY or INTERACT_KINDS"""
+        if id(obj) in self.entries:
+            self.remove(obj)
+        entry = _GridEntry(obj, kind, self.get_object_rect(obj), self.next_order)
+        self.next_order += 1
+        self.entries[id(obj)] = entry
+        if getattr(obj, 'active', True):
+            self.link(entry)
+        return entry
+
+    def remove(self, obj):
+        """Forget an object completely"""
+        entry = self.entries.pop(id(obj), None)
+        if entry:
+            self.unlink(entry)
+
+    def link(self, entry):
+        """Put an entry into the cells under its rectangle (and its centre, which can lie outside a trunk rect)"""
+        entry.cells = self.get_cells(entry.rect.union(pygame.Rect(entry.center, (1, 1))))
+        for cell in entry.cells:
+            self.cells.setdefault(cell, []).append(entry)
+
+    def unlink(self, entry):
+        """Take an entry out of its cells"""
+        for cell in entry.cells:
+            bucket = self.cells.get(cell)
+            if bucket and entry in bucket:
+                bucket.remove(entry)
+                if not bucket:
+                    del self.cells[cell]
+        entry.cells = ()
+
+    def move(self, obj):
+        """Re-bucket an object after its position changed"""
+        entry = self.entries.get(id(obj))
+        if not entry:
+            return
+        self.unlink(entry)
+        entry.rect = self.get_object_rect(obj)
+        entry.mask = self.get_object_mask(obj, entry.rect)
+        entry.center = (obj.x + obj.width // 2, obj.y + obj.height // 2)
+        if getattr(obj, 'active', True):
+            self.link(entry)
+
+    def set_active(self, obj, active):
+        """Activate/deactivate an object and update the grid to match"""
+        obj.active = active
+        entry = self.entries.get(id(obj))
+        if not entry:
+            return
+        if active and not entry.cells:
+            self.link(entry)
+        elif not active and entry.cells:
+            self.unlink(entry)
+
+    def query(self, rect):
+        """Get the entries near a rectangle, in collision priority order"""
+        self.queries += 1
+        found = {}
+        for cell in self.get_cells(rect):
+            for entry in self.cells.get(cell, ()):
+                found[entry.order] = entry
+        self.candidates_checked += len(found)
+        return [found[order] for order in sorted(found)]
+
+    def find_collision(self, rect, kinds=COLLISION_PRIORITY):
+        """Get (kind, obj) for the highest priority active object overlapping rect, or (None, None)"""
+        for entry in self.query(rect):
+            if entry.kind not in kinds:
+                continue
+            obj = entry.obj
+            if not obj.active:
+                continue
+            if entry.kind in TREE_KINDS or entry.kind in MAP_OBJECT_KINDS:
+                if not obj.is_blocking():
+                    continue
+            if rect.colliderect(entry.rect):
+                return entry.kind, obj
+        return None, None
+
+    def find_blocking(self, rect, kinds=TREE_KINDS):
+        """Get the first blocking object whose sprite mask overlaps rect, or None"""
+        rect_mask = get_rect_mask(rect.width, rect.height)
+        for entry in self.query(rect):
+            if entry.kind not in kinds:
+                continue
+            obj = entry.obj
+            if not obj.active or not obj.is_blocking():
+                continue
+            if entry.mask.overlap(rect_mask, (rect.x - entry.rect.x, rect.y - entry.rect.y)):
+                return obj
+        return None
+
+    def find_nearest(self, x, y, radius, kinds, accept=None):
+        """Get (kind, obj) for the nearest active object of the given kinds whose centre is within radius"""
+        self.queries += 1
+        size = self.cell_size
+        best_entry = None
+        best_distance_sq = radius * radius  # Squared distances only - no sqrt
+        seen = set()
+
+        for cx in range(int(x - radius) // size, int(x + radius) // size + 1):
+            for cy in range(int(y - radius) // size, int(y + radius) // size + 1):
+                for entry in self.cells.get((cx, cy), ()):
+                    if entry.order in seen:
+                        continue
+                    seen.add(entry.order)
+                    if entry.kind not in kinds:
+                        continue
+                    dx = entry.center[0] - x
+                    dy = entry.center[1] - y
+                    distance_sq = dx * dx + dy * dy
+                    if distance_sq > best_distance_sq:
+                        continue  # Out of range or further than the best so far
+                    if distance_sq == best_distance_sq and best_entry and \
+                            (kinds.index(best_entry.kind), best_entry.order) < (kinds.index(entry.kind), entry.order):
+                        continue  # Ties go to the earlier kind in kinds, then the object registered first
+                    obj = entry.obj
+                    if not obj.active or (accept and not accept(obj)):
+                        continue
+                    best_entry = entry
+                    best_distance_sq = distance_sq
+
+        self.candidates_checked += len(seen)
+        if best_entry:
+            return best_entry.kind, best_entry.obj
+        return None, None
+
+    def get_stats(self):
+        """Get grid counters"""
+        return {
+            "objects": len(self.entries),
+            "cells": len(self.cells),
+            "queries": self.queries,
+            "candidates_checked": self.candidates_checked
+        }
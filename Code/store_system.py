@@ -1,6 +1,7 @@
 import pygame
 import random
 from Code.ui_components import *
+from Code.game_clock import seconds_to_ticks
 
 
 class StoreItem:
@@ -372,7 +373,7 @@ class StoreIntegration:
             )
 
             # Set cooldown to prevent immediate re-entry
-            self.exit_cooldown = 30
+            self.exit_cooldown = seconds_to_ticks(2)
             return "exit_store"
 
         elif isinstance(result, dict):
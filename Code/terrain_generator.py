@@ -0,0 +1,241 @@
+import random
+
+import pygame
+
+from Code.tile_map import BLOCKING_TILES
+
+# Bump whenever the output for a given seed changes - cached maps are keyed on it
+GENERATOR_VERSION = 1
+
+# Per-theme tiles and noise thresholds (fractions of the map)
+THEMES = {
+    "grassland": {"floor": "GGgd", "shore": "S", "water": "W", "obstacle": "t", "path": "p",
+                  "water_fraction": 0.10, "shore_fraction": 0.05, "forest_fraction": 0.12},
+    "ice": {"floor": "wwg+", "shore": "S", "water": "W", "obstacle": "t", "path": "S",
+            "water_fraction": 0.18, "shore_fraction": 0.06, "forest_fraction": 0.06},
+    "shadow": {"floor": "dd|M", "shore": "D", "water": "W", "obstacle": "t", "path": "o",
+               "water_fraction": 0.08, "shore_fraction": 0.04, "forest_fraction": 0.16},
+    "elemental": {"floor": "DPSX", "shore": "S", "water": "W", "obstacle": "T", "path": "r",
+                  "water_fraction": 0.07, "shore_fraction": 0.05, "forest_fraction": 0.08},
+    "cosmic": {"floor": "MMdY", "shore": "w", "water": "W", "obstacle": "t", "path": "P",
+               "water_fraction": 0.12, "shore_fraction": 0.05, "forest_fraction": 0.05},
+}
+
+# Noise feature sizes in tiles
+ELEVATION_PERIOD = 10
+VEGETATION_PERIOD = 5
+DETAIL_PERIOD = 3
+PLAYER_TILES = 2  # The 40px player covers 2x2 tiles when lined up with the grid
+
+
+class TerrainGenerator:
+    """Seeded noise terrain generator - whole-map operations run in C (pygame scaling, bytes and int ops)
+
+    Noise fields are random lattices upsampled with pygame.transform.smoothscale, combined and turned
+    into tile characters with bytes.translate. Reachability from the spawn point is flood filled on
+    bitmasks held in Python ints, and walkable pockets the player could never get to become obstacles.
+    """
+
+    def __init__(self, theme="grassland", seed=0):
+        self.theme_name = theme if theme in THEMES else "grassland"
+        self.theme = THEMES[self.theme_name]
+        self.seed = seed
+        self.rng = random.Random(f"{self.theme_name}:{seed}")
+
+    def noise(self, width, height, period, octaves=2):
+        """Get a width*height bytes noise field (0-255, row-major) - smooth random lattices, octaves averaged"""
+        field = None
+        for octave in range(octaves):
+            step = max(1, period >> octave)
+            lattice_width = width // step + 2
+            lattice_height = height // step + 2
+            values = self.rng.randbytes(lattice_width * lattice_height)
+            grey = bytearray(len(values) * 3)
+            grey[0::3] = grey[1::3] = grey[2::3] = values
+            lattice = pygame.image.frombuffer(bytes(grey), (lattice_width, lattice_height), "RGB")
+            layer = pygame.transform.smoothscale(lattice, (lattice_width * step, lattice_height * step))
+            if field is None:
+                field = layer
+            else:
+                layer.set_alpha(255 // (octave + 1))  # Finer octaves weigh less
+                field.blit(layer, (0, 0))
+        field = field.subsurface((0, 0, width, height))
+        return pygame.image.tostring(field, "RGB")[::3]
+
+    @staticmethod
+    def get_thresholds(field, fractions):
+        """Get the noise values below which the given cumulative fractions of the field lie"""
+        sample = sorted(field[::17])
+        return [sample[min(len(sample) - 1, int(fraction * len(sample)))] for fraction in fractions]
+
+    @staticmethod
+    def to_int(data):
+        """Bytes -> int with cell 0 in the lowest byte"""
+        return int.from_bytes(data, 'little')
+
+    @staticmethod
+    def to_bits(data, one):
+        """Bytes -> int with one bit per cell, set where the byte equals `one`"""
+        return int(data.translate(bytes(49 if value == one else 48 for value in range(256)))[::-1], 2)
+
+    @staticmethod
+    def from_bits(bits, length):
+        """Int with one bit per cell -> bytes of 0/1"""
+        return format(bits, f'0{length}b')[::-1].encode().translate(bytes((value - 48) & 1 for value in range(256)))
+
+    def generate(self, width, height, clear_zones=()):
+        """Generate a map, returns (lines, points)
+
+        clear_zones are (column, row, columns, rows) tile rects kept as plain floor and joined by paths;
+        the first one is where the player spawns. points maps "tree" / "map_object" to suggested pixel
+        positions (forest edges and shores).
+        """
+        theme = self.theme
+        cells = width * height
+
+        # Noise fields
+        elevation = self.noise(width, height, ELEVATION_PERIOD)
+        vegetation = self.noise(width, height, VEGETATION_PERIOD)
+        detail = self.noise(width, height, DETAIL_PERIOD, octaves=1)
+
+        # Quantise each field into its own bits of a 0-31 tile index, then add them up as big ints
+        water_level, shore_level = self.get_thresholds(
+            elevation, (theme["water_fraction"], theme["water_fraction"] + theme["shore_fraction"]))
+        forest_level, edge_level = self.get_thresholds(
+            vegetation, (1 - theme["forest_fraction"], 1 - theme["forest_fraction"] * 2))
+        elevation_table = bytes(0 if value < water_level else 1 if value < shore_level else 2
+                                for value in range(256))
+        vegetation_table = bytes(4 if value >= forest_level else 0 for value in range(256))
+        detail_table = bytes(8 * min(3, value * 4 // 256) for value in range(256))
+        index = (self.to_int(elevation.translate(elevation_table)) +
+                 self.to_int(vegetation.translate(vegetation_table)) +
+                 self.to_int(detail.translate(detail_table))).to_bytes(cells, 'little')
+
+        tile_table = bytearray(b'G' * 256)
+        for value in range(32):
+            level = value & 3
+            if level == 0:
+                char = theme["water"]
+            elif level == 1:
+                char = theme["shore"]
+            elif value & 4:
+                char = theme["obstacle"]
+            else:
+                char = theme["floor"][value >> 3]
+            tile_table[value] = ord(char)
+        tiles = index.translate(bytes(tile_table))
+
+        # Padded layout: one blocking column per row so shifted masks never wrap into the next row
+        stride = width + 1
+        pad = theme["water"].encode()
+        grid = bytearray(b"".join(tiles[row * width:(row + 1) * width] + pad for row in range(height)))
+
+        self.clear_and_connect(grid, stride, height, clear_zones)
+        self.remove_unreachable(grid, stride, height, clear_zones)
+        points = self.get_points(grid, stride, height, vegetation, edge_level)
+
+        lines = [grid[row * stride:row * stride + width].decode() for row in range(height)]
+        return lines, points
+
+    def clear_and_connect(self, grid, stride, height, clear_zones):
+        """Clear the zones to floor and carve 2-tile paths from the first zone to each of the others"""
+        floor = self.theme["floor"][0].encode()
+        path = self.theme["path"].encode()
+        width = stride - 1
+
+        def fill(column, row, columns, rows, char):
+            left = max(0, column)
+            right = min(width, column + columns)
+            for y in range(max(0, row), min(height, row + rows)):
+                grid[y * stride + left:y * stride + right] = char * max(0, right - left)
+
+        for column, row, columns, rows in clear_zones:
+            fill(column, row, columns, rows, floor)
+
+        if not clear_zones:
+            return
+        start_column, start_row, start_columns, start_rows = clear_zones[0]
+        start_x = start_column + start_columns // 2 - 1
+        start_y = start_row + start_rows // 2 - 1
+        for column, row, columns, rows in clear_zones[1:]:
+            end_x = column + columns // 2 - 1
+            end_y = row + rows // 2 - 1
+            # L-shaped path, elbow on a random side
+            if self.rng.random() < 0.5:
+                fill(min(start_x, end_x), start_y, abs(end_x - start_x) + PLAYER_TILES, PLAYER_TILES, path)
+                fill(end_x, min(start_y, end_y), PLAYER_TILES, abs(end_y - start_y) + PLAYER_TILES, path)
+            else:
+                fill(start_x, min(start_y, end_y), PLAYER_TILES, abs(end_y - start_y) + PLAYER_TILES, path)
+                fill(min(start_x, end_x), end_y, abs(end_x - start_x) + PLAYER_TILES, PLAYER_TILES, path)
+
+    def get_walkable_bits(self, grid):
+        """Get the walkable cells of a padded grid as a bitmask"""
+        table = bytearray(b'1' * 256)
+        for char in BLOCKING_TILES:
+            table[ord(char)] = ord('0')
+        table[ord(self.theme["water"])] = ord('0')
+        return int(bytes(grid).translate(bytes(table))[::-1], 2)
+
+    def remove_unreachable(self, grid, stride, height, clear_zones):
+        """Turn walkable tiles the player can't reach from the spawn zone into obstacles"""
+        if not clear_zones:
+            return
+        cells = stride * height
+        everything = (1 << cells) - 1
+        walkable = self.get_walkable_bits(grid)
+
+        # A 2x2 block the player can stand on, indexed by its top-left cell
+        standable = walkable & (walkable >> 1) & (walkable >> stride) & (walkable >> (stride + 1))
+
+        column, row, columns, rows = clear_zones[0]
+        reached = (1 << ((row + rows // 2 - 1) * stride + column + columns // 2 - 1)) & standable
+        while True:
+            grown = (reached | (reached << 1) | (reached >> 1) |
+                     (reached << stride) | (reached >> stride)) & standable
+            if grown == reached:
+                break
+            reached = grown
+
+        covered = (reached | (reached << 1) | (reached << stride) | (reached << (stride + 1))) & everything
+        unreachable = walkable & (covered ^ everything)
+        if not unreachable:
+            return
+
+        # grid = grid - grid[unreachable] + obstacle[unreachable], bytewise with no carries
+        mask = self.to_int(self.from_bits(unreachable, cells))
+        values = self.to_int(grid)
+        values = values - (values & (mask * 255)) + mask * ord(self.theme["obstacle"])
+        grid[:] = values.to_bytes(cells, 'little')
+
+    def get_points(self, grid, stride, height, vegetation, edge_level, limit=64):
+        """Suggest object positions: trees on floor along forest edges, map objects on shores"""
+        width = stride - 1
+        tile_size = 24
+        grid = bytes(grid)
+
+        floor_table = bytearray(256)
+        for char in self.theme["floor"]:
+            floor_table[ord(char)] = 1
+        edge = vegetation.translate(bytes(1 if value >= edge_level else 0 for value in range(256)))
+        padded_edge = b"".join(edge[row * width:(row + 1) * width] + b"\x00" for row in range(height))
+
+        masks = {
+            "tree": (self.to_int(grid.translate(bytes(floor_table))) & self.to_int(padded_edge)).to_bytes(len(grid),
+                                                                                                    'little'),
+            "map_object": grid.translate(bytes(1 if value == ord(self.theme["shore"]) else 0 for value in range(256)))
+        }
+
+        # Sample instead of listing every candidate: the first candidate after each random cell
+        points = {}
+        for name, mask in masks.items():
+            found = set()
+            for _ in range(limit):
+                start = self.rng.randrange(len(mask))
+                index = mask.find(1, start)
+                if index < 0:
+                    index = mask.find(1)
+                if index < 0:
+                    break
+                found.add(((index % stride) * tile_size, (index // stride) * tile_size))
+            points[name] = sorted(found)
+        return points
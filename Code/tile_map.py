@@ -11,6 +11,48 @@ assets_dir = script_dir.parent / 'assets'
 map_file = assets_dir / 'map.txt'
 
 
+# Tile coordinate mappings for Zelda-style world
+TILE_COORDS = {
+    # Basic terrain
+    'G': (0, 0, 24, 24),  # Grass
+    'g': (24, 0, 24, 24),  # Light grass
+    'd': (48, 0, 24, 24),  # Dark grass
+    'D': (72, 0, 24, 24),  # Dirt
+    'P': (96, 0, 24, 24),  # Path
+    'S': (120, 0, 24, 24),  # Sand
+
+    # Paths and roads
+    'p': (0, 24, 24, 24),  # Dirt path
+    'r': (24, 24, 24, 24),  # Road
+    '=': (48, 24, 24, 24),  # Horizontal path
+    '|': (72, 24, 24, 24),  # Vertical path
+    '+': (96, 24, 24, 24),  # Path intersection
+    'o': (120, 24, 24, 24),  # Round path
+
+    # Decorative elements
+    'T': (72, 48, 24, 24),  # Tree trunk
+    't': (96, 48, 24, 24),  # Tree leaves
+    'B': (120, 48, 24, 24),  # Bush
+
+    # Water and special
+    'W': (0, 96, 24, 24),  # Water
+    'w': (24, 96, 24, 24),  # Water edge
+    'Y': (72, 96, 24, 24),  # Special yellow
+    'M': (96, 96, 24, 24),  # Magic purple
+    'X': (120, 96, 24, 24),  # Danger red
+
+    # Default fallback
+    ' ': (0, 0, 24, 24),  # Default to grass
+    '0': (0, 0, 24, 24),  # Grass
+    '1': (24, 0, 24, 24),  # Light grass
+    '2': (48, 0, 24, 24),  # Dark grass
+    '3': (96, 0, 24, 24),  # Path
+}
+
+# Map characters the player can't walk through (water and tree tiles)
+BLOCKING_TILES = {'W', 'T', 't'}
+
+
 class EnhancedTileMap(pygame.sprite.Sprite):
     """Enhanced TileMap class from RPG2 demo with Zelda-style world"""
 
@@ -93,54 +135,26 @@ class EnhancedTileMap(pygame.sprite.Sprite):
         self.map_width = 32  # Increased map size
         self.map_height = 24
 
+        # Baked map layer - whole tile map pre-rendered into one world-sized surface
+        self.baked_surface = None
+        self.baked_tiles = None  # Tile map the baked surface was built from
+        self.dirty_tiles = set()  # (row, column) cells that need re-baking
+
+        # Walkability bitmap - one byte per tile, row-major, 1 = walkable
+        self.walkable = bytearray(b'\x01' * (self.map_width * self.map_height))
+
     def load_map_from_data(self, map_lines):
         """Load map from string data - Zelda-style mapping system"""
         tile_map = []
 
-        # Tile coordinate mappings for Zelda-style world
-        tile_coords = {
-            # Basic terrain
-            'G': (0, 0, 24, 24),  # Grass
-            'g': (24, 0, 24, 24),  # Light grass
-            'd': (48, 0, 24, 24),  # Dark grass
-            'D': (72, 0, 24, 24),  # Dirt
-            'P': (96, 0, 24, 24),  # Path
-            'S': (120, 0, 24, 24),  # Sand
-
-            # Paths and roads
-            'p': (0, 24, 24, 24),  # Dirt path
-            'r': (24, 24, 24, 24),  # Road
-            '=': (48, 24, 24, 24),  # Horizontal path
-            '|': (72, 24, 24, 24),  # Vertical path
-            '+': (96, 24, 24, 24),  # Path intersection
-            'o': (120, 24, 24, 24),  # Round path
-
-            # Decorative elements
-            'T': (72, 48, 24, 24),  # Tree trunk
-            't': (96, 48, 24, 24),  # Tree leaves
-            'B': (120, 48, 24, 24),  # Bush
-
-            # Water and special
-            'W': (0, 96, 24, 24),  # Water
-            'w': (24, 96, 24, 24),  # Water edge
-            'Y': (72, 96, 24, 24),  # Special yellow
-            'M': (96, 96, 24, 24),  # Magic purple
-            'X': (120, 96, 24, 24),  # Danger red
-
-            # Default fallback
-            ' ': (0, 0, 24, 24),  # Default to grass
-            '0': (0, 0, 24, 24),  # Grass
-            '1': (24, 0, 24, 24),  # Light grass
-            '2': (48, 0, 24, 24),  # Dark grass
-            '3': (96, 0, 24, 24),  # Path
-        }
-
         # Initialize empty map
         for row in range(self.map_height):
             tile_map.append([])
             for column in range(self.map_width):
                 tile_map[row].append((0, 0, 24, 24))  # Default grass
 
+        walkable = bytearray(b'\x01' * (self.map_width * self.map_height))
+
         # Process each line of map data
         for x in range(min(len(map_lines), self.map_height)):
             line = map_lines[x]
@@ -148,8 +162,11 @@ class EnhancedTileMap(pygame.sprite.Sprite):
                 char = line[y]
 
                 # Get tile coordinates from mapping, default to grass
-                tile_map[x][y] = tile_coords.get(char, (0, 0, 24, 24))
+                tile_map[x][y] = TILE_COORDS.get(char, (0, 0, 24, 24))
+                if char in BLOCKING_TILES:
+                    walkable[x * self.map_width + y] = 0
 
+        self.walkable = walkable
         return tile_map
 
     def load_map_from_file(self, map_file_path):
@@ -157,10 +174,14 @@ class EnhancedTileMap(pygame.sprite.Sprite):
         try:
             with open(map_file_path, 'r') as f:
                 map_lines = [line.rstrip('\n') for line in f.readlines()]
-            return self.load_map_from_data(map_lines)
+            tile_map = self.load_map_from_data(map_lines)
         except FileNotFoundError:
             print(f"Map file {map_file_path} not found, creating Zelda-style map")
-            return self.create_zelda_style_map()
+            tile_map = self.create_zelda_style_map()
+
+        # Render the whole map once so each frame is a single viewport blit
+        self.bake_map(tile_map)
+        return tile_map
 
     def create_zelda_style_map(self):
         """Create a Zelda-style map similar to the reference image"""
@@ -223,8 +244,66 @@ class EnhancedTileMap(pygame.sprite.Sprite):
         """Create a default map if no map file exists"""
         return self.create_zelda_style_map()
 
+    def _blit_tile(self, surface, tile_map, row, column, dest_x, dest_y):
+        """Blit a single tile from the tileset onto a surface"""
+        try:
+            surface.blit(self.tiles, (dest_x, dest_y), tile_map[row][column])
+        except:
+            # Fallback if tile coordinates are invalid
+            pygame.draw.rect(surface, (34, 139, 34),
+                             (dest_x, dest_y, self.tile_size, self.tile_size))
+
+    def bake_map(self, tile_map):
+        """Render the whole tile map once into a world-sized surface"""
+        world_width, world_height = self.get_world_pixel_size()
+        self.baked_surface = pygame.Surface((world_width, world_height))
+        if pygame.display.get_surface():
+            # Match the display format so the per-frame blit is a straight copy
+            self.baked_surface = self.baked_surface.convert()
+
+        self.baked_surface.fill((34, 139, 34))
+        for x in range(min(len(tile_map), self.map_height)):
+            for y in range(min(len(tile_map[x]), self.map_width)):
+                self._blit_tile(self.baked_surface, tile_map, x, y,
+                                y * self.tile_size, x * self.tile_size)
+
+        self.baked_tiles = tile_map
+        self.dirty_tiles.clear()
+
+    def invalidate_tile(self, row, column):
+        """Mark a single cell of the baked map for re-rendering"""
+        if 0 <= row < self.map_height and 0 <= column < self.map_width:
+            self.dirty_tiles.add((row, column))
+
+    def set_tile(self, tile_map, row, column, tile):
+        """Change one tile (map character or tileset rect) and invalidate only that cell"""
+        if not (0 <= row < len(tile_map) and 0 <= column < len(tile_map[row])):
+            return False
+
+        if isinstance(tile, str):
+            tile = TILE_COORDS.get(tile, (0, 0, 24, 24))
+        tile_map[row][column] = tile
+
+        if tile_map is self.baked_tiles:
+            self.invalidate_tile(row, column)
+        return True
+
+    def _rebake_dirty_tiles(self):
+        """Re-render only the cells that changed since the last bake"""
+        for row, column in self.dirty_tiles:
+            self._blit_tile(self.baked_surface, self.baked_tiles, row, column,
+                            column * self.tile_size, row * self.tile_size)
+        self.dirty_tiles.clear()
+
     def draw(self, tile_map, screen, offset_x=0, offset_y=0):
         """Draw the tile map with optional camera offset"""
+        # Baked mode - one blit of the pre-rendered map, clipped to the screen
+        if self.baked_surface is not None and tile_map is self.baked_tiles:
+            if self.dirty_tiles:
+                self._rebake_dirty_tiles()
+            screen.blit(self.baked_surface, (offset_x, offset_y))
+            return
+
         for x in range(self.map_height):
             for y in range(self.map_width):
                 if x < len(tile_map) and y < len(tile_map[x]):
@@ -234,12 +313,7 @@ class EnhancedTileMap(pygame.sprite.Sprite):
                     # Only draw tiles that are visible on screen
                     if (-self.tile_size < screen_x < screen.get_width() and
                             -self.tile_size < screen_y < screen.get_height()):
-                        try:
-                            screen.blit(self.tiles, (screen_x, screen_y), tile_map[x][y])
-                        except:
-                            # Fallback if tile coordinates are invalid
-                            pygame.draw.rect(screen, (34, 139, 34),
-                                             (screen_x, screen_y, self.tile_size, self.tile_size))
+                        self._blit_tile(screen, tile_map, x, y, screen_x, screen_y)
 
     def get_tile_at_position(self, world_x, world_y):
         """Get the tile type at a specific world position"""
@@ -252,12 +326,27 @@ class EnhancedTileMap(pygame.sprite.Sprite):
 
     def is_position_walkable(self, world_x, world_y):
         """Check if a position is walkable (for collision detection)"""
-        tile_x, tile_y = self.get_tile_at_position(world_x, world_y)
+        tile_x, tile_y = self.get_tile_at_position(int(world_x), int(world_y))
 
         if tile_x is None or tile_y is None:
-            return False
-
-        # All tiles are walkable in this version
+            return False  # Outside the map boundary
+
+        return self.walkable[tile_y * self.map_width + tile_x] == 1
+
+    def is_area_walkable(self, world_x, world_y, width, height):
+        """Check if every tile under a rectangle is walkable (only looks at the few tiles it covers)"""
+        world_width, world_height = self.get_world_pixel_size()
+        if world_x < 0 or world_y < 0 or world_x + width > world_width or world_y + height > world_height:
+            return False  # Map boundary
+
+        size = self.tile_size
+        walkable = self.walkable
+        first_column = int(world_x) // size
+        last_column = int(world_x + width - 1) // size
+        for row in range(int(world_y) // size, int(world_y + height - 1) // size + 1):
+            row_start = row * self.map_width
+            if 0 in walkable[row_start + first_column:row_start + last_column + 1]:
+                return False
         return True
 
     def get_world_pixel_size(self):
@@ -0,0 +1,153 @@
+class Timer:
+    """One scheduled callback, due at an absolute logic tick"""
+    __slots__ = ("key", "due", "callback", "persist", "cancelled")
+
+    def __init__(self, key, due, callback, persist):
+        self.key = key
+        self.due = due
+        self.callback = callback
+        self.persist = persist  # Saved with the character (cooldowns)
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Hierarchical timer wheel on logic ticks - scheduling is O(1) and each tick only touches expiring timers
+
+    Level 0 has one slot per tick, each higher level one slot per full turn of the level below.
+    Timers further out than the top level wait in an overflow list until the wheel gets round to them.
+    """
+
+    def __init__(self, slot_bits=6, levels=3):
+        self.slot_bits = slot_bits
+        self.slot_mask = (1 << slot_bits) - 1
+        self.wheels = [[[] for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self.overflow = []
+        self.now = 0  # Logic ticks since the wheel was created
+
+        self.keyed = {}  # key -> timer, a key only ever has one pending timer
+        self.pending = set()
+
+        # Statistics
+        self.fired = 0
+        self.cascaded = 0
+
+    def schedule(self, delay, callback=None, key=None, persist=False):
+        """Call callback (if any) after delay logic ticks, returns the timer
+
+        Scheduling a key that is already pending replaces the old timer.
+        """
+        if key is not None:
+            self.cancel(key)
+        timer = Timer(key, self.now + max(1, int(delay)), callback, persist)
+        if key is not None:
+            self.keyed[key] = timer
+        self.pending.add(timer)
+        self.insert(timer)
+        return timer
+
+    def insert(self, timer):
+        """Put a timer in the slot for its due tick"""
+        delta = timer.due - self.now
+        bits = self.slot_bits
+        for level, wheel in enumerate(self.wheels):
+            if delta < 1 << (bits * (level + 1)):
+                wheel[(timer.due >> (bits * level)) & self.slot_mask].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def get(self, key):
+        """Get the pending timer for a key, or None"""
+        return self.keyed.get(key)
+
+    def cancel(self, timer_or_key):
+        """Cancel a timer (or the timer pending under a key) - it is dropped when its slot comes round"""
+        timer = self.keyed.get(timer_or_key) if not isinstance(timer_or_key, Timer) else timer_or_key
+        if timer is None or timer.cancelled:
+            return
+        timer.cancelled = True
+        self.pending.discard(timer)
+        if timer.key is not None and self.keyed.get(timer.key) is timer:
+            del self.keyed[timer.key]
+
+    def remaining(self, timer_or_key):
+        """Get the ticks left on a timer (or a key's timer), 0 if it isn't pending"""
+        timer = self.keyed.get(timer_or_key) if not isinstance(timer_or_key, Timer) else timer_or_key
+        if timer is None or timer.cancelled:
+            return 0
+        return max(0, timer.due - self.now)
+
+    def advance(self):
+        """Move on one logic tick and fire the timers that are due"""
+        self.now += 1
+        bits = self.slot_bits
+        mask = self.slot_mask
+
+        # Starting a new turn of level 0 - bring the next slot of each higher level down
+        if self.now & mask == 0:
+            for level in range(1, len(self.wheels)):
+                self.cascade(self.wheels[level], (self.now >> (bits * level)) & mask)
+                if (self.now >> (bits * level)) & mask != 0:
+                    break
+            else:
+                overflow = self.overflow
+                self.overflow = []
+                self.reinsert(overflow)
+
+        slot = self.wheels[0][self.now & mask]
+        if not slot:
+            return
+        due = slot[:]
+        del slot[:]
+        for timer in due:
+            if timer.cancelled:
+                continue
+            if timer.due > self.now:
+                self.insert(timer)
+                continue
+            self.pending.discard(timer)
+            if timer.key is not None and self.keyed.get(timer.key) is timer:
+                del self.keyed[timer.key]
+            timer.cancelled = True  # Fired timers are finished
+            self.fired += 1
+            if timer.callback:
+                timer.callback()
+
+    def cascade(self, wheel, index):
+        """Re-insert the timers of one higher level slot now they are closer"""
+        timers = wheel[index]
+        if timers:
+            wheel[index] = []
+            self.reinsert(timers)
+
+    def reinsert(self, timers):
+        """Re-insert timers that are still pending"""
+        for timer in timers:
+            if not timer.cancelled:
+                self.cascaded += 1
+                self.insert(timer)
+
+    def get_pending(self):
+        """Get (key, ticks remaining) for every pending timer, soonest first - for debugging and inspection"""
+        return sorted(((timer.key, timer.due - self.now) for timer in self.pending), key=lambda item: item[1])
+
+    def save_state(self):
+        """Get the persistent timers as {key: ticks remaining} for saving"""
+        return {timer.key: timer.due - self.now for timer in self.pending if timer.persist and timer.key is not None}
+
+    def load_state(self, state):
+        """Replace the persistent timers with saved ones (callbacks are not saved - owners read remaining())"""
+        for timer in list(self.pending):
+            if timer.persist:
+                self.cancel(timer)
+        for key, ticks in (state or {}).items():
+            if ticks > 0:
+                self.schedule(ticks, key=key, persist=True)
+
+    def get_stats(self):
+        """Get wheel counters"""
+        return {
+            "pending": len(self.pending),
+            "tick": self.now,
+            "fired": self.fired,
+            "cascaded": self.cascaded
+        }
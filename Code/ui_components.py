@@ -1,6 +1,9 @@
 import pygame
 import random
 import math
+from collections import OrderedDict
+from Code.game_clock import seconds_to_ticks
+from Code.entity_store import StoredEntity, HarvestableEntity
 
 # Color constants - ensuring all values are valid (0-255)
 WHITE = (255, 255, 255)
@@ -55,6 +58,207 @@ def clamp_color(color):
         return WHITE  # Fallback to white for invalid colors
 
 
+class FontRegistry:
+    """Process-wide registry so each (font name, size) is only loaded once"""
+
+    def __init__(self):
+        self.fonts = {}  # (name, size) -> pygame.font.Font
+        self.font_keys = {}  # id(font) -> (name, size)
+
+    def get(self, size, name=None):
+        """Get a shared font, loading it on first use"""
+        key = (name, int(size))
+        font = self.fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(name, key[1])
+            except (OSError, FileNotFoundError):
+                # Missing font file - fall back to the default font at the same size
+                font = pygame.font.Font(None, key[1])
+            self.fonts[key] = font
+            self.font_keys[id(font)] = key
+        return font
+
+    def key_for(self, font):
+        """Get the (name, size) key of a registered font, or None"""
+        return self.font_keys.get(id(font))
+
+
+class SurfaceCache:
+    """Base for the LRU surface caches - lookup/store with hit and miss counters"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """Get a cached surface (counted as a hit), or None (counted as a miss)"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        else:
+            self.misses += 1
+        return surface
+
+    def store(self, key, surface):
+        """Add a surface, dropping the least recently used one past max_entries"""
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Get cache hit/miss counters"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+
+class TextCache(SurfaceCache):
+    """LRU cache of rendered text surfaces keyed by (font, size, text, color, antialias)"""
+
+    def __init__(self, font_registry, max_entries=1024):
+        super().__init__(max_entries)
+        self.font_registry = font_registry
+
+    def render(self, font, text, color, antialias=True, alpha=None):
+        """Get a rendered text surface, only rasterising glyphs on a cache miss"""
+        text = str(text)
+        font_key = self.font_registry.key_for(font)
+        if font_key is None:
+            # Unregistered font - render directly, it has no stable cache key
+            self.misses += 1
+            surface = font.render(text, antialias, color)
+        else:
+            key = (font_key[0], font_key[1], text, tuple(color), antialias)
+            surface = self.lookup(key)
+            if surface is None:
+                surface = self.store(key, font.render(text, antialias, color))
+
+        # Surfaces are shared, so always reset the alpha set by the previous user
+        surface.set_alpha(255 if alpha is None else alpha)
+        return surface
+
+
+FONT_REGISTRY = FontRegistry()
+TEXT_CACHE = TextCache(FONT_REGISTRY)
+
+
+def get_font(size, name=None):
+    """Get a shared font from the process-wide font registry"""
+    return FONT_REGISTRY.get(size, name)
+
+
+def render_text(font, text, color, antialias=True, alpha=None):
+    """Render text through the shared text cache (do not modify the returned surface)"""
+    return TEXT_CACHE.render(font, text, color, antialias, alpha)
+
+
+class GradientCache(SurfaceCache):
+    """LRU cache of pre-built vertical gradient surfaces keyed by (color1, color2, size)"""
+
+    def __init__(self, max_entries=64):
+        super().__init__(max_entries)
+
+    def build(self, color1, color2, width, height):
+        """Build a gradient surface one line per row (same output as the old per-frame drawing)"""
+        # pygame.draw.line includes both end points, so the gradient is one pixel wider than the rect
+        surface = pygame.Surface((width + 1, max(1, height)))
+        for y in range(height):
+            ratio = y / height if height > 0 else 0
+            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+            line_color = clamp_color((r, g, b))
+            pygame.draw.line(surface, line_color, (0, y), (width, y))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def get(self, color1, color2, width, height):
+        """Get a gradient surface, building it on a cache miss"""
+        key = (tuple(color1), tuple(color2), width, height)
+        surface = self.lookup(key)
+        if surface is None:
+            surface = self.store(key, self.build(color1, color2, width, height))
+        return surface
+
+
+GRADIENT_CACHE = GradientCache()
+
+
+class SpriteCache(SurfaceCache):
+    """LRU cache of pre-rasterised world object sprites keyed by (type, variant, state, frame)"""
+
+    def __init__(self, max_entries=512, padding=8):
+        super().__init__(max_entries)
+        self.padding = padding  # Room around the object for shapes that overhang its width/height
+
+    def get(self, key, width, height, draw_func):
+        """Get a sprite, calling draw_func(surface, x, y) to rasterise it on a cache miss"""
+        sprite = self.lookup(key)
+        if sprite is not None:
+            return sprite
+
+        sprite = pygame.Surface((width + self.padding * 2, height + self.padding * 2), pygame.SRCALPHA)
+        draw_func(sprite, self.padding, self.padding)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return self.store(key, sprite)
+
+    def blit(self, screen, key, screen_x, screen_y, width, height, draw_func):
+        """Draw a cached sprite with the object's top-left corner at (screen_x, screen_y)"""
+        sprite = self.get(key, width, height, draw_func)
+        screen.blit(sprite, (int(screen_x) - self.padding, int(screen_y) - self.padding))
+
+
+SPRITE_CACHE = SpriteCache()
+
+
+class MaskCache(SurfaceCache):
+    """LRU cache of collision masks built from the baked sprites, keyed like the sprite cache"""
+
+    def __init__(self, sprite_cache, max_entries=128):
+        super().__init__(max_entries)
+        self.sprite_cache = sprite_cache
+
+    def get(self, key, obj, draw_func):
+        """Get the sprite pixels under obj's collision rect as a mask (same for every object of the type)"""
+        mask = self.lookup(key)
+        if mask is not None:
+            return mask
+
+        sprite = self.sprite_cache.get(key, obj.width, obj.height, draw_func)
+        sprite_mask = pygame.mask.from_surface(sprite)
+
+        # Crop to the collision rect (the sprite has padding around the object's top-left corner)
+        rect = obj.get_rect()
+        mask = pygame.mask.Mask(rect.size)
+        offset_x = obj.x - rect.x - self.sprite_cache.padding
+        offset_y = obj.y - rect.y - self.sprite_cache.padding
+        mask.draw(sprite_mask, (offset_x, offset_y))
+        return self.store(key, mask)
+
+
+MASK_CACHE = MaskCache(SPRITE_CACHE)
+BRUSH_REST_RADII = (8, 8, 8, 8)  # Brush circles between breaths, used for its collision mask
+
+# Frame ring lengths for animations that do not repeat on a whole number of frames
+STREAM_FLOW_FRAMES = 21  # ~one wave period of sin(x * 0.3)
+DUNGEON_GLOW_FRAMES = 126  # ~two glow periods of sin(t * 0.1) and three pulse periods of sin(t * 0.15)
+
+
 class HealthManaBar:
     """Health and Mana bar display component"""
 
@@ -68,7 +272,7 @@ class HealthManaBar:
         self.bar_color = clamp_color(bar_color)
         self.bg_color = clamp_color(bg_color)
         self.label = label
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
 
     def update(self, current_value, max_value=None):
         self.current_value = max(0, current_value)
@@ -91,7 +295,7 @@ class HealthManaBar:
 
         # Draw label text
         text = f"{self.label}: {int(self.current_value)}/{int(self.max_value)}"
-        text_surface = self.font.render(text, True, WHITE)
+        text_surface = render_text(self.font, text, WHITE)
         text_x = self.x + (self.width - text_surface.get_width()) // 2
         text_y = self.y + (self.height - text_surface.get_height()) // 2
         screen.blit(text_surface, (text_x, text_y))
@@ -105,29 +309,28 @@ class DamageText:
         self.y = y
         self.text = text
         self.color = clamp_color(color)
-        self.timer = 60
-        self.font = pygame.font.Font(None, 28)
+        self.duration = seconds_to_ticks(4)
+        self.timer = self.duration
+        self.font = get_font(28)
         self.alpha = 255
         self.world_pos = None  # For world coordinate tracking
 
     def update(self):
         self.timer -= 1
         self.y -= 2
-        self.alpha = max(0, int(255 * (self.timer / 60)))
+        self.alpha = max(0, int(255 * (self.timer / self.duration)))
         return self.timer > 0
 
     def draw(self, screen):
-        text_surface = self.font.render(str(self.text), True, self.color)
-        text_surface.set_alpha(self.alpha)
+        text_surface = render_text(self.font, self.text, self.color, alpha=self.alpha)
         screen.blit(text_surface, (int(self.x), int(self.y)))
 
     def draw_at_world_pos(self, screen, camera):
         """Draw damage text at world position using camera"""
         if self.world_pos:
             screen_x, screen_y = camera.world_to_screen(self.world_pos[0], self.world_pos[1])
-            screen_y -= (60 - self.timer) * 2  # Float upward
-            text_surface = self.font.render(str(self.text), True, self.color)
-            text_surface.set_alpha(self.alpha)
+            screen_y -= (self.duration - self.timer) * 2  # Float upward
+            text_surface = render_text(self.font, self.text, self.color, alpha=self.alpha)
             screen.blit(text_surface, (int(screen_x), int(screen_y)))
         else:
             self.draw(screen)
@@ -160,8 +363,10 @@ class ParticleSystem:
                                (int(particle['x']), int(particle['y'])), int(particle['size']))
 
 
-class RestArea:
+class RestArea(StoredEntity):
     """Rest area for healing and mana restoration"""
+    __slots__ = ("rect",)
+    rest_cost = 75
 
     def __init__(self, x, y):
         self.x = x
@@ -169,7 +374,6 @@ class RestArea:
         self.width = 60
         self.height = 60
         self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.rest_cost = 75
         self.active = True  # Required by collision detection system
 
     def draw(self, screen, camera_x=0, camera_y=0):
@@ -194,14 +398,16 @@ class RestArea:
             pygame.draw.polygon(screen, BLACK, tent_points, 2)
 
             # Rest label
-            rest_font = pygame.font.Font(None, 16)
-            text = rest_font.render("REST", True, WHITE)
+            text = render_text(get_font(16), "REST", WHITE)
             text_rect = text.get_rect(center=(screen_x + 30, screen_y - 10))
             screen.blit(text, text_rect)
 
 
-class Tree:
+class Tree(HarvestableEntity):
     """Tree object for environmental decoration and possible interaction"""
+    __slots__ = ("tree_type", "collision_rect", "trunk_color", "leaf_color", "trunk_width", "leaf_radius")
+    max_respawn_time = seconds_to_ticks(40)
+    material = "Wood"
 
     def __init__(self, x, y, tree_type="normal"):
         self.x = x
@@ -212,8 +418,6 @@ class Tree:
         self.active = True
         self.harvestable = True
         self.respawn_timer = 0
-        self.max_respawn_time = 600  # 10 minutes
-        self.material = "Wood"
         self.collision_rect = pygame.Rect(x + 10, y + 35, 20, 25)  # Smaller collision for trunk only
 
         # Different tree types for visual variety
@@ -241,6 +445,11 @@ class Tree:
         """Check if this tree blocks player movement"""
         return True  # Trees block movement
 
+    def get_mask(self):
+        """Get the collision mask (unswayed sprite pixels over the trunk rect)"""
+        return MASK_CACHE.get(("tree", self.tree_type, self.harvestable, 0), self,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, 0))
+
     def can_harvest(self):
         """Check if tree can be harvested"""
         return self.active and self.harvestable
@@ -253,13 +462,6 @@ class Tree:
             return self.material
         return None
 
-    def update(self):
-        """Update respawn timer"""
-        if not self.harvestable and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.harvestable = True
-
     def draw(self, screen, camera, animation_timer=0):
         """Draw the tree with camera offset"""
         if not self.active:
@@ -269,49 +471,55 @@ class Tree:
 
         # Only draw if visible on screen
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            # Draw trunk
-            trunk_x = screen_x + (self.width - self.trunk_width) // 2
-            trunk_y = screen_y + self.height - 25
-            pygame.draw.rect(screen, self.trunk_color,
-                             (trunk_x, trunk_y, self.trunk_width, 20))
-
-            # Draw leaves (circle for canopy)
-            leaf_center_x = screen_x + self.width // 2
-            leaf_center_y = screen_y + 20
-
-            # Add slight swaying animation
+            # Add slight swaying animation (only a few distinct offsets, each baked once)
             sway = int(2 * math.sin(animation_timer * 0.05 + self.x * 0.01))
-            leaf_center_x += sway
-
-            # Change color based on harvestable status
-            current_leaf_color = self.leaf_color if self.harvestable else (50, 50, 50)
-
-            pygame.draw.circle(screen, current_leaf_color,
-                               (leaf_center_x, leaf_center_y), self.leaf_radius)
-            pygame.draw.circle(screen, BLACK,
-                               (leaf_center_x, leaf_center_y), self.leaf_radius, 2)
-
-            # Add some detail to make it look more tree-like
-            if self.tree_type == "pine":
-                # Draw pine tree shape (triangle layers)
-                for i in range(3):
-                    layer_y = leaf_center_y + i * 8
-                    layer_size = self.leaf_radius - i * 3
-                    points = [
-                        (leaf_center_x, layer_y - layer_size),
-                        (leaf_center_x - layer_size, layer_y + layer_size // 2),
-                        (leaf_center_x + layer_size, layer_y + layer_size // 2)
-                    ]
-                    pygame.draw.polygon(screen, self.leaf_color, points)
-                    pygame.draw.polygon(screen, BLACK, points, 1)
+            SPRITE_CACHE.blit(screen, ("tree", self.tree_type, self.harvestable, sway),
+                              screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, sway))
+
+    def draw_sprite(self, surface, x, y, sway):
+        """Rasterise the tree with its top-left corner at (x, y)"""
+        # Draw trunk
+        trunk_x = x + (self.width - self.trunk_width) // 2
+        trunk_y = y + self.height - 25
+        pygame.draw.rect(surface, self.trunk_color,
+                         (trunk_x, trunk_y, self.trunk_width, 20))
+
+        # Draw leaves (circle for canopy)
+        leaf_center_x = x + self.width // 2 + sway
+        leaf_center_y = y + 20
+
+        # Change color based on harvestable status
+        current_leaf_color = self.leaf_color if self.harvestable else (50, 50, 50)
+
+        pygame.draw.circle(surface, current_leaf_color,
+                           (leaf_center_x, leaf_center_y), self.leaf_radius)
+        pygame.draw.circle(surface, BLACK,
+                           (leaf_center_x, leaf_center_y), self.leaf_radius, 2)
+
+        # Add some detail to make it look more tree-like
+        if self.tree_type == "pine":
+            # Draw pine tree shape (triangle layers)
+            for i in range(3):
+                layer_y = leaf_center_y + i * 8
+                layer_size = self.leaf_radius - i * 3
+                points = [
+                    (leaf_center_x, layer_y - layer_size),
+                    (leaf_center_x - layer_size, layer_y + layer_size // 2),
+                    (leaf_center_x + layer_size, layer_y + layer_size // 2)
+                ]
+                pygame.draw.polygon(surface, self.leaf_color, points)
+                pygame.draw.polygon(surface, BLACK, points, 1)
 
     def draw_shadow(self, screen, camera):
         """Draw a subtle shadow beneath the tree"""
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
 
-class Rock:
+class Rock(HarvestableEntity):
     """Rock object - impassable, interactive for mining materials"""
+    __slots__ = ("rock_type", "collision_rect", "color", "material")
+    max_respawn_time = seconds_to_ticks(60)
 
     def __init__(self, x, y, rock_type="stone"):
         self.x = x
@@ -322,7 +530,6 @@ class Rock:
         self.active = True
         self.harvestable = True
         self.respawn_timer = 0
-        self.max_respawn_time = 900  # 15 minutes at 15 fps
         self.collision_rect = pygame.Rect(x + 2, y + 2, 31, 31)
 
         # Rock colors based on type
@@ -347,6 +554,10 @@ class Rock:
         """Check if this rock blocks movement"""
         return True
 
+    def get_mask(self):
+        """Get the collision mask (sprite pixels over the collision rect)"""
+        return MASK_CACHE.get(("rock", self.rock_type, self.harvestable), self, self.draw_sprite)
+
     def can_harvest(self):
         """Check if rock can be harvested"""
         return self.active and self.harvestable
@@ -359,13 +570,6 @@ class Rock:
             return self.material
         return None
 
-    def update(self):
-        """Update respawn timer"""
-        if not self.harvestable and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.harvestable = True
-
     def draw(self, screen, camera, animation_timer=0):
         """Draw the rock"""
         if not self.active:
@@ -374,24 +578,31 @@ class Rock:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            # Draw rock shape
-            rock_rect = pygame.Rect(screen_x, screen_y, self.width, self.height)
-            color = self.color if self.harvestable else (50, 50, 50)
-            pygame.draw.ellipse(screen, color, rock_rect)
-            pygame.draw.ellipse(screen, BLACK, rock_rect, 2)
-
-            # Add some texture
-            if self.harvestable:
-                for i in range(3):
-                    dot_x = screen_x + 10 + i * 8
-                    dot_y = screen_y + 15
-                    # Clamp color values to valid range
-                    texture_color = (min(255, color[0] + 20), min(255, color[1] + 20), min(255, color[2] + 20))
-                    pygame.draw.circle(screen, texture_color, (dot_x, dot_y), 2)
-
-
-class Metal:
+            SPRITE_CACHE.blit(screen, ("rock", self.rock_type, self.harvestable),
+                              screen_x, screen_y, self.width, self.height, self.draw_sprite)
+
+    def draw_sprite(self, surface, x, y):
+        """Rasterise the rock with its top-left corner at (x, y)"""
+        # Draw rock shape
+        rock_rect = pygame.Rect(x, y, self.width, self.height)
+        color = self.color if self.harvestable else (50, 50, 50)
+        pygame.draw.ellipse(surface, color, rock_rect)
+        pygame.draw.ellipse(surface, BLACK, rock_rect, 2)
+
+        # Add some texture
+        if self.harvestable:
+            for i in range(3):
+                dot_x = x + 10 + i * 8
+                dot_y = y + 15
+                # Clamp color values to valid range
+                texture_color = (min(255, color[0] + 20), min(255, color[1] + 20), min(255, color[2] + 20))
+                pygame.draw.circle(surface, texture_color, (dot_x, dot_y), 2)
+
+
+class Metal(HarvestableEntity):
     """Metal vein object - impassable, interactive for rare metals"""
+    __slots__ = ("metal_type", "collision_rect", "color", "material")
+    max_respawn_time = seconds_to_ticks(80)
 
     def __init__(self, x, y, metal_type="iron"):
         self.x = x
@@ -402,7 +613,6 @@ class Metal:
         self.active = True
         self.harvestable = True
         self.respawn_timer = 0
-        self.max_respawn_time = 1200  # 20 minutes
         self.collision_rect = pygame.Rect(x + 2, y + 2, 26, 36)
 
         # Metal types and materials
@@ -422,6 +632,10 @@ class Metal:
     def is_blocking(self):
         return True
 
+    def get_mask(self):
+        """Get the collision mask (sprite pixels over the collision rect)"""
+        return MASK_CACHE.get(("metal", self.metal_type, self.harvestable), self, self.draw_sprite)
+
     def can_harvest(self):
         return self.active and self.harvestable
 
@@ -432,12 +646,6 @@ class Metal:
             return self.material
         return None
 
-    def update(self):
-        if not self.harvestable and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.harvestable = True
-
     def draw(self, screen, camera, animation_timer=0):
         if not self.active:
             return
@@ -445,33 +653,41 @@ class Metal:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            color = self.color if self.harvestable else (30, 30, 30)
-
-            # Draw metal vein as a jagged rectangle
-            points = [
-                (screen_x + 5, screen_y),
-                (screen_x + self.width - 3, screen_y + 8),
-                (screen_x + self.width, screen_y + self.height - 5),
-                (screen_x + 3, screen_y + self.height),
-                (screen_x, screen_y + 12)
+            SPRITE_CACHE.blit(screen, ("metal", self.metal_type, self.harvestable),
+                              screen_x, screen_y, self.width, self.height, self.draw_sprite)
+
+    def draw_sprite(self, surface, x, y):
+        """Rasterise the metal vein with its top-left corner at (x, y)"""
+        color = self.color if self.harvestable else (30, 30, 30)
+
+        # Draw metal vein as a jagged rectangle
+        points = [
+            (x + 5, y),
+            (x + self.width - 3, y + 8),
+            (x + self.width, y + self.height - 5),
+            (x + 3, y + self.height),
+            (x, y + 12)
+        ]
+        pygame.draw.polygon(surface, color, points)
+        pygame.draw.polygon(surface, BLACK, points, 2)
+
+        # Add metallic shine effect
+        if self.harvestable:
+            shine_color = (min(255, color[0] + 50), min(255, color[1] + 50), min(255, color[2] + 50))
+            shine_points = [
+                (x + 8, y + 5),
+                (x + 15, y + 3),
+                (x + 18, y + 10),
+                (x + 12, y + 12)
             ]
-            pygame.draw.polygon(screen, color, points)
-            pygame.draw.polygon(screen, BLACK, points, 2)
-
-            # Add metallic shine effect
-            if self.harvestable:
-                shine_color = (min(255, color[0] + 50), min(255, color[1] + 50), min(255, color[2] + 50))
-                shine_points = [
-                    (screen_x + 8, screen_y + 5),
-                    (screen_x + 15, screen_y + 3),
-                    (screen_x + 18, screen_y + 10),
-                    (screen_x + 12, screen_y + 12)
-                ]
-                pygame.draw.polygon(screen, shine_color, shine_points)
+            pygame.draw.polygon(surface, shine_color, shine_points)
 
 
-class Stream:
+class Stream(HarvestableEntity):
     """Stream object - impassable water, provides water-based materials"""
+    __slots__ = ("collision_rect", "flow_offset")
+    max_respawn_time = seconds_to_ticks(40)
+    material = "Crystal Fragment"  # Water crystals
 
     def __init__(self, x, y):
         self.x = x
@@ -481,9 +697,7 @@ class Stream:
         self.active = True
         self.harvestable = True
         self.respawn_timer = 0
-        self.max_respawn_time = 600  # 10 minutes
         self.collision_rect = pygame.Rect(x, y, self.width, self.height)
-        self.material = "Crystal Fragment"  # Water crystals
         self.flow_offset = random.randint(0, 100)
 
     def get_rect(self):
@@ -492,6 +706,11 @@ class Stream:
     def is_blocking(self):
         return True
 
+    def get_mask(self):
+        """Get the collision mask (first flow frame)"""
+        return MASK_CACHE.get(("stream", self.harvestable, 0), self,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, 0))
+
     def can_harvest(self):
         return self.active and self.harvestable
 
@@ -502,12 +721,6 @@ class Stream:
             return self.material
         return None
 
-    def update(self):
-        if not self.harvestable and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.harvestable = True
-
     def draw(self, screen, camera, animation_timer=0):
         if not self.active:
             return
@@ -515,33 +728,41 @@ class Stream:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            # Animate water flow
-            flow = int(3 * math.sin((animation_timer + self.flow_offset) * 0.1))
-
-            base_color = (64, 164, 223) if self.harvestable else (30, 60, 90)
+            # Animate water flow through a ring of pre-baked wave frames shared by all streams
+            flow_frame = (animation_timer * 2 + self.flow_offset) % STREAM_FLOW_FRAMES
+            SPRITE_CACHE.blit(screen, ("stream", self.harvestable, flow_frame),
+                              screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, flow_frame))
+
+    def draw_sprite(self, surface, x, y, flow_frame):
+        """Rasterise the stream with its top-left corner at (x, y)"""
+        base_color = (64, 164, 223) if self.harvestable else (30, 60, 90)
+
+        # Draw stream as wavy rectangle
+        stream_rect = pygame.Rect(x, y, self.width, self.height)
+        pygame.draw.rect(surface, base_color, stream_rect)
+
+        # Add wave lines
+        for i in range(3):
+            wave_y = y + 8 + i * 6
+            wave_points = []
+            for w in range(0, self.width, 4):
+                wave_x = x + w
+                wave_offset = int(2 * math.sin((w + flow_frame) * 0.3))
+                wave_points.append((wave_x, wave_y + wave_offset))
+
+            if len(wave_points) > 1:
+                pygame.draw.lines(surface, (100, 200, 255), False, wave_points, 2)
 
-            # Draw stream as wavy rectangle
-            stream_rect = pygame.Rect(screen_x, screen_y, self.width, self.height)
-            pygame.draw.rect(screen, base_color, stream_rect)
-
-            # Add wave lines
-            for i in range(3):
-                wave_y = screen_y + 8 + i * 6
-                wave_points = []
-                for w in range(0, self.width, 4):
-                    wave_x = screen_x + w
-                    wave_offset = int(2 * math.sin((w + animation_timer * 2 + self.flow_offset) * 0.3))
-                    wave_points.append((wave_x, wave_y + wave_offset))
-
-                if len(wave_points) > 1:
-                    pygame.draw.lines(screen, (100, 200, 255), False, wave_points, 2)
-
-            # Draw border
-            pygame.draw.rect(screen, BLACK, stream_rect, 2)
+        # Draw border
+        pygame.draw.rect(surface, BLACK, stream_rect, 2)
 
 
-class Brush:
+class Brush(HarvestableEntity):
     """Brush object - impassable vegetation, provides random materials"""
+    __slots__ = ("collision_rect",)
+    max_respawn_time = seconds_to_ticks(50)
+    materials = ("Wood", "Cloth", "Leather", "Phoenix Feather", "Dragon Scale")
 
     def __init__(self, x, y):
         self.x = x
@@ -551,9 +772,7 @@ class Brush:
         self.active = True
         self.harvestable = True
         self.respawn_timer = 0
-        self.max_respawn_time = 750  # 12.5 minutes
         self.collision_rect = pygame.Rect(x + 3, y + 3, 26, 26)
-        self.materials = ["Wood", "Cloth", "Leather", "Phoenix Feather", "Dragon Scale"]
 
     def get_rect(self):
         return self.collision_rect
@@ -561,6 +780,11 @@ class Brush:
     def is_blocking(self):
         return True
 
+    def get_mask(self):
+        """Get the collision mask (circles at their resting radius)"""
+        return MASK_CACHE.get(("brush", self.harvestable, BRUSH_REST_RADII), self,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, BRUSH_REST_RADII))
+
     def can_harvest(self):
         return self.active and self.harvestable
 
@@ -571,12 +795,6 @@ class Brush:
             return random.choice(self.materials)  # Random material
         return None
 
-    def update(self):
-        if not self.harvestable and self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer <= 0:
-                self.harvestable = True
-
     def draw(self, screen, camera, animation_timer=0):
         if not self.active:
             return
@@ -584,28 +802,36 @@ class Brush:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            # Draw bush/brush
-            base_color = (34, 139, 34) if self.harvestable else (20, 70, 20)
-
-            # Draw multiple circles for bushy appearance
-            for i in range(4):
-                circle_x = screen_x + 8 + (i % 2) * 16
-                circle_y = screen_y + 8 + (i // 2) * 16
-                radius = 8 + int(2 * math.sin(animation_timer * 0.05 + i))
-
-                pygame.draw.circle(screen, base_color, (circle_x, circle_y), radius)
-                pygame.draw.circle(screen, BLACK, (circle_x, circle_y), radius, 1)
-
-            # Add some berries or details if harvestable
-            if self.harvestable:
-                for i in range(2):
-                    berry_x = screen_x + 12 + i * 8
-                    berry_y = screen_y + 10 + i * 12
-                    pygame.draw.circle(screen, RED, (berry_x, berry_y), 2)
-
-
-class Dungeon:
+            # Bushy circles breathe slightly; each radius combination is baked once
+            radii = tuple(8 + int(2 * math.sin(animation_timer * 0.05 + i)) for i in range(4))
+            SPRITE_CACHE.blit(screen, ("brush", self.harvestable, radii),
+                              screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, radii))
+
+    def draw_sprite(self, surface, x, y, radii):
+        """Rasterise the brush with its top-left corner at (x, y)"""
+        # Draw bush/brush
+        base_color = (34, 139, 34) if self.harvestable else (20, 70, 20)
+
+        # Draw multiple circles for bushy appearance
+        for i, radius in enumerate(radii):
+            circle_x = x + 8 + (i % 2) * 16
+            circle_y = y + 8 + (i // 2) * 16
+
+            pygame.draw.circle(surface, base_color, (circle_x, circle_y), radius)
+            pygame.draw.circle(surface, BLACK, (circle_x, circle_y), radius, 1)
+
+        # Add some berries or details if harvestable
+        if self.harvestable:
+            for i in range(2):
+                berry_x = x + 12 + i * 8
+                berry_y = y + 10 + i * 12
+                pygame.draw.circle(surface, RED, (berry_x, berry_y), 2)
+
+
+class Dungeon(StoredEntity):
     """Dungeon entrance that appears when all enemies are defeated"""
+    __slots__ = ("collision_rect", "animation_timer")
 
     def __init__(self, x, y):
         self.x = x
@@ -636,38 +862,15 @@ class Dungeon:
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         if camera.is_visible(self.x, self.y, self.width, self.height):
-            # Draw stone base
-            base_rect = pygame.Rect(screen_x, screen_y + 40, self.width, 40)
-            pygame.draw.rect(screen, (60, 60, 60), base_rect)
-            pygame.draw.rect(screen, BLACK, base_rect, 3)
+            # Stone base, glowing portal and archway come from a ring of pre-baked frames
+            glow_frame = animation_timer % DUNGEON_GLOW_FRAMES
+            SPRITE_CACHE.blit(screen, ("dungeon", glow_frame),
+                              screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, glow_frame))
 
-            # Draw mystical portal entrance
             portal_center_x = screen_x + self.width // 2
             portal_center_y = screen_y + 30
 
-            # Animated magical glow
-            glow_intensity = int(50 + 30 * math.sin(animation_timer * 0.1))
-            portal_color = (100 + glow_intensity, 50 + glow_intensity // 2, 200 + glow_intensity // 3)
-
-            # Draw portal circles (larger to smaller)
-            for i in range(3):
-                radius = 25 - i * 6 + int(3 * math.sin(animation_timer * 0.15 + i))
-                alpha_color = tuple(min(255, c) for c in portal_color)
-                pygame.draw.circle(screen, alpha_color, (portal_center_x, portal_center_y), radius)
-                if i == 0:
-                    pygame.draw.circle(screen, BLACK, (portal_center_x, portal_center_y), radius, 2)
-
-            # Draw stone archway
-            arch_points = [
-                (screen_x + 10, screen_y + 60),
-                (screen_x + 10, screen_y + 20),
-                (screen_x + 25, screen_y + 5),
-                (screen_x + 35, screen_y + 5),
-                (screen_x + 50, screen_y + 20),
-                (screen_x + 50, screen_y + 60)
-            ]
-            pygame.draw.lines(screen, (80, 80, 80), False, arch_points, 4)
-
             # Draw mystical particles floating around
             for i in range(5):
                 particle_angle = animation_timer * 0.08 + i * 1.26  # 1.26 ≈ 2π/5
@@ -679,17 +882,51 @@ class Dungeon:
                 pygame.draw.circle(screen, particle_color, (particle_x, particle_y), 3)
 
             # Draw "BOSS DUNGEON" text above
-            font = pygame.font.Font(None, 20)
-            text = font.render("BOSS DUNGEON", True, (255, 215, 0))  # Gold text
+            font = get_font(20)
+            text = render_text(font, "BOSS DUNGEON", (255, 215, 0))  # Gold text
             text_rect = text.get_rect(center=(portal_center_x, screen_y - 15))
 
             # Text glow effect
-            glow_surface = font.render("BOSS DUNGEON", True, (100, 50, 0))
+            glow_surface = render_text(font, "BOSS DUNGEON", (100, 50, 0))
             for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
                 screen.blit(glow_surface, (text_rect.x + dx, text_rect.y + dy))
 
             screen.blit(text, text_rect)
 
+    def draw_sprite(self, surface, x, y, glow_frame):
+        """Rasterise the dungeon entrance (without particles and label) with its top-left corner at (x, y)"""
+        # Draw stone base
+        base_rect = pygame.Rect(x, y + 40, self.width, 40)
+        pygame.draw.rect(surface, (60, 60, 60), base_rect)
+        pygame.draw.rect(surface, BLACK, base_rect, 3)
+
+        # Draw mystical portal entrance
+        portal_center_x = x + self.width // 2
+        portal_center_y = y + 30
+
+        # Animated magical glow
+        glow_intensity = int(50 + 30 * math.sin(glow_frame * 0.1))
+        portal_color = (100 + glow_intensity, 50 + glow_intensity // 2, 200 + glow_intensity // 3)
+
+        # Draw portal circles (larger to smaller)
+        for i in range(3):
+            radius = 25 - i * 6 + int(3 * math.sin(glow_frame * 0.15 + i))
+            alpha_color = tuple(min(255, c) for c in portal_color)
+            pygame.draw.circle(surface, alpha_color, (portal_center_x, portal_center_y), radius)
+            if i == 0:
+                pygame.draw.circle(surface, BLACK, (portal_center_x, portal_center_y), radius, 2)
+
+        # Draw stone archway
+        arch_points = [
+            (x + 10, y + 60),
+            (x + 10, y + 20),
+            (x + 25, y + 5),
+            (x + 35, y + 5),
+            (x + 50, y + 20),
+            (x + 50, y + 60)
+        ]
+        pygame.draw.lines(surface, (80, 80, 80), False, arch_points, 4)
+
 
 class UIRenderer:
     """Handles drawing of UI elements and menus"""
@@ -698,31 +935,41 @@ class UIRenderer:
         self.width = width
         self.height = height
 
-        # Load fonts
-        try:
-            self.title_font = pygame.font.Font(None, 64)
-            self.large_font = pygame.font.Font(None, 48)
-            self.font = pygame.font.Font(None, 28)
-            self.small_font = pygame.font.Font(None, 20)
-        except:
-            self.title_font = pygame.font.Font(None, 64)
-            self.large_font = pygame.font.Font(None, 48)
-            self.font = pygame.font.Font(None, 28)
-            self.small_font = pygame.font.Font(None, 20)
+        # Load fonts from the shared registry
+        self.title_font = get_font(64)
+        self.large_font = get_font(48)
+        self.font = get_font(28)
+        self.small_font = get_font(20)
+
+        # Selected menu option pulse is quantised to this many pixels
+        self.selection_pulse_step = 2
 
     def draw_gradient_rect(self, surface, color1, color2, rect):
         """Draw a rectangle with gradient effect"""
+        if rect.height <= 0 or rect.width < 0:
+            return
+
         color1 = clamp_color(color1)
         color2 = clamp_color(color2)
 
-        for y in range(rect.height):
-            ratio = y / rect.height if rect.height > 0 else 0
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            line_color = clamp_color((r, g, b))
-            pygame.draw.line(surface, line_color,
-                             (rect.x, rect.y + y), (rect.x + rect.width, rect.y + y))
+        # Each gradient is built once and then just blitted
+        gradient = GRADIENT_CACHE.get(color1, color2, rect.width, rect.height)
+        surface.blit(gradient, (rect.x, rect.y))
+
+    def get_menu_option_rect(self, option, index):
+        """Get the background rectangle of a draw_enhanced_menu option (sized to fit its text)"""
+        display_name = option.replace(".json", "").replace("_", " ").title()
+        text_surface = render_text(self.font, display_name, WHITE)
+        padding = 20
+        option_width = max(text_surface.get_width() + padding * 2, self.width // 3)  # Minimum width, but expand for long text
+        return pygame.Rect((self.width - option_width) // 2, 200 + index * 50 - 15, option_width,
+                           max(40, text_surface.get_height() + 20))
+
+    def get_selection_pulse(self, animation_timer):
+        """Get how far the selected menu option is grown on this animation frame"""
+        pulse = int(10 * abs(math.sin(animation_timer * 0.15)))
+        # Snap to even steps so the pulse reuses a handful of cached gradient sizes
+        return pulse - pulse % self.selection_pulse_step
 
     def draw_enhanced_menu(self, screen, title, options, selected_index, subtitle="", animation_timer=0):
         """Draw enhanced menu with animations"""
@@ -733,13 +980,13 @@ class UIRenderer:
         self.draw_gradient_rect(screen, MENU_ACCENT, MENU_HIGHLIGHT, title_bg)
 
         # Title
-        title_surface = self.large_font.render(title, True, WHITE)
+        title_surface = render_text(self.large_font, title, WHITE)
         title_rect = title_surface.get_rect(center=(self.width // 2, 100))
         screen.blit(title_surface, title_rect)
 
         # Subtitle
         if subtitle:
-            subtitle_surface = self.font.render(subtitle, True, MENU_TEXT)
+            subtitle_surface = render_text(self.font, subtitle, MENU_TEXT)
             subtitle_rect = subtitle_surface.get_rect(center=(self.width // 2, 130))
             screen.blit(subtitle_surface, subtitle_rect)
 
@@ -749,22 +996,12 @@ class UIRenderer:
 
         for i, option in enumerate(options):
             y_pos = start_y + i * option_height
-
-            # Option text (measure first to size rectangle properly)
             display_name = option.replace(".json", "").replace("_", " ").title()
-            text_surface = self.font.render(display_name, True, WHITE)  # Temp color for measurement
-            text_width = text_surface.get_width()
-            text_height = text_surface.get_height()
-
-            # Option background - size to fit text with padding
-            padding = 20
-            option_width = max(text_width + padding * 2, self.width // 3)  # Minimum width, but expand for long text
-            option_rect = pygame.Rect((self.width - option_width) // 2, y_pos - 15, option_width,
-                                      max(40, text_height + 20))
+            option_rect = self.get_menu_option_rect(option, i)
 
             if i == selected_index:
                 # Animated selection
-                pulse = int(10 * abs(math.sin(animation_timer * 0.15)))
+                pulse = self.get_selection_pulse(animation_timer)
                 expanded_rect = option_rect.inflate(pulse, pulse // 2)
                 self.draw_gradient_rect(screen, MENU_HIGHLIGHT, MENU_ACCENT, expanded_rect)
                 pygame.draw.rect(screen, MENU_SELECTED, expanded_rect, 3)
@@ -775,14 +1012,33 @@ class UIRenderer:
                 color = MENU_TEXT
 
             # Render text with final color
-            text_surface = self.font.render(display_name, True, color)
+            text_surface = render_text(self.font, display_name, color)
             text_rect = text_surface.get_rect(center=(self.width // 2, y_pos))
             screen.blit(text_surface, text_rect)
 
     def draw_status_overlay(self, screen, character_manager):
         """Draw semi-transparent status overlay in top-left corner"""
+        overlay = self.render_status_panel(character_manager)
+        if overlay:
+            screen.blit(overlay, (10, 10))
+
+    def get_status_key(self, character_manager):
+        """Get the values the status overlay depends on (used by the HUD layer to detect changes)"""
         if not character_manager or not character_manager.character_data:
-            return
+            return None
+
+        char_data = character_manager.character_data
+        level = char_data.get("Level", 1)
+        return (char_data.get("Name", "Unknown"), level,
+                char_data.get("Hit_Points", 100), char_data.get("Aspect1_Mana", 50),
+                char_data.get("Experience_Points", 0), char_data.get("Credits", 0),
+                character_manager.get_max_hp_for_level(level),
+                character_manager.get_max_mana_for_level(level))
+
+    def render_status_panel(self, character_manager):
+        """Render the status overlay panel (name, level, credits, HP/MP/XP bars) to a new surface"""
+        if not character_manager or not character_manager.character_data:
+            return None
 
         # Create semi-transparent surface (expanded height for XP bar)
         overlay = pygame.Surface((280, 140), pygame.SRCALPHA)
@@ -822,13 +1078,13 @@ class UIRenderer:
         ]
 
         for text in text_items:
-            text_surface = self.small_font.render(text, True, WHITE)
+            text_surface = render_text(self.small_font, text, WHITE)
             overlay.blit(text_surface, (10, y_pos))
             y_pos += 18
 
         # HP Bar
         y_pos += 8
-        hp_text = self.small_font.render("HP:", True, WHITE)
+        hp_text = render_text(self.small_font, "HP:", WHITE)
         overlay.blit(hp_text, (10, y_pos))
 
         # HP bar background
@@ -845,13 +1101,13 @@ class UIRenderer:
 
         # HP text on bar
         hp_value_text = f"{current_hp}/{max_hp}"
-        hp_value_surface = self.small_font.render(hp_value_text, True, WHITE)
+        hp_value_surface = render_text(self.small_font, hp_value_text, WHITE)
         hp_text_rect = hp_value_surface.get_rect(center=(145, y_pos + 8))
         overlay.blit(hp_value_surface, hp_text_rect)
 
         # Mana Bar
         y_pos += 20
-        mana_text = self.small_font.render("MP:", True, WHITE)
+        mana_text = render_text(self.small_font, "MP:", WHITE)
         overlay.blit(mana_text, (10, y_pos))
 
         # Mana bar background
@@ -868,13 +1124,13 @@ class UIRenderer:
 
         # Mana text on bar
         mana_value_text = f"{current_mana}/{max_mana}"
-        mana_value_surface = self.small_font.render(mana_value_text, True, WHITE)
+        mana_value_surface = render_text(self.small_font, mana_value_text, WHITE)
         mana_text_rect = mana_value_surface.get_rect(center=(145, y_pos + 8))
         overlay.blit(mana_value_surface, mana_text_rect)
 
         # XP Bar
         y_pos += 20
-        xp_text = self.small_font.render("XP:", True, WHITE)
+        xp_text = render_text(self.small_font, "XP:", WHITE)
         overlay.blit(xp_text, (10, y_pos))
 
         # XP bar background
@@ -894,12 +1150,11 @@ class UIRenderer:
             xp_value_text = f"{max(0, xp_progress)}/{xp_needed}"
         else:
             xp_value_text = "MAX"
-        xp_value_surface = self.small_font.render(xp_value_text, True, BLACK)
+        xp_value_surface = render_text(self.small_font, xp_value_text, BLACK)
         xp_text_rect = xp_value_surface.get_rect(center=(145, y_pos + 8))
         overlay.blit(xp_value_surface, xp_text_rect)
 
-        # Blit the overlay to the main screen
-        screen.blit(overlay, (10, 10))
+        return overlay
 
     def _get_xp_for_level(self, target_level):
         """Calculate minimum XP required for a specific level - matches game_data.py calculation"""
@@ -933,9 +1188,26 @@ class UIRenderer:
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.small_font.render(line, True, WHITE)
+            text_surface = render_text(self.small_font, line, WHITE)
             screen.blit(text_surface, (20, 20 + i * 25))
 
+    def render_instructions_panel(self, instructions):
+        """Render the instructions panel to a new surface, returns (surface, position)"""
+        panel_height = len(instructions) * 20 + 20
+        text_surfaces = [render_text(self.small_font, instruction, WHITE) for instruction in instructions]
+
+        # Long lines may run past the 400px box, so leave room for them
+        panel_width = max([400] + [text_surface.get_width() + 10 for text_surface in text_surfaces])
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        box = pygame.Rect(0, 0, 400, panel_height)
+        pygame.draw.rect(panel, UI_BG_COLOR, box)
+        pygame.draw.rect(panel, UI_BORDER_COLOR, box, 2)
+
+        for i, text_surface in enumerate(text_surfaces):
+            panel.blit(text_surface, (10, 10 + i * 20))
+
+        return panel, (10, self.height - panel_height - 10)
+
     def draw_instructions_panel(self, screen, instructions):
         """Draw instructions panel at bottom of screen"""
         panel_height = len(instructions) * 20 + 20
@@ -944,10 +1216,76 @@ class UIRenderer:
         pygame.draw.rect(screen, UI_BORDER_COLOR, instruction_panel, 2)
 
         for i, instruction in enumerate(instructions):
-            text_surface = self.small_font.render(instruction, True, WHITE)
+            text_surface = render_text(self.small_font, instruction, WHITE)
             screen.blit(text_surface, (20, self.height - panel_height + i * 20))
 
 
+class HUDLayer:
+    """Retained-mode HUD: panels are only re-rendered when their inputs change and are
+    composed into one cached surface, so a static HUD costs a single blit per frame"""
+
+    def __init__(self):
+        self.panels = OrderedDict()  # name -> {"key", "surface", "position"}, drawn in insertion order
+        self.layer = None
+        self.layer_position = (0, 0)
+        self.dirty = True
+        self.panel_renders = 0
+        self.compositions = 0
+
+    def update_panel(self, name, key, render_func):
+        """Re-render a panel only if its key changed. render_func() returns (surface, position) or None"""
+        panel = self.panels.get(name)
+        if panel is not None and panel["key"] == key:
+            return
+
+        result = render_func()
+        self.panel_renders += 1
+        if result is None or result[0] is None:
+            if panel is not None:
+                del self.panels[name]
+                self.dirty = True
+            return
+
+        surface, position = result
+        self.panels[name] = {"key": key, "surface": surface, "position": position}
+        self.dirty = True
+
+    def remove_panel(self, name):
+        """Remove a panel from the HUD"""
+        if name in self.panels:
+            del self.panels[name]
+            self.dirty = True
+
+    def invalidate(self):
+        """Force every panel to re-render on the next update"""
+        self.panels.clear()
+        self.dirty = True
+
+    def compose(self):
+        """Blit all panels into one surface covering their combined area"""
+        self.dirty = False
+        self.compositions += 1
+        if not self.panels:
+            self.layer = None
+            return
+
+        rects = [panel["surface"].get_rect(topleft=panel["position"]) for panel in self.panels.values()]
+        bounds = rects[0].unionall(rects[1:])
+
+        # Transparent pixels are copied as-is, so panels keep their own per-pixel alpha
+        self.layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for panel, rect in zip(self.panels.values(), rects):
+            self.layer.blit(panel["surface"], (rect.x - bounds.x, rect.y - bounds.y))
+        self.layer_position = bounds.topleft
+
+    def draw(self, screen):
+        """Draw the composed HUD"""
+        if self.dirty:
+            self.compose()
+        if self.layer:
+            screen.blit(self.layer, self.layer_position)
+
+
 class Camera:
     """Camera system for following the player"""
 
@@ -984,8 +1322,9 @@ class Camera:
                 -obj_height < screen_y < self.screen_height)
 
 
-class WorldObject:
+class WorldObject(StoredEntity):
     """Base class for world objects (enemies, loot, stores, etc.)"""
+    __slots__ = ("obj_type",)
 
     def __init__(self, x, y, obj_type, active=True):
         self.x = x
@@ -1011,6 +1350,7 @@ class WorldObject:
 
 class Enemy(WorldObject):
     """Enemy object with pulsing red appearance"""
+    __slots__ = ("enemy_data",)
 
     def __init__(self, x, y, enemy_data=None):
         super().__init__(x, y, "enemy")
@@ -1026,21 +1366,24 @@ class Enemy(WorldObject):
         if camera.is_visible(self.x, self.y, self.width, self.height):
             # Smaller sparkling enemy effect
             sparkle = int(5 * abs(math.sin(animation_timer * 0.15)))  # Reduced sparkle
-            treasure_radius = 10 + sparkle  # Smaller radius
-            pygame.draw.circle(screen, RED,
-                               (int(screen_x + 10), int(screen_y + 10)), treasure_radius)
-            pygame.draw.circle(screen, BLACK,
-                               (int(screen_x + 10), int(screen_y + 10)), treasure_radius, 2)
-
-            # Draw "E" symbol
-            font = pygame.font.Font(None, 16)  # Smaller font
-            text = font.render("E", True, BLACK)
-            text_rect = text.get_rect(center=(int(screen_x + 10), int(screen_y + 10)))
-            screen.blit(text, text_rect)
+            SPRITE_CACHE.blit(screen, ("enemy", sparkle), screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, sparkle))
+
+    def draw_sprite(self, surface, x, y, sparkle):
+        """Rasterise the enemy marker with its top-left corner at (x, y)"""
+        treasure_radius = 10 + sparkle  # Smaller radius
+        pygame.draw.circle(surface, RED, (x + 10, y + 10), treasure_radius)
+        pygame.draw.circle(surface, BLACK, (x + 10, y + 10), treasure_radius, 2)
+
+        # Draw "E" symbol
+        text = render_text(get_font(16), "E", BLACK)  # Smaller font
+        text_rect = text.get_rect(center=(x + 10, y + 10))
+        surface.blit(text, text_rect)
 
 
 class Treasure(WorldObject):
     """Treasure object with smaller sparkling gold appearance"""
+    __slots__ = ("value",)
 
     def __init__(self, x, y, value=None):
         super().__init__(x, y, "treasure")
@@ -1057,21 +1400,24 @@ class Treasure(WorldObject):
         if camera.is_visible(self.x, self.y, self.width, self.height):
             # Smaller sparkling treasure effect
             sparkle = int(5 * abs(math.sin(animation_timer * 0.15)))  # Reduced sparkle
-            treasure_radius = 10 + sparkle  # Smaller radius
-            pygame.draw.circle(screen, GOLD,
-                               (int(screen_x + 10), int(screen_y + 10)), treasure_radius)
-            pygame.draw.circle(screen, BLACK,
-                               (int(screen_x + 10), int(screen_y + 10)), treasure_radius, 2)
-
-            # Draw "$" symbol
-            font = pygame.font.Font(None, 16)  # Smaller font
-            text = font.render("$", True, BLACK)
-            text_rect = text.get_rect(center=(int(screen_x + 10), int(screen_y + 10)))
-            screen.blit(text, text_rect)
+            SPRITE_CACHE.blit(screen, ("treasure", sparkle), screen_x, screen_y, self.width, self.height,
+                              lambda surface, x, y: self.draw_sprite(surface, x, y, sparkle))
+
+    def draw_sprite(self, surface, x, y, sparkle):
+        """Rasterise the treasure marker with its top-left corner at (x, y)"""
+        treasure_radius = 10 + sparkle  # Smaller radius
+        pygame.draw.circle(surface, GOLD, (x + 10, y + 10), treasure_radius)
+        pygame.draw.circle(surface, BLACK, (x + 10, y + 10), treasure_radius, 2)
+
+        # Draw "$" symbol
+        text = render_text(get_font(16), "$", BLACK)  # Smaller font
+        text_rect = text.get_rect(center=(x + 10, y + 10))
+        surface.blit(text, text_rect)
 
 
 class Shop(WorldObject):
     """Shop object with animated store appearance"""
+    __slots__ = ()
 
     def __init__(self, x, y):
         super().__init__(x, y, "shop")
@@ -1087,39 +1433,41 @@ class Shop(WorldObject):
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
         # Always try to draw the shop regardless of visibility check
-        # Animated store with better shop icon
-        store_rect = pygame.Rect(int(screen_x), int(screen_y), self.width, self.height)
-        pygame.draw.rect(screen, PURPLE, store_rect)
-        pygame.draw.rect(screen, WHITE, store_rect, 3)
-
-        # Shop building details
-        # Roof
-        roof_points = [
-            (int(screen_x + 5), int(screen_y + 15)),
-            (int(screen_x + 25), int(screen_y + 5)),
-            (int(screen_x + 45), int(screen_y + 15))
-        ]
-        pygame.draw.polygon(screen, (100, 50, 150), roof_points)
-
-        # Door
-        door_rect = pygame.Rect(int(screen_x + 20), int(screen_y + 25), 10, 20)
-        pygame.draw.rect(screen, (80, 40, 0), door_rect)
-
-        # Window
-        window_rect = pygame.Rect(int(screen_x + 10), int(screen_y + 25), 8, 8)
-        pygame.draw.rect(screen, (200, 200, 255), window_rect)
+        # Animated store with better shop icon (building is static, baked once)
+        SPRITE_CACHE.blit(screen, ("shop",), screen_x, screen_y, self.width, self.height, self.draw_sprite)
 
         # Shop sign with pulse effect
         pulse = int(3 * abs(math.sin(animation_timer * 0.1)))
         font_size = 16 + pulse
         try:
-            font = pygame.font.Font(None, font_size)
-            shop_text = font.render("SHOP", True, GOLD)
+            shop_text = render_text(get_font(font_size), "SHOP", GOLD)
             shop_rect_text = shop_text.get_rect(center=(int(screen_x + 25), int(screen_y - 8)))
             screen.blit(shop_text, shop_rect_text)
         except:
             # Fallback if font creation fails
-            font = pygame.font.Font(None, 16)
-            shop_text = font.render("SHOP", True, GOLD)
+            shop_text = render_text(get_font(16), "SHOP", GOLD)
             shop_rect_text = shop_text.get_rect(center=(int(screen_x + 25), int(screen_y - 8)))
-            screen.blit(shop_text, shop_rect_text)
\ No newline at end of file
+            screen.blit(shop_text, shop_rect_text)
+
+    def draw_sprite(self, surface, x, y):
+        """Rasterise the shop building with its top-left corner at (x, y)"""
+        store_rect = pygame.Rect(x, y, self.width, self.height)
+        pygame.draw.rect(surface, PURPLE, store_rect)
+        pygame.draw.rect(surface, WHITE, store_rect, 3)
+
+        # Shop building details
+        # Roof
+        roof_points = [
+            (x + 5, y + 15),
+            (x + 25, y + 5),
+            (x + 45, y + 15)
+        ]
+        pygame.draw.polygon(surface, (100, 50, 150), roof_points)
+
+        # Door
+        door_rect = pygame.Rect(x + 20, y + 25, 10, 20)
+        pygame.draw.rect(surface, (80, 40, 0), door_rect)
+
+        # Window
+        window_rect = pygame.Rect(x + 10, y + 25, 8, 8)
+        pygame.draw.rect(surface, (200, 200, 255), window_rect)
@@ -0,0 +1,401 @@
+"""
+Headless benchmark for the full game loop.
+
+Boots EnhancedGameManager with the SDL dummy video/audio drivers, loads a fixed
+character, seeds the RNG and plays a scripted session through every level from
+1-1 to 5-4 (walking, collisions, rest, combat, store and crafting). Reports
+per-frame update/draw timings, level setup times and peak memory as JSON.
+
+Usage:
+    python benchmark.py [--character Characters/vozy.json] [--seed 1234]
+                        [--walk-frames 40] [--tracemalloc] [--output results.json]
+"""
+import os
+import sys
+
+# Must be set before pygame is initialised
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+import pygame
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+BENCHMARK_VERSION = 1
+WALK_DIRECTIONS = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+
+
+class ScriptedKeyboard:
+    """Stands in for pygame.key.get_pressed() so held movement keys can be scripted"""
+
+    def __init__(self):
+        self.held = set()
+        self.real_get_pressed = pygame.key.get_pressed
+
+    def get_pressed(self):
+        return _HeldKeys(self.held)
+
+    def install(self):
+        pygame.key.get_pressed = self.get_pressed
+
+    def uninstall(self):
+        pygame.key.get_pressed = self.real_get_pressed
+
+
+class _HeldKeys:
+    """Answers pressed_keys[K_...] lookups like pygame's ScancodeWrapper"""
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def __len__(self):
+        return 512
+
+
+class TimingSeries:
+    """Collects per-frame timings in milliseconds"""
+
+    def __init__(self):
+        self.values = []
+
+    def add(self, seconds):
+        self.values.append(seconds * 1000.0)
+
+    def summary(self):
+        if not self.values:
+            return {"frames": 0}
+        ordered = sorted(self.values)
+
+        def pick(percent):
+            return ordered[min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))]
+
+        return {
+            "frames": len(ordered),
+            "mean_ms": round(sum(ordered) / len(ordered), 4),
+            "p50_ms": round(pick(50), 4),
+            "p95_ms": round(pick(95), 4),
+            "p99_ms": round(pick(99), 4),
+            "max_ms": round(ordered[-1], 4),
+            "total_ms": round(sum(ordered), 3)
+        }
+
+
+class GameBenchmark:
+    """Drives EnhancedGameManager through a scripted, repeatable session"""
+
+    def __init__(self, character_file, seed=1234, walk_frames=40, max_combat_frames=1800):
+        self.character_file = character_file
+        self.seed = seed
+        self.walk_frames = walk_frames
+        self.max_combat_frames = max_combat_frames
+        self.keyboard = ScriptedKeyboard()
+        self.game = None
+        self.main = None
+
+        self.update_times = {}  # state name -> TimingSeries
+        self.draw_times = {}
+        self.level_results = {}
+        self.current_level = None
+
+    def boot(self):
+        """Create the game manager without touching real save files"""
+        random.seed(self.seed)
+        import main
+        from Code.save_storage import SQLiteStorage
+        self.main = main
+
+        boot_start = time.perf_counter()
+        # Keep the benchmark side-effect free: saves go to an in-memory database that is thrown away
+        game = main.EnhancedGameManager(storage=SQLiteStorage(":memory:"))
+        boot_time = time.perf_counter() - boot_start
+
+        # No character or progression writes at all
+        game.character_manager.save_character = lambda *args, **kwargs: True
+        game.level_manager.save_progression = lambda *args, **kwargs: None
+
+        if not game.character_manager.load_character(self.character_file):
+            raise RuntimeError(f"Could not load benchmark character {self.character_file}")
+
+        # Every level must be reachable
+        game.level_manager.unlocked_levels.update(game.level_manager.levels.keys())
+
+        self.game = game
+        self.state_names = {value: name for name, value in vars(main.GameState).items()
+                            if isinstance(value, int)}
+        return boot_time
+
+    def state_name(self):
+        return self.state_names.get(self.game.current_state, str(self.game.current_state))
+
+    def press(self, key):
+        """Send a single key press through the normal event handler"""
+        self.game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+
+    def frame(self):
+        """Run one logic step and one draw, recording both timings under the current state"""
+        game = self.game
+        name = self.state_name()
+
+        start = time.perf_counter()
+        game.store_previous_positions()
+        game.update()
+        middle = time.perf_counter()
+        game.draw()
+        end = time.perf_counter()
+
+        self.update_times.setdefault(name, TimingSeries()).add(middle - start)
+        self.draw_times.setdefault(name, TimingSeries()).add(end - middle)
+        level = self.level_results[self.current_level]
+        level["frames"] += 1
+        level["update"].add(middle - start)
+        level["draw"].add(end - middle)
+
+    def resolve_interrupts(self):
+        """Finish any screen the scripted walk stumbled into (fight, store)"""
+        GameState = self.main.GameState
+        if self.game.current_state == GameState.FIGHT:
+            self.play_combat()
+        elif self.game.current_state == GameState.STORE:
+            self.play_store()
+
+    def walk(self, key, frames):
+        """Hold a movement key for a number of frames"""
+        self.keyboard.held = {key}
+        for _ in range(frames):
+            self.frame()
+            if self.game.current_state != self.main.GameState.GAME_BOARD:
+                self.keyboard.held = set()
+                self.resolve_interrupts()
+                self.keyboard.held = {key}
+        self.keyboard.held = set()
+
+    def teleport_to(self, obj):
+        """Move the player onto an object so the next collision check hits it"""
+        self.game.animated_player.x = obj.x
+        self.game.animated_player.y = obj.y
+
+    def play_combat(self):
+        """Attack until the fight ends (or the frame budget runs out)"""
+        GameState = self.main.GameState
+        combat_manager = None
+        if hasattr(self.game, 'combat_integration'):
+            combat_manager = self.game.combat_integration.combat_manager
+        for _ in range(self.max_combat_frames):
+            if self.game.current_state != GameState.FIGHT:
+                break
+            # Attack as soon as it's the player's turn, like a player waiting for the prompt
+            if combat_manager is None or (combat_manager.player_turn and combat_manager.action_delay <= 0):
+                self.press(pygame.K_RETURN)
+            self.frame()
+        self.level_results[self.current_level]["events"]["combat"] += 1
+
+        # Don't let a long fight leak into the next phase
+        if self.game.current_state == GameState.FIGHT:
+            self.level_results[self.current_level]["events"]["combat_unfinished"] += 1
+            if hasattr(self.game, 'combat_integration'):
+                self.game.combat_integration.end_combat("forfeited")
+            self.game.current_state = GameState.GAME_BOARD
+
+    def play_store(self, frames=30):
+        """Browse the store for a while, then leave"""
+        for i in range(frames):
+            if i % 5 == 0:
+                self.press(pygame.K_DOWN)
+            self.frame()
+        self.press(pygame.K_ESCAPE)
+        self.frame()
+        self.level_results[self.current_level]["events"]["store"] += 1
+        if self.game.current_state == self.main.GameState.STORE:
+            self.game.current_state = self.main.GameState.GAME_BOARD
+
+    def play_crafting(self, frames=30):
+        """Open the crafting screen, move through recipes, close it"""
+        self.press(pygame.K_r)
+        for i in range(frames):
+            if i % 5 == 0:
+                self.press(pygame.K_DOWN)
+            self.frame()
+        self.press(pygame.K_ESCAPE)
+        self.frame()
+        self.level_results[self.current_level]["events"]["crafting"] += 1
+        if self.game.current_state == self.main.GameState.CRAFTING:
+            self.game.current_state = self.main.GameState.GAME_BOARD
+
+    def play_level(self, world, level):
+        """Set up a level and run the scripted session on it"""
+        game = self.game
+        GameState = self.main.GameState
+        key = f"{world}-{level}"
+        self.current_level = key
+        self.level_results[key] = {
+            "setup_ms": 0.0, "frames": 0,
+            "update": TimingSeries(), "draw": TimingSeries(),
+            "events": {"combat": 0, "combat_unfinished": 0, "store": 0, "crafting": 0, "rest": 0},
+            "objects": {}
+        }
+
+        random.seed(f"{self.seed}-{key}")
+        setup_start = time.perf_counter()
+        changed = game.change_level(world, level)
+        self.level_results[key]["setup_ms"] = round((time.perf_counter() - setup_start) * 1000, 3)
+        if not changed:
+            self.level_results[key]["error"] = "change_level failed"
+            return
+        game.current_state = GameState.GAME_BOARD
+        self.level_results[key]["objects"] = game.get_object_counts()
+
+        # Clear cooldowns left over from the previous level so every level plays the same script
+        if hasattr(game, 'combat_integration'):
+            game.combat_integration.combat_entry_cooldown = 0
+            game.combat_integration.post_combat_invulnerability = 0
+        game.rest_manager.rest_cooldown = 0
+
+        # Walking with collisions
+        for direction in WALK_DIRECTIONS:
+            self.walk(direction, self.walk_frames)
+
+        # Rest (take some damage first so resting has work to do)
+        if game.rests:
+            data = game.character_manager.character_data
+            data["Hit_Points"] = max(1, data.get("Hit_Points", 100) // 2)
+            self.teleport_to(game.rests[0])
+            self.frame()
+            self.level_results[key]["events"]["rest"] += 1
+            self.resolve_interrupts()
+
+        # Combat
+        enemies = [enemy for enemy in game.enemies if enemy.active]
+        if enemies:
+            self.teleport_to(enemies[0])
+            for _ in range(3):
+                self.frame()
+                if game.current_state == GameState.FIGHT:
+                    self.play_combat()
+                    break
+
+        # Store - walk into the shop, or open the store directly on levels without one
+        if hasattr(game, 'store_integration') and game.store_integration:
+            game.store_integration.exit_cooldown = 0
+        if game.shops:
+            self.teleport_to(game.shops[0])
+            self.frame()
+        if game.current_state != GameState.STORE:
+            game.current_state = GameState.STORE
+        self.play_store()
+
+        # Crafting
+        game.animated_player.x, game.animated_player.y = 480, 480
+        self.play_crafting()
+
+        # A little more walking back on the board
+        self.walk(pygame.K_LEFT, self.walk_frames // 2)
+
+    def run(self):
+        """Run the whole benchmark and return the results dictionary"""
+        pygame.init()
+        self.keyboard.install()
+        try:
+            boot_time = self.boot()
+            levels = sorted(self.game.level_manager.levels.keys(),
+                            key=lambda k: tuple(int(part) for part in k.split("-")))
+            run_start = time.perf_counter()
+            for level_key in levels:
+                world, level = (int(part) for part in level_key.split("-"))
+                self.play_level(world, level)
+            run_time = time.perf_counter() - run_start
+        finally:
+            self.keyboard.uninstall()
+
+        all_update = TimingSeries()
+        all_draw = TimingSeries()
+        for series in self.update_times.values():
+            all_update.values.extend(series.values)
+        for series in self.draw_times.values():
+            all_draw.values.extend(series.values)
+
+        return {
+            "benchmark_version": BENCHMARK_VERSION,
+            "seed": self.seed,
+            "character": self.character_file,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "boot_ms": round(boot_time * 1000, 3),
+            "run_s": round(run_time, 3),
+            "update": all_update.summary(),
+            "draw": all_draw.summary(),
+            "states": {
+                name: {"update": self.update_times[name].summary(),
+                       "draw": self.draw_times.get(name, TimingSeries()).summary()}
+                for name in sorted(self.update_times)
+            },
+            "levels": {
+                key: {
+                    "setup_ms": result["setup_ms"],
+                    "frames": result["frames"],
+                    "update": result["update"].summary(),
+                    "draw": result["draw"].summary(),
+                    "events": result["events"],
+                    "objects": result["objects"],
+                    **({"error": result["error"]} if "error" in result else {})
+                }
+                for key, result in self.level_results.items()
+            }
+        }
+
+
+def get_peak_rss_kb():
+    """Peak resident set size of this process in KB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless deterministic benchmark for Magitech RPG")
+    parser.add_argument("--character", default="Characters/vozy.json", help="Character file to load")
+    parser.add_argument("--seed", type=int, default=1234, help="RNG seed")
+    parser.add_argument("--walk-frames", type=int, default=40, help="Frames to hold each walk direction")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also track peak Python heap (slower, timings are not comparable)")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    benchmark = GameBenchmark(args.character, seed=args.seed, walk_frames=args.walk_frames)
+    results = benchmark.run()
+
+    results["peak_rss_kb"] = get_peak_rss_kb()
+    if args.tracemalloc:
+        results["peak_traced_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+
+    output = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"Benchmark results written to {args.output}")
+    else:
+        print(output)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
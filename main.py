@@ -1,9 +1,11 @@
 import sys
 import os
+import time
+from functools import partial
 
 # Import our custom modules
 from Code.animated_player import AnimatedPlayer
-from Code.tile_map import EnhancedTileMap
+from Code.chunked_tile_map import ChunkedTileMap
 from Code.ui_components import *
 from Code.game_data import CharacterManager, EnemyManager, create_sample_files
 from Code.character_creation import CharacterCreation
@@ -13,6 +15,17 @@ from Code.rest_system import RestManager, EnhancedRestArea
 from Code.level_system import LevelManager, WorldLevelGenerator, LevelSelectScreen
 from Code.settings_system import SettingsIntegration
 from Code.inventory_system import StoreIntegration
+from Code.display_presenter import DirtyRectPresenter
+from Code.game_clock import FixedTimestepClock
+from Code.frame_profiler import FrameProfiler, load_debug_config
+from Code.object_placement import ObjectPlacer
+from Code.entity_store import EntityStore
+from Code.timer_wheel import TimerWheel
+from Code.level_cache import LevelInstanceCache, LevelInstance
+from Code.save_queue import SaveQueue
+from Code.save_storage import load_storage_backend
+from Code.autosave import AutosaveScheduler, load_autosave_config
+from Code.spatial_hash import SpatialHash, MAP_OBJECT_KINDS, HARVEST_KINDS, INTERACT_KINDS
 
 
 class GameState:
@@ -32,14 +45,6 @@ class GameState:
     CRAFTING = 12
 
 
-def is_too_close(x, y, positions, min_distance=20):
-    """Check if (x,y) is too close to any position in positions."""
-    for px, py in positions:
-        if math.dist((x, y), (px, py)) < min_distance:
-            return True
-    return False
-
-
 def load_help_text(filepath="HELP.md") -> list[str]:
     """Load help text from a markdown file into a list of strings."""
     try:
@@ -61,7 +66,33 @@ def load_changelog_text(filepath="CHANGELOG.md") -> list[str]:
 class EnhancedGameManager:
     """Main game manager with modular architecture and enhanced combat"""
 
-    def __init__(self):
+    # Position jumps larger than this (pixels per logic step) are not interpolated
+    MAX_INTERPOLATION_DISTANCE = 48
+
+    # World objects this far outside the screen are still drawn (labels, glows and hints overhang)
+    DRAW_CULL_MARGIN = 64
+
+    # Character select shows this many saves at a time, scrolling with the selection
+    CHARACTER_LIST_ROWS = 5
+
+    # Generated level maps, in tiles (object layout positions are laid out for this size)
+    LEVEL_MAP_SIZE = (32, 24)
+
+    # Main menu entries, in selected_option order
+    MAIN_MENU_OPTIONS = ["Start Game", "Level Select", "Settings", "Help", "Quit"]
+
+    # Controls shown in the game board instructions panel (F1)
+    GAME_BOARD_INSTRUCTIONS = [
+        "Arrow Keys: Move character",
+        "SPACEBAR: Harvest rocks, metal, streams, brushes, trees",
+        "SPACEBAR: Enter boss dungeon (when available)",
+        "Rest areas: Restore HP/MP (3min cooldown)",
+        "Trees and map objects block your path",
+        "I: Inventory  C: Character  H: Help  L: Level Select  R: Crafting",
+        "F1: Toggle this panel  ESC: Main Menu"
+    ]
+
+    def __init__(self, storage=None):
         # Initialize Pygame
         pygame.init()
 
@@ -79,19 +110,38 @@ class EnhancedGameManager:
         self.show_instructions = False  # Setting to toggle instructions
 
         # Initialize subsystems
-        self.character_manager = CharacterManager()
+        self.timer_wheel = TimerWheel()  # Respawns and cooldowns, advanced once per logic tick
+        self.save_queue = SaveQueue()  # Character saves are written behind, on a background thread
+        # JSON files or the SQLite database (save_backend setting)
+        self.storage = storage if storage is not None else load_storage_backend()
+        self.character_manager = CharacterManager(self.timer_wheel, self.save_queue, self.storage)
         self.enemy_manager = EnemyManager()
 
         # Initialize level system with character-specific progression
         character_name = None
         if hasattr(self, 'character_manager') and self.character_manager.character_data:
             character_name = self.character_manager.character_data.get('Name')
-        self.level_manager = LevelManager(character_name=character_name)
+        self.level_manager = LevelManager(character_name=character_name, storage=self.storage,
+                                          save_queue=self.save_queue)
+        self.character_manager.level_manager = self.level_manager
+
+        # Saves from every system only mark what changed; it is written once per save_interval
+        self.autosave = AutosaveScheduler(*load_autosave_config())
+        self.autosave.register("character", self.character_manager.save_character_now)
+        self.autosave.register("progression", self.level_manager.save_progression_now)
+        self.autosave.register("world", self.save_world_now)
+        self.character_manager.autosave = self.autosave
+        self.level_manager.autosave = self.autosave
         self.world_generator = WorldLevelGenerator(self.level_manager)
         self.level_select_screen = None
 
         # Initialize rest system
-        self.rest_manager = RestManager(self.character_manager)
+        self.rest_manager = RestManager(self.character_manager, self.timer_wheel)
+
+        # Recently visited levels keep their world objects (older ones are spilled to disk for the session)
+        self.level_cache = LevelInstanceCache(self.rest_manager, capacity=4,
+                                              cache_dir=os.path.join("assets", "level_cache"))
+        self.loaded_level_key = None  # Level the current world objects belong to
 
         # Initialize crafting system
         from Code.crafting_system import CraftingIntegration
@@ -99,11 +149,27 @@ class EnhancedGameManager:
 
         # Initialize visual systems
         self.ui_renderer = UIRenderer(self.WIDTH, self.HEIGHT)
+        self.hud_layer = HUDLayer()
+
+        # Fixed-timestep clock: 15 Hz game logic, render rate set from Display Settings
+        self.game_clock = FixedTimestepClock(render_fps=60)
+        self.previous_positions = None
+
+        # Frame profiler / debug overlay (show_fps, show_debug_info, ... in assets/game_config.json, F3 toggles)
+        debug_flags = load_debug_config()
+        self.profiler = FrameProfiler(debug_flags)
+
+        # Dirty-rect presentation for mostly static screens (opt-in from Display Settings)
+        self.display_presenter = DirtyRectPresenter([
+            GameState.MAIN_MENU, GameState.LEVEL_SELECT, GameState.SETTINGS, GameState.INVENTORY,
+            GameState.CHARACTER_SHEET, GameState.HELP, GameState.STORE
+        ], diff_frames=debug_flags["diff_dirty_rects"])
         self.particles = ParticleSystem()
         self.damage_texts = []
 
         # Character selection variables
         self.available_characters = []
+        self.character_roster = {}  # file name -> preview entry (name, race, class, level, credits, last played)
         self.selected_character = 0
 
         # Character creation system
@@ -118,9 +184,10 @@ class EnhancedGameManager:
         self.animated_player.y = world_center_y
 
         # Initialize tile map
-        self.tile_map = EnhancedTileMap()
+        self.tile_map = ChunkedTileMap()  # Chunks are baked around the camera and evicted when far away
         self.map_tiles = None
         self.current_level_content = None
+        self.level_map_points = {}  # Generator-suggested object positions for the current level map
         self.load_map_data()
 
         # Initialize camera
@@ -139,6 +206,13 @@ class EnhancedGameManager:
         self.streams = []  # New list for stream objects
         self.brushes = []  # New list for brush objects
         self.dungeons = []  # New list for boss dungeons
+        self.entity_store = EntityStore(self.timer_wheel)  # Positions, sizes, flags and timers of the objects above
+        self.entity_store.subscribe("enemy", self.on_enemy_active_changed)
+        self.level_clear_pending = False  # Every enemy of the level is inactive - set by enemy events
+        self.world_grid = SpatialHash()  # Collision/interaction lookup for the objects above
+        self.interact_target = (None, None)  # What SPACE would use right now (highlighted on the board)
+        self.placement_seed = None  # Fixed seed for object layouts (None = follow the global random state)
+        self.object_placer = None
 
         # Combat system variables (for legacy compatibility)
         self.current_enemy = None
@@ -154,6 +228,8 @@ class EnhancedGameManager:
             init_shop = Shop(world_width - 80, 20)
             init_shop.active = True
             self.shops.append(init_shop)
+            self.entity_store.add(init_shop, "shop")
+            self.world_grid.insert(init_shop, "shop")
             print(f"Initialization shop created at ({world_width - 80}, 20)")
 
         print(f"=== GAME INITIALIZATION COMPLETE ===")
@@ -181,8 +257,10 @@ class EnhancedGameManager:
         self.load_settings()
 
     def load_character_list(self):
-        """Load list of available characters"""
-        self.available_characters = self.character_manager.get_character_list()
+        """Load list of available characters (from the roster index, so save files aren't parsed)"""
+        roster = self.character_manager.get_roster()
+        self.character_roster = {entry["file"]: entry for entry in roster}
+        self.available_characters = [entry["file"] for entry in roster] + ["New Character"]
         self.selected_character = 0
 
     def load_map_data(self):
@@ -194,11 +272,21 @@ class EnhancedGameManager:
         current_level = self.level_manager.get_current_level()
         if not current_level:
             # Fallback to default setup
+            self.load_map_data()
+            self.level_map_points = {}
             self.setup_world_objects()
+            self.register_world_objects()
             return
 
-        # Generate content for current level
-        self.current_level_content = self.world_generator.generate_level_content(current_level)
+        level_key = self.level_manager.get_current_level_key()
+        instance = self.level_cache.get(level_key)
+
+        # Generate content for current level (or bring back the cached one)
+        if instance:
+            self.current_level_content = instance.content
+        else:
+            self.current_level_content = self.world_generator.generate_level_content(current_level)
+        self.load_level_map(current_level)
 
         # Set enemy manager difficulty and theme
         world_level_difficulty = (current_level.world - 1) * 4 + current_level.level
@@ -210,7 +298,117 @@ class EnhancedGameManager:
         self.enemy_manager.set_world_theme(world_theme)
 
         # Setup world objects based on generated content
-        self.setup_enhanced_world_objects()
+        if instance:
+            self.restore_level_instance(instance)
+        else:
+            self.setup_enhanced_world_objects()
+            self.register_world_objects()
+        self.loaded_level_key = level_key
+
+    def get_object_lists(self):
+        """Get the world object lists by kind, in draw order"""
+        return {"tree": self.trees, "enemy": self.enemies, "treasure": self.treasures, "shop": self.shops,
+                "rest": self.rests, "rock": self.rocks, "metal": self.metals, "stream": self.streams,
+                "brush": self.brushes, "dungeon": self.dungeons}
+
+    def get_level_instance(self):
+        """Get the loaded level's world objects and pending respawns as a level instance"""
+        objects = {kind: list(found) for kind, found in self.get_object_lists().items()}
+        respawns = []
+        for kind in HARVEST_KINDS:
+            for obj in objects[kind]:
+                ticks = self.entity_store.get_respawn_remaining(obj)
+                if ticks:
+                    respawns.append((obj, ticks))
+        return LevelInstance(self.current_level_content, objects, respawns, self.timer_wheel.now)
+
+    def store_level_instance(self):
+        """Put the loaded level's world objects and pending respawns in the level cache before leaving it"""
+        if self.loaded_level_key is None:
+            return
+        self.level_cache.put(self.loaded_level_key, self.get_level_instance())
+        self.loaded_level_key = None
+
+    def get_world_file(self):
+        """Get the current character's world save (visited levels as they were left)"""
+        name = self.level_manager.character_name or "default"
+        return f"SaveWorld/world_{name.replace(' ', '_').replace('.json', '')}.json"
+
+    def save_world_now(self):
+        """Save the loaded level and the cached ones (queued on the save queue)"""
+        levels = self.level_cache.to_dict()
+        if self.loaded_level_key is not None:
+            levels.pop(self.loaded_level_key, None)  # Most recently used goes last
+            levels[self.loaded_level_key] = self.get_level_instance().to_dict()
+        world_file = self.get_world_file()
+        self.save_queue.save(world_file, {"levels": levels}, partial(self.storage.save_world, world_file))
+
+    def load_world(self):
+        """Bring back the loaded character's saved levels and set up its current level (after set_character)"""
+        self.loaded_level_key = None  # The objects on the board belong to the previous character
+        self.level_cache.clear()
+        try:
+            data = self.storage.load_world(self.get_world_file())
+        except (OSError, ValueError) as e:
+            print(f"Could not load the saved world: {e}")
+            data = None
+        if data:
+            self.level_cache.load_dict(data.get("levels", {}), self.timer_wheel.now)
+        self.setup_world_for_current_level()
+
+    def restore_level_instance(self, instance):
+        """Bring back a cached level's world objects; respawn time kept running while the player was away"""
+        for kind, found in self.get_object_lists().items():
+            found[:] = instance.objects.get(kind, [])
+        self.register_world_objects()
+
+        elapsed = max(0, self.timer_wheel.now - instance.tick)  # Disk instances from an older wheel count as 0
+        for obj, ticks in instance.respawns:
+            if ticks > elapsed:
+                obj.respawn_timer = ticks - elapsed
+            else:
+                obj.respawn_timer = 0
+                obj.harvestable = True
+        print(f"Restored level {self.level_manager.get_current_level_key()} from the level cache")
+
+    def load_level_map(self, current_level):
+        """Load the generated tile map for a level, keeping the player start, rest area and shop clear"""
+        columns, rows = self.LEVEL_MAP_SIZE
+        tile_size = self.tile_map.tile_size
+        clear_zones = [
+            (480 // tile_size - 1, 480 // tile_size - 1, 4, 4),  # Player start - flood fill starts here
+            (columns - 4, rows - 4, 4, 4),  # Rest area, bottom-right corner
+            (columns - 5, 0, 5, 4)  # Shop, top-right corner
+        ]
+        map_dir, self.level_map_points = self.world_generator.get_level_map(current_level, columns, rows,
+                                                                            clear_zones)
+        self.map_tiles = self.tile_map.load_map_from_file(map_dir)
+
+    def register_world_objects(self):
+        """Put every world object in the entity store (draw order) and spatial hash (collision priority order)"""
+        self.entity_store.clear()
+        for kind, objects in self.get_object_lists().items():
+            self.entity_store.add_all(objects, kind)
+
+        self.world_grid.clear()
+        for kind, objects in (("tree", self.trees), ("rock", self.rocks), ("metal", self.metals),
+                              ("stream", self.streams), ("brush", self.brushes), ("rest", self.rests),
+                              ("enemy", self.enemies), ("treasure", self.treasures), ("shop", self.shops),
+                              ("dungeon", self.dungeons)):
+            for obj in objects:
+                self.world_grid.insert(obj, kind)
+        self.interact_target = (None, None)
+        self.level_clear_pending = (self.entity_store.count("enemy") > 0 and
+                                    self.entity_store.count_active("enemy") == 0)
+
+    def on_enemy_active_changed(self, enemy, active):
+        """Entity store event - track whether the last enemy of the level is gone"""
+        self.level_clear_pending = not active and self.entity_store.count_active("enemy") == 0
+
+    def deactivate_object(self, obj):
+        """Take a world object out of play (enemy fought, treasure picked up) - grid and entity store follow"""
+        self.world_grid.set_active(obj, False)
+        self.autosave.mark_dirty("world")
 
     def setup_enhanced_world_objects(self):
         """Setup enhanced world objects based on level content"""
@@ -234,17 +432,8 @@ class EnhancedGameManager:
         # enemy_count = 1
         enemy_types = self.current_level_content["enemy_types"]
 
-        enemy_positions = []
-        max_attempts = 1000
-        attempts = 0
-
-        while len(enemy_positions) < enemy_count and attempts < max_attempts:
-            attempts += 1
-            x = random.randint(50, 750)
-            y = random.randint(50, 550)
-
-            if not is_too_close(x, y, enemy_positions, min_distance=30):
-                enemy_positions.append((x, y))
+        placer = self.create_object_placer()
+        enemy_positions = placer.place("enemy", enemy_count, 30, (50, 750), (50, 550), avoid=("enemy",))
 
         # Create enemies with appropriate types
         for x, y in enemy_positions:
@@ -265,17 +454,8 @@ class EnhancedGameManager:
 
         # Create treasures based on level content
         treasure_count = self.current_level_content["treasure_count"]
-        treasure_positions = []
-
-        attempts = 0
-        while len(treasure_positions) < treasure_count and attempts < max_attempts:
-            attempts += 1
-            x = random.randint(50, 750)
-            y = random.randint(50, 550)
-
-            all_positions = enemy_positions + treasure_positions
-            if not is_too_close(x, y, all_positions, min_distance=25):
-                treasure_positions.append((x, y))
+        treasure_positions = placer.place("treasure", treasure_count, 25, (50, 750), (50, 550),
+                                          avoid=("enemy", "treasure"))
 
         for x, y in treasure_positions:
             # Apply loot multiplier to treasure value
@@ -290,11 +470,11 @@ class EnhancedGameManager:
             self.treasures.append(treasure)
 
         # Create trees for environmental decoration
-        self.create_trees(enemy_positions + treasure_positions)
+        self.create_trees(enemy_positions + treasure_positions, placer)
 
         # Create interactive map objects (rocks, metal, streams, brushes)
         all_positions = enemy_positions + treasure_positions + [(tree.x, tree.y) for tree in self.trees]
-        self.create_map_objects(all_positions)
+        self.create_map_objects(all_positions, placer)
 
         # Create rest area - always at far bottom right
         world_width, world_height = self.tile_map.get_world_pixel_size()
@@ -307,8 +487,23 @@ class EnhancedGameManager:
         rest_area = EnhancedRestArea(rest_x, rest_y, self.rest_manager)
         self.rests.append(rest_area)
 
-    def create_trees(self, existing_positions):
+    def create_object_placer(self):
+        """Create the placement engine for a level, keeping the player start, rest area and shop clear"""
+        world_width, world_height = self.tile_map.get_world_pixel_size()
+        placer = ObjectPlacer(self.placement_seed)
+        placer.add_exclusion_circle(480, 480, 80)  # Player start position
+        placer.add_exclusion_rect(pygame.Rect(world_width - 60, world_height - 60, 60, 60).inflate(80, 80))  # Rest
+        placer.add_exclusion_rect(pygame.Rect(world_width - 80, 20, 50, 50).inflate(80, 80))  # Shop
+        placer.set_walkability(self.tile_map.is_area_walkable)  # Nothing spawns on water or tree tiles
+        self.object_placer = placer
+        return placer
+
+    def create_trees(self, existing_positions, placer=None):
         """Create trees for environmental decoration"""
+        if placer is None:
+            placer = self.create_object_placer()
+            placer.add_points(existing_positions, "existing")
+
         current_level = self.level_manager.get_current_level()
 
         # Determine tree count and types based on world theme
@@ -333,24 +528,9 @@ class EnhancedGameManager:
             tree_count = random.randint(6, 10)
             tree_types = ["normal", "oak", "pine"]
 
-        tree_positions = []
-        max_attempts = 1000
-        attempts = 0
-
-        while len(tree_positions) < tree_count and attempts < max_attempts:
-            attempts += 1
-            x = random.randint(60, 740)  # Leave border space
-            y = random.randint(60, 540)
-
-            # Check distance from all existing objects (enemies, treasures, rest areas)
-            all_positions = existing_positions + tree_positions
-
-            # Trees need more space since they're larger
-            if not is_too_close(x, y, all_positions, min_distance=45):
-                # Also avoid the player starting area
-                player_start_x, player_start_y = 480, 480
-                if math.dist((x, y), (player_start_x, player_start_y)) > 80:
-                    tree_positions.append((x, y))
+        # Trees need more space since they're larger (border space left around the map)
+        tree_positions = placer.place("tree", tree_count, 45, (60, 740), (60, 540),
+                                      candidates=self.level_map_points.get("tree"))
 
         # Create trees with varied types
         for x, y in tree_positions:
@@ -360,10 +540,14 @@ class EnhancedGameManager:
 
         print(f"Created {len(self.trees)} trees of types: {set(tree.tree_type for tree in self.trees)}")
 
-    def create_map_objects(self, existing_positions):
+    def create_map_objects(self, existing_positions, placer=None):
         """Create interactive map objects (rocks, metal, streams, brushes)"""
         from Code.ui_components import Rock, Metal, Stream, Brush
 
+        if placer is None:
+            placer = self.create_object_placer()
+            placer.add_points(existing_positions, "existing")
+
         # Determine number of objects based on level
         current_level = self.level_manager.get_current_level()
         if current_level:
@@ -371,19 +555,9 @@ class EnhancedGameManager:
         else:
             total_objects = random.randint(5, 8)
 
-        object_positions = []
-        max_attempts = 1000
-        attempts = 0
-
-        while len(object_positions) < total_objects and attempts < max_attempts:
-            attempts += 1
-            x = random.randint(40, 760)
-            y = random.randint(40, 560)
-
-            # Check distance from all existing objects
-            all_positions = existing_positions + object_positions
-            if not is_too_close(x, y, all_positions, min_distance=40):
-                object_positions.append((x, y))
+        # Keep clear of all existing objects
+        object_positions = placer.place("map_object", total_objects, 40, (40, 760), (40, 560),
+                                        candidates=self.level_map_points.get("map_object"))
 
         # Create different types of map objects
         rock_count = int(total_objects * 0.4)  # 40% rocks
@@ -459,15 +633,15 @@ class EnhancedGameManager:
 
         # Parse map for object positions
         object_positions = self.tile_map.parse_map_for_objects()
+        placer = self.create_object_placer()
 
         # Create treasures - make them smaller
         treasure_positions = object_positions.get('treasures', [])
         if not treasure_positions:
             # Add some manual treasure positions
-            treasure_positions = [
-                (random.randint(50, 750), random.randint(50, 550))
-                for _ in range(8)
-            ]
+            treasure_positions = placer.place("treasure", 8, 0, (50, 750), (50, 550))
+        else:
+            placer.add_points(treasure_positions, "treasure")
 
         for x, y in treasure_positions:
             treasure = Treasure(x, y)
@@ -476,56 +650,27 @@ class EnhancedGameManager:
         # Create enemies - ensure they spawn
         enemy_positions = object_positions.get('enemies', [])
         if not enemy_positions:
-            # Generate enemy positions with spacing rules
-            enemy_positions = []
+            # Generate enemy positions with spacing rules (away from treasures and other enemies)
             num_enemies = 18
-            max_attempts = 1000
-
-            attempts = 0
-            while len(enemy_positions) < num_enemies and attempts < max_attempts:
-                attempts += 1
-                x = random.randint(50, 750)
-                y = random.randint(50, 550)
-
-                # Check distance from treasures and already-placed enemies
-                if not is_too_close(x, y, treasure_positions, min_distance=20) and \
-                        not is_too_close(x, y, enemy_positions, min_distance=20):
-                    enemy_positions.append((x, y))
+            enemy_positions = placer.place("enemy", num_enemies, 20, (50, 750), (50, 550))
 
             # Create enemies
             for x, y in enemy_positions:
                 enemy = Enemy(x, y, self.enemy_manager.create_scaled_enemy())
                 self.enemies.append(enemy)
+        else:
+            placer.add_points(enemy_positions, "enemy")
 
         # Create trees (fallback version with default settings)
-        self.create_trees(enemy_positions + treasure_positions)
+        self.create_trees(enemy_positions + treasure_positions, placer)
 
         # Create map objects (fallback)
         all_positions = enemy_positions + treasure_positions + [(tree.x, tree.y) for tree in self.trees]
-        self.create_map_objects(all_positions)
-
-        # Create rest areas - single rest area in bottom-right
-        world_width, world_height = self.tile_map.get_world_pixel_size()
-
-        # Single rest area in bottom-right corner with some inset
-        rest_x = world_width - 120
-        rest_y = world_height - 120
-
-        # Make sure rest area doesn't conflict with other objects
-        too_close_to_existing = False
-        for enemy in self.enemies:
-            if math.dist((rest_x, rest_y), (enemy.x, enemy.y)) < 50:
-                too_close_to_existing = True
-                break
-
-        for treasure in self.treasures:
-            if math.dist((rest_x, rest_y), (treasure.x, treasure.y)) < 40:
-                too_close_to_existing = True
-                break
+        self.create_map_objects(all_positions, placer)
 
         # Create map objects (fallback)
         all_positions = enemy_positions + treasure_positions + [(tree.x, tree.y) for tree in self.trees]
-        self.create_map_objects(all_positions)
+        self.create_map_objects(all_positions, placer)
 
         # Create rest area at far bottom right
         world_width, world_height = self.tile_map.get_world_pixel_size()
@@ -536,39 +681,20 @@ class EnhancedGameManager:
 
     def check_tree_collision(self, player_rect):
         """Check if player is colliding with any trees"""
-        for tree in self.trees:
-            if tree.active and tree.is_blocking():
-                if player_rect.colliderect(tree.get_rect()):
-                    return tree
-        return None
+        collision_type, tree = self.world_grid.find_collision(player_rect, ("tree",))
+        return tree
+
+    def can_player_move_to(self, x, y):
+        """Check a player position against the tile walkability bitmap and blocking object masks"""
+        width = self.animated_player.display_width
+        height = self.animated_player.display_height
+        if not self.tile_map.is_area_walkable(x, y, width, height):
+            return False
+        return self.world_grid.find_blocking(pygame.Rect(x, y, width, height)) is None
 
     def check_map_object_collision(self, player_rect):
         """Check if player is colliding with any map objects (rocks, metal, streams, brushes)"""
-        # Check rocks
-        for rock in self.rocks:
-            if rock.active and rock.is_blocking():
-                if player_rect.colliderect(rock.get_rect()):
-                    return "rock", rock
-
-        # Check metal veins
-        for metal in self.metals:
-            if metal.active and metal.is_blocking():
-                if player_rect.colliderect(metal.get_rect()):
-                    return "metal", metal
-
-        # Check streams
-        for stream in self.streams:
-            if stream.active and stream.is_blocking():
-                if player_rect.colliderect(stream.get_rect()):
-                    return "stream", stream
-
-        # Check brushes
-        for brush in self.brushes:
-            if brush.active and brush.is_blocking():
-                if player_rect.colliderect(brush.get_rect()):
-                    return "brush", brush
-
-        return None, None
+        return self.world_grid.find_collision(player_rect, MAP_OBJECT_KINDS)
 
     def check_interactive_objects(self, player_rect):
         """Check for interactive objects near player for spacebar interaction"""
@@ -578,62 +704,30 @@ class EnhancedGameManager:
         player_center_y = player_rect.centery
 
         # Check dungeons FIRST (highest priority)
-        for dungeon in self.dungeons:
-            if dungeon.active and dungeon.can_interact():
-                dungeon_center_x = dungeon.x + dungeon.width // 2
-                dungeon_center_y = dungeon.y + dungeon.height // 2
-                distance = math.sqrt(
-                    (player_center_x - dungeon_center_x) ** 2 + (player_center_y - dungeon_center_y) ** 2)
-                if distance <= dungeon_interact_distance:
-                    return "dungeon", dungeon
-
-        # Check rocks
-        for rock in self.rocks:
-            if rock.active and rock.can_harvest():
-                rock_center_x = rock.x + rock.width // 2
-                rock_center_y = rock.y + rock.height // 2
-                distance = math.sqrt((player_center_x - rock_center_x) ** 2 + (player_center_y - rock_center_y) ** 2)
-                if distance <= interact_distance:
-                    return "rock", rock
-
-        # Check metal veins
-        for metal in self.metals:
-            if metal.active and metal.can_harvest():
-                metal_center_x = metal.x + metal.width // 2
-                metal_center_y = metal.y + metal.height // 2
-                distance = math.sqrt((player_center_x - metal_center_x) ** 2 + (player_center_y - metal_center_y) ** 2)
-                if distance <= interact_distance:
-                    return "metal", metal
-
-        # Check streams
-        for stream in self.streams:
-            if stream.active and stream.can_harvest():
-                stream_center_x = stream.x + stream.width // 2
-                stream_center_y = stream.y + stream.height // 2
-                distance = math.sqrt(
-                    (player_center_x - stream_center_x) ** 2 + (player_center_y - stream_center_y) ** 2)
-                if distance <= interact_distance:
-                    return "stream", stream
-
-        # Check brushes
-        for brush in self.brushes:
-            if brush.active and brush.can_harvest():
-                brush_center_x = brush.x + brush.width // 2
-                brush_center_y = brush.y + brush.height // 2
-                distance = math.sqrt((player_center_x - brush_center_x) ** 2 + (player_center_y - brush_center_y) ** 2)
-                if distance <= interact_distance:
-                    return "brush", brush
-
-        # Check trees
-        for tree in self.trees:
-            if tree.active and tree.can_harvest():
-                tree_center_x = tree.x + tree.width // 2
-                tree_center_y = tree.y + tree.height // 2
-                distance = math.sqrt((player_center_x - tree_center_x) ** 2 + (player_center_y - tree_center_y) ** 2)
-                if distance <= interact_distance:
-                    return "tree", tree
-
-        return None, None
+        obj_type, obj = self.world_grid.find_nearest(player_center_x, player_center_y, dungeon_interact_distance,
+                                                     INTERACT_KINDS, lambda dungeon: dungeon.can_interact())
+        if obj:
+            return obj_type, obj
+
+        # Nearest harvestable rock, metal vein, stream, brush or tree
+        return self.world_grid.find_nearest(player_center_x, player_center_y, interact_distance,
+                                            HARVEST_KINDS, lambda harvestable: harvestable.can_harvest())
+
+    def update_interact_target(self):
+        """Find what SPACE would interact with so it can be highlighted"""
+        player_rect = pygame.Rect(self.animated_player.x, self.animated_player.y,
+                                  self.animated_player.display_width, self.animated_player.display_height)
+        self.interact_target = self.check_interactive_objects(player_rect)
+
+    def draw_interact_highlight(self):
+        """Outline the object SPACE would interact with"""
+        obj_type, obj = self.interact_target
+        if not obj or not obj.active:
+            return
+        screen_x, screen_y = self.camera.world_to_screen(obj.x, obj.y)
+        pulse = int(40 * abs(math.sin(self.animation_timer * 0.1)))
+        color = (215 + pulse, 215 + pulse, 0) if obj_type == "dungeon" else (255, 255, 255 - pulse * 4)
+        pygame.draw.rect(self.screen, color, (screen_x - 3, screen_y - 3, obj.width + 6, obj.height + 6), 2)
 
     def handle_map_object_interaction(self):
         """Handle spacebar interaction with map objects"""
@@ -651,6 +745,7 @@ class EnhancedGameManager:
                 # Harvest the object
                 material = obj.harvest()
                 if material:
+                    self.autosave.mark_dirty("world")
                     # Add material to inventory
                     from Code.crafting_system import CraftingIntegration
                     if hasattr(self, 'crafting_integration') and self.crafting_integration:
@@ -693,10 +788,8 @@ class EnhancedGameManager:
 
     def check_level_completion(self):
         """Check if current level is completed and handle progression"""
-        # Level is completed when all enemies are defeated
-        active_enemies = [enemy for enemy in self.enemies if enemy.active]
-
-        if len(active_enemies) == 0 and len(self.enemies) > 0 and len(self.dungeons) == 0:
+        # Level is completed when all enemies are defeated (flag kept up to date by enemy events)
+        if self.level_clear_pending and len(self.dungeons) == 0:
             # All enemies defeated but no dungeon spawned yet - spawn boss dungeon!
             from Code.ui_components import Dungeon
 
@@ -710,6 +803,8 @@ class EnhancedGameManager:
             # Create and add dungeon
             dungeon = Dungeon(dungeon_x, dungeon_y)
             self.dungeons.append(dungeon)
+            self.entity_store.add(dungeon, "dungeon")
+            self.world_grid.insert(dungeon, "dungeon")
 
             # Visual feedback for dungeon appearance
             damage_text = DamageText(0, 0, "🏰 BOSS DUNGEON APPEARS! 🏰", (255, 215, 0))
@@ -743,8 +838,13 @@ class EnhancedGameManager:
 
             # Unlock next level
             self.level_manager.complete_current_level()
+            self.loaded_level_key = None  # A beaten level is generated fresh when replayed
+            self.autosave.mark_dirty("world")
 
             # Remove dungeon
+            for dungeon in self.dungeons:
+                self.world_grid.remove(dungeon)
+                self.entity_store.remove(dungeon)
             self.dungeons.clear()
 
             return True
@@ -759,8 +859,12 @@ class EnhancedGameManager:
             self.animated_player.x = world_center_x
             self.animated_player.y = world_center_y
 
-            # Setup new world
+            # Setup new world (the old one is kept in the level cache)
+            self.autosave.flush()
+            self.save_queue.flush()  # Start writing the last level's saves now rather than after the debounce
+            self.store_level_instance()
             self.setup_world_for_current_level()
+            self.autosave.mark_dirty("world")  # Keep the new level's layout
 
             # Update camera
             self.camera.update(
@@ -781,48 +885,16 @@ class EnhancedGameManager:
         player_rect = pygame.Rect(self.animated_player.x, self.animated_player.y,
                                   self.animated_player.display_width, self.animated_player.display_height)
 
-        # Check tree collisions first (blocking movement)
-        tree_collision = self.check_tree_collision(player_rect)
-        if tree_collision:
-            return "tree", tree_collision
-
-        # Check map object collisions (blocking movement)
-        map_object_type, map_object = self.check_map_object_collision(player_rect)
-        if map_object:
-            return map_object_type, map_object
-
-        # Check rest area collisions first (highest priority for UX)
-        for rest_area in self.rests:
-            if rest_area.active:
-                rest_rect = pygame.Rect(rest_area.x, rest_area.y, rest_area.width, rest_area.height)
-                if player_rect.colliderect(rest_rect):
-                    return "rest", rest_area
-
-        # Check enemy collisions
-        for enemy in self.enemies:
-            if enemy.active:
-                enemy_rect = pygame.Rect(enemy.x, enemy.y, enemy.width, enemy.height)
-                if player_rect.colliderect(enemy_rect):
-                    return "enemy", enemy
-
-        # Check treasure collisions
-        for treasure in self.treasures:
-            if treasure.active:
-                treasure_rect = pygame.Rect(treasure.x, treasure.y, treasure.width, treasure.height)
-                if player_rect.colliderect(treasure_rect):
-                    return "treasure", treasure
-
-        # Check shop collisions
-        for shop in self.shops:
-            if shop.active:
-                shop_rect = pygame.Rect(shop.x, shop.y, shop.width, shop.height)
-                if player_rect.colliderect(shop_rect):
-                    return "shop", shop
-
-        return None, None
+        # Only objects in the player's grid cells are checked, in priority order:
+        # tree, map object (rock, metal, stream, brush), rest, enemy, treasure, shop
+        return self.world_grid.find_collision(player_rect)
 
     def handle_event(self, event):
         """Handle pygame events based on current state"""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            # Toggle the profiler overlay from any screen
+            self.profiler.toggle()
+            return None
         if event.type == pygame.KEYDOWN:
             return self.handle_keypress(event.key)
         elif self.current_state == GameState.CREATE_CHARACTER and self.character_creator:
@@ -882,6 +954,7 @@ class EnhancedGameManager:
                         # Update level manager with character-specific progression
                         character_name = self.character_manager.character_data.get('Name')
                         self.level_manager.set_character(character_name)
+                        self.load_world()  # Cached levels belonged to the previous character
                         self.current_state = GameState.GAME_BOARD
                     else:
                         print(f"Failed to load character: {selected_char}")
@@ -900,6 +973,7 @@ class EnhancedGameManager:
                         # Update level manager with character-specific progression
                         character_name = self.character_manager.character_data.get('Name')
                         self.level_manager.set_character(character_name)
+                        self.load_world()  # Cached levels belonged to the previous character
                         self.current_state = GameState.GAME_BOARD
                     else:
                         print("Failed to create character")
@@ -1132,16 +1206,13 @@ class EnhancedGameManager:
             self.current_enemy = None
 
     def update(self):
-        """Update game logic"""
+        """Update game logic (one fixed logic tick)"""
         self.animation_timer += 1
         self.particles.update()
 
-        # Update rest manager
-        self.rest_manager.update()
-
-        # Update rest areas
-        for rest_area in self.rests:
-            rest_area.update()
+        # Player walk/idle animation advances with logic ticks, not render frames
+        if self.current_state in (GameState.GAME_BOARD, GameState.CRAFTING):
+            self.animated_player.advance_animation()
 
         # Update level select screen if active
         if self.current_state == GameState.LEVEL_SELECT and self.level_select_screen:
@@ -1160,17 +1231,9 @@ class EnhancedGameManager:
         if hasattr(self, 'store_integration') and self.store_integration:
             self.store_integration.update()
 
-        # Update map objects (respawn timers)
-        for rock in self.rocks:
-            rock.update()
-        for metal in self.metals:
-            metal.update()
-        for stream in self.streams:
-            stream.update()
-        for brush in self.brushes:
-            brush.update()
-        for tree in self.trees:
-            tree.update()
+        # Fire due timers (respawns and cooldowns)
+        with self.profiler.section("world_update"):
+            self.timer_wheel.advance()
 
         if self.current_state == GameState.GAME_BOARD:
             # Store previous player position for collision rollback
@@ -1179,17 +1242,12 @@ class EnhancedGameManager:
 
             # Update animated player position
             world_width, world_height = self.tile_map.get_world_pixel_size()
-            moved = self.animated_player.update_position(world_width, world_height)
+            moved = self.animated_player.update_position(world_width, world_height, self.can_player_move_to)
 
-            # Check for tree collisions and prevent movement if blocked
+            # Check for blocked tiles/trees and prevent movement if blocked
             if moved:
-                player_rect = pygame.Rect(self.animated_player.x, self.animated_player.y,
-                                          self.animated_player.display_width, self.animated_player.display_height)
-
-                # Check if player is colliding with trees
-                tree_collision = self.check_tree_collision(player_rect)
-                if tree_collision:
-                    # Rollback movement - player can't walk through trees
+                # Rollback movement - player can't walk through water, tree tiles or trees
+                if not self.can_player_move_to(self.animated_player.x, self.animated_player.y):
                     self.animated_player.x = prev_x
                     self.animated_player.y = prev_y
                     moved = False  # Don't update camera if movement was blocked
@@ -1203,7 +1261,9 @@ class EnhancedGameManager:
             self.check_level_completion()
 
             # Check for collisions (now enhanced with combat integration and rest areas)
-            collision_type, collision_obj = self.check_collisions()
+            with self.profiler.section("collisions"):
+                collision_type, collision_obj = self.check_collisions()
+                self.update_interact_target()
 
             if collision_type == "tree":
                 # Trees block movement, but this is handled in the movement check above
@@ -1239,13 +1299,13 @@ class EnhancedGameManager:
                     self.damage_texts.append(damage_text)
 
             elif collision_type == "enemy":
-                collision_obj.active = False
+                self.deactivate_object(collision_obj)
                 self.current_enemy = collision_obj
                 self.current_state = GameState.FIGHT
                 self.combat_messages = []
 
             elif collision_type == "treasure":
-                collision_obj.active = False
+                self.deactivate_object(collision_obj)
 
                 if self.character_manager.character_data:
                     # 25% chance to get crafting material instead of credits
@@ -1288,6 +1348,8 @@ class EnhancedGameManager:
             elif collision_type == "crafting_node":
                 # Harvest crafting material
                 material = collision_obj.harvest()
+                if material:
+                    self.autosave.mark_dirty("world")
                 if material and self.character_manager.character_data:
                     # Use the new inventory system
                     from Code.inventory_system import InventoryManager
@@ -1322,37 +1384,52 @@ class EnhancedGameManager:
         self.particles.draw(self.screen)
 
         # Title with glow effect
-        title_surface = self.ui_renderer.title_font.render("MAGITECH RPG", True, MENU_SELECTED)
+        title_surface = render_text(self.ui_renderer.title_font, "MAGITECH RPG", MENU_SELECTED)
         title_rect = title_surface.get_rect(center=(self.WIDTH // 2, 150))
         self.screen.blit(title_surface, title_rect)
 
         # Subtitle
-        subtitle = self.ui_renderer.font.render("With Enhanced Combat, Sound & 20 Levels", True, MENU_TEXT)
+        subtitle = render_text(self.ui_renderer.font, "With Enhanced Combat, Sound & 20 Levels", MENU_TEXT)
         subtitle_rect = subtitle.get_rect(center=(self.WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
 
         # Animated prompt
         alpha = int(128 + 127 * math.sin(self.animation_timer * 0.1))
-        prompt_surface = self.ui_renderer.font.render("Press any key to begin your adventure...", True, MENU_SELECTED)
-        prompt_surface.set_alpha(alpha)
+        prompt_surface = render_text(self.ui_renderer.font, "Press any key to begin your adventure...", MENU_SELECTED,
+                                     alpha=alpha)
         prompt_rect = prompt_surface.get_rect(center=(self.WIDTH // 2, self.HEIGHT - 150))
         self.screen.blit(prompt_surface, prompt_rect)
 
     def draw_character_select_screen(self):
         """Draw the character selection screen"""
+        # Only the rows around the selection are drawn, so hundreds of saves cost the same as a few
+        rows = self.CHARACTER_LIST_ROWS
+        first = min(max(0, self.selected_character - rows // 2), max(0, len(self.available_characters) - rows))
         menu_options = []
-        for char in self.available_characters:
+        for char in self.available_characters[first:first + rows]:
             if char == "New Character":
                 menu_options.append("Create New Character")
             else:
-                # Format character filename nicely
-                char_name = char.replace(".json", "").replace("_", " ").title()
-                menu_options.append(f"Load {char_name}")
+                entry = self.character_roster.get(char)
+                if entry:
+                    menu_options.append(f"Load {entry['name']} - Lv {entry['level']}")
+                else:
+                    # Format character filename nicely
+                    char_name = char.replace(".json", "").replace("_", " ").title()
+                    menu_options.append(f"Load {char_name}")
 
+        subtitle = "Choose your hero!"
+        if len(self.available_characters) > rows:
+            subtitle = f"Choose your hero! ({self.selected_character + 1}/{len(self.available_characters)})"
         self.ui_renderer.draw_enhanced_menu(self.screen, "SELECT CHARACTER", menu_options,
-                                            self.selected_character, "Choose your hero!",
+                                            self.selected_character - first, subtitle,
                                             self.animation_timer)
 
+        if self.available_characters:
+            entry = self.character_roster.get(self.available_characters[self.selected_character])
+            if entry:
+                self.draw_character_preview(entry)
+
         # Instructions
         instructions = [
             "UP/DOWN: Navigate characters",
@@ -1361,6 +1438,25 @@ class EnhancedGameManager:
         ]
         self.ui_renderer.draw_instructions_panel(self.screen, instructions)
 
+    def draw_character_preview(self, entry):
+        """Draw the selected character's roster entry in the bottom-right corner"""
+        panel = pygame.Rect(self.WIDTH - 330, self.HEIGHT - 150, 320, 140)
+        pygame.draw.rect(self.screen, UI_BG_COLOR, panel)
+        pygame.draw.rect(self.screen, UI_BORDER_COLOR, panel, 2)
+
+        last_played = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["last_played"])) \
+            if entry.get("last_played") else "Never"
+        lines = [
+            (str(entry["name"]), GOLD),
+            (f"{entry['race']} {entry['class']}".strip(), WHITE),
+            (f"Level {entry['level']}", WHITE),
+            (f"Credits: {entry['credits']}", WHITE),
+            (f"Last played: {last_played}", MENU_TEXT)
+        ]
+        for i, (line, color) in enumerate(lines):
+            text_surface = render_text(self.ui_renderer.small_font, line, color)
+            self.screen.blit(text_surface, (panel.x + 12, panel.y + 10 + i * 24))
+
     def draw_create_character_screen(self):
         """Draw the create character screen"""
         if self.character_creator:
@@ -1368,7 +1464,7 @@ class EnhancedGameManager:
         else:
             # Fallback if character creator isn't initialized
             self.screen.fill(MENU_BG)
-            error_text = self.ui_renderer.font.render("Character creator not initialized!", True, RED)
+            error_text = render_text(self.ui_renderer.font, "Character creator not initialized!", RED)
             error_rect = error_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
             self.screen.blit(error_text, error_rect)
 
@@ -1381,81 +1477,98 @@ class EnhancedGameManager:
             bg_color = self.world_generator._get_background_color(current_level)
 
         # Draw tile map background or colored background
-        if self.map_tiles:
-            self.tile_map.draw(self.map_tiles, self.screen, -self.camera.x, -self.camera.y)
-        else:
-            self.screen.fill(bg_color)
-
-        # Draw trees first (behind other objects)
-        for tree in self.trees:
-            tree.draw(self.screen, self.camera, self.animation_timer)
-
-        # Draw world objects with debug info
-        for enemy in self.enemies:
-            enemy.draw(self.screen, self.camera, self.animation_timer)
+        with self.profiler.section("tile_map"):
+            if self.map_tiles:
+                self.tile_map.draw(self.map_tiles, self.screen, -self.camera.x, -self.camera.y)
+            else:
+                self.screen.fill(bg_color)
+
+        with self.profiler.section("world_objects"):
+            # The store keeps draw order: trees (behind everything), enemies, treasures, shops,
+            # rests, map objects (rocks, metal, streams, brushes) and boss dungeons on top.
+            # Culling keeps a margin for labels/glows drawn outside an object's own rectangle.
+            margin = self.DRAW_CULL_MARGIN
+            for obj in self.entity_store.cull(self.camera.x - margin, self.camera.y - margin,
+                                              self.camera.x + self.WIDTH + margin,
+                                              self.camera.y + self.HEIGHT + margin):
+                if isinstance(obj, RestArea):
+                    obj.draw(self.screen, self.camera.x, self.camera.y)
+                else:
+                    obj.draw(self.screen, self.camera, self.animation_timer)
 
-        for treasure in self.treasures:
-            treasure.draw(self.screen, self.camera, self.animation_timer)
+            # Highlight whatever SPACE would harvest/enter
+            self.draw_interact_highlight()
 
-        # Debug: Always try to draw shops and rests
-        for i, shop in enumerate(self.shops):
-            shop.draw(self.screen, self.camera, self.animation_timer)
+        # Draw animated player at correct screen position
+        with self.profiler.section("player"):
+            screen_x, screen_y = self.camera.world_to_screen(self.animated_player.x, self.animated_player.y)
+            self.animated_player.draw_at_screen_position(self.screen, screen_x, screen_y)
+
+        # Draw the HUD (status, level info, rest status, help) from the cached HUD layer
+        with self.profiler.section("hud"):
+            self.update_hud_layer()
+            self.hud_layer.draw(self.screen)
+
+        with self.profiler.section("effects"):
+            # Draw floating damage texts with proper world-to-screen conversion
+            for damage_text in self.damage_texts:
+                if hasattr(damage_text, 'world_pos') and damage_text.world_pos:
+                    damage_text.draw_at_world_pos(self.screen, self.camera)
+                else:
+                    damage_text.draw(self.screen)
 
-        for i, rest_area in enumerate(self.rests):
-            rest_area.draw(self.screen, self.camera.x, self.camera.y)
+            # Draw particles
+            self.particles.draw(self.screen)
 
-        # Draw map objects (rocks, metal, streams, brushes)
-        for rock in self.rocks:
-            rock.draw(self.screen, self.camera, self.animation_timer)
-        for metal in self.metals:
-            metal.draw(self.screen, self.camera, self.animation_timer)
-        for stream in self.streams:
-            stream.draw(self.screen, self.camera, self.animation_timer)
-        for brush in self.brushes:
-            brush.draw(self.screen, self.camera, self.animation_timer)
+        # Debug: outline collision rectangles (show_collision_boxes in game_config.json)
+        if self.profiler.show_collision_boxes:
+            self.profiler.draw_collision_boxes(self.screen, self.camera, self.get_debug_objects())
 
-        # Draw boss dungeons
-        for dungeon in self.dungeons:
-            dungeon.draw(self.screen, self.camera, self.animation_timer)
+    def update_hud_layer(self):
+        """Re-render only the HUD panels whose values changed since the last frame"""
+        hud = self.hud_layer
+        ui = self.ui_renderer
 
-        # Draw animated player at correct screen position
-        screen_x, screen_y = self.camera.world_to_screen(self.animated_player.x, self.animated_player.y)
-        self.animated_player.draw_at_screen_position(self.screen, screen_x, screen_y)
+        hud.update_panel("status", ui.get_status_key(self.character_manager),
+                         lambda: (ui.render_status_panel(self.character_manager), (10, 10)))
 
-        # Draw enhanced status overlay with level info
-        self.draw_enhanced_status_overlay()
+        current_level = self.level_manager.get_current_level()
+        level_key = current_level.get_display_name() if current_level else None
+        hud.update_panel("level", level_key, self.render_level_overlay)
 
-        # Draw rest status HUD
-        self.rest_manager.draw_rest_hud(self.screen, self.WIDTH, self.HEIGHT)
+        hud.update_panel("rest", self.rest_manager.get_rest_hud_key(), self.rest_manager.render_rest_hud)
 
-        # Draw instructions only if enabled
+        # Instructions panel when enabled, otherwise a small toggle hint in the corner
         if self.show_instructions:
-            instructions = [
-                "Arrow Keys: Move character",
-                "SPACEBAR: Harvest rocks, metal, streams, brushes, trees",
-                "SPACEBAR: Enter boss dungeon (when available)",
-                "Rest areas: Restore HP/MP (3min cooldown)",
-                "Trees and map objects block your path",
-                "I: Inventory  C: Character  H: Help  L: Level Select  R: Crafting",
-                "F1: Toggle this panel  ESC: Main Menu"
-            ]
-            self.ui_renderer.draw_instructions_panel(self.screen, instructions)
+            hud.update_panel("help", "instructions",
+                             lambda: ui.render_instructions_panel(self.GAME_BOARD_INSTRUCTIONS))
         else:
-            # Draw a small toggle hint in the corner
-            hint_text = self.ui_renderer.small_font.render("F1: Show Help", True, WHITE)
-            hint_bg = pygame.Rect(10, self.HEIGHT - 25, hint_text.get_width() + 10, 20)
-            pygame.draw.rect(self.screen, (0, 0, 0, 128), hint_bg)
-            self.screen.blit(hint_text, (15, self.HEIGHT - 22))
-
-        # Draw floating damage texts with proper world-to-screen conversion
-        for damage_text in self.damage_texts:
-            if hasattr(damage_text, 'world_pos') and damage_text.world_pos:
-                damage_text.draw_at_world_pos(self.screen, self.camera)
-            else:
-                damage_text.draw(self.screen)
+            hud.update_panel("help", "hint", self.render_help_hint)
+
+    def render_help_hint(self):
+        """Render the small 'F1: Show Help' hint, returns (surface, position)"""
+        hint_text = render_text(self.ui_renderer.small_font, "F1: Show Help", WHITE)
+        hint_surface = pygame.Surface((hint_text.get_width() + 10, 20))
+        hint_surface.fill(BLACK)
+        hint_surface.blit(hint_text, (5, 3))
+        return hint_surface, (10, self.HEIGHT - 25)
+
+    def render_level_overlay(self):
+        """Render the level info overlay, returns (surface, position) or None"""
+        current_level = self.level_manager.get_current_level()
+        if not current_level:
+            return None
 
-        # Draw particles
-        self.particles.draw(self.screen)
+        # Level info overlay
+        level_overlay = pygame.Surface((300, 40), pygame.SRCALPHA)
+        level_overlay.fill((0, 0, 0, 128))
+
+        level_text = f"Level: {current_level.get_display_name()}"
+        level_surface = render_text(self.ui_renderer.small_font, level_text, MENU_SELECTED)
+        level_overlay.blit(level_surface, (10, 24))
+
+        # Level overlay sits below main status overlay
+        return level_overlay, (10, 140)
 
     def draw_enhanced_status_overlay(self):
         """Draw enhanced status overlay with level information"""
@@ -1463,23 +1576,9 @@ class EnhancedGameManager:
         self.ui_renderer.draw_status_overlay(self.screen, self.character_manager)
 
         # Add level information
-        current_level = self.level_manager.get_current_level()
-        if current_level:
-            # Level info overlay
-            level_overlay = pygame.Surface((300, 40), pygame.SRCALPHA)
-            level_overlay.fill((0, 0, 0, 128))
-
-            level_text = f"Level: {current_level.get_display_name()}"
-            difficulty_text = f"Difficulty: {current_level.get_difficulty_description()}"
-
-            level_surface = self.ui_renderer.small_font.render(level_text, True, MENU_SELECTED)
-            difficulty_surface = self.ui_renderer.small_font.render(difficulty_text, True, MENU_SELECTED)
-
-            level_overlay.blit(level_surface, (10, 24))
-            # level_overlay.blit(difficulty_surface, (10, 22))
-
-            # Blit level overlay below main status overlay
-            self.screen.blit(level_overlay, (10, 140))
+        level_overlay = self.render_level_overlay()
+        if level_overlay:
+            self.screen.blit(*level_overlay)
 
     def draw_fight_screen(self):
         """Draw the fight screen - now enhanced with advanced combat"""
@@ -1492,7 +1591,7 @@ class EnhancedGameManager:
             self.screen.fill((50, 0, 0))  # Dark red background
 
             # Title
-            title = self.ui_renderer.large_font.render("BATTLE!", True, WHITE)
+            title = render_text(self.ui_renderer.large_font, "BATTLE!", WHITE)
             title_rect = title.get_rect(center=(self.WIDTH // 2, 100))
             self.screen.blit(title, title_rect)
 
@@ -1503,22 +1602,22 @@ class EnhancedGameManager:
                 enemy_hp = self.current_enemy.enemy_data.get("Hit_Points", 75)
 
                 # Player info
-                player_text = self.ui_renderer.font.render(f"{player_name}: {player_hp} HP", True, GREEN)
+                player_text = render_text(self.ui_renderer.font, f"{player_name}: {player_hp} HP", GREEN)
                 self.screen.blit(player_text, (100, 200))
 
                 # Enemy info
-                enemy_text = self.ui_renderer.font.render(f"{enemy_name}: {enemy_hp} HP", True, RED)
+                enemy_text = render_text(self.ui_renderer.font, f"{enemy_name}: {enemy_hp} HP", RED)
                 self.screen.blit(enemy_text, (100, 250))
 
                 # Combat messages
                 y_pos = 300
                 for message, color in self.combat_messages[-5:]:
-                    text = self.ui_renderer.small_font.render(message[:60], True, color)
+                    text = render_text(self.ui_renderer.small_font, message[:60], color)
                     self.screen.blit(text, (50, y_pos))
                     y_pos += 25
 
                 # Instructions
-                instruction = self.ui_renderer.font.render("SPACE: Attack  ESC: Flee", True, WHITE)
+                instruction = render_text(self.ui_renderer.font, "SPACE: Attack  ESC: Flee", WHITE)
                 instruction_rect = instruction.get_rect(center=(self.WIDTH // 2, self.HEIGHT - 100))
                 self.screen.blit(instruction, instruction_rect)
 
@@ -1526,12 +1625,12 @@ class EnhancedGameManager:
         """Draw the enhanced inventory screen with equipment options"""
         self.screen.fill(MENU_BG)
 
-        title = self.ui_renderer.large_font.render("INVENTORY", True, WHITE)
+        title = render_text(self.ui_renderer.large_font, "INVENTORY", WHITE)
         title_rect = title.get_rect(center=(self.WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
 
         if not self.character_manager.character_data:
-            no_char_text = self.ui_renderer.font.render("No character loaded!", True, WHITE)
+            no_char_text = render_text(self.ui_renderer.font, "No character loaded!", WHITE)
             no_char_rect = no_char_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
             self.screen.blit(no_char_text, no_char_rect)
             return
@@ -1558,15 +1657,15 @@ class EnhancedGameManager:
             self.inventory_scroll_offset = self.selected_inventory_item - max_visible_items + 1
 
         if not inventory:
-            empty_text = self.ui_renderer.font.render("Your inventory is empty!", True, WHITE)
+            empty_text = render_text(self.ui_renderer.font, "Your inventory is empty!", WHITE)
             empty_rect = empty_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
             self.screen.blit(empty_text, empty_rect)
         else:
             # Column headers
-            item_header = self.ui_renderer.font.render("ITEM", True, MENU_SELECTED)
-            quantity_header = self.ui_renderer.font.render("QTY", True, MENU_SELECTED)
-            stats_header = self.ui_renderer.font.render("STATS", True, MENU_SELECTED)
-            action_header = self.ui_renderer.font.render("ACTION", True, MENU_SELECTED)
+            item_header = render_text(self.ui_renderer.font, "ITEM", MENU_SELECTED)
+            quantity_header = render_text(self.ui_renderer.font, "QTY", MENU_SELECTED)
+            stats_header = render_text(self.ui_renderer.font, "STATS", MENU_SELECTED)
+            action_header = render_text(self.ui_renderer.font, "ACTION", MENU_SELECTED)
 
             self.screen.blit(item_header, (50, 90))
             self.screen.blit(quantity_header, (200, 90))
@@ -1596,36 +1695,36 @@ class EnhancedGameManager:
                 # Item name
                 item_color = MENU_SELECTED if (hasattr(self,
                                                        'selected_inventory_item') and actual_index == self.selected_inventory_item) else WHITE
-                item_text = self.ui_renderer.font.render(f"{item_name}", True, item_color)
+                item_text = render_text(self.ui_renderer.font, f"{item_name}", item_color)
                 self.screen.blit(item_text, (50, y_pos))
 
                 # Quantity
-                qty_text = self.ui_renderer.font.render(f"x{quantity}", True, WHITE)
+                qty_text = render_text(self.ui_renderer.font, f"x{quantity}", WHITE)
                 self.screen.blit(qty_text, (200, y_pos))
 
                 # Stats (for equipment)
                 if inventory_manager.is_equipment(item_name):
-                    stats_text = self.ui_renderer.small_font.render(item_info["stats"], True, LIGHT_BLUE)
+                    stats_text = render_text(self.ui_renderer.small_font, item_info["stats"], LIGHT_BLUE)
                     self.screen.blit(stats_text, (250, y_pos))
 
                     # Action button for equipment
-                    action_text = self.ui_renderer.small_font.render("[E] Equip", True, GREEN)
+                    action_text = render_text(self.ui_renderer.small_font, "[E] Equip", GREEN)
                     self.screen.blit(action_text, (500, y_pos))
                 else:
                     # For consumables, show "[U] Use" option
                     if "Potion" in item_name or "Restore" in item_name:
-                        action_text = self.ui_renderer.small_font.render("[U] Use", True, YELLOW)
+                        action_text = render_text(self.ui_renderer.small_font, "[U] Use", YELLOW)
                         self.screen.blit(action_text, (500, y_pos))
 
                 y_pos += 35
 
             # Show scroll indicators
             if scroll_offset > 0:
-                up_arrow = self.ui_renderer.small_font.render("▲ More items above", True, LIGHT_BLUE)
+                up_arrow = render_text(self.ui_renderer.small_font, "▲ More items above", LIGHT_BLUE)
                 self.screen.blit(up_arrow, (450, 90))
 
             if scroll_offset + max_visible_items < len(inventory_list):
-                down_arrow = self.ui_renderer.small_font.render("▼ More items below", True, LIGHT_BLUE)
+                down_arrow = render_text(self.ui_renderer.small_font, "▼ More items below", LIGHT_BLUE)
                 self.screen.blit(down_arrow, (450, y_pos + 10))
 
         # Instructions
@@ -1638,7 +1737,7 @@ class EnhancedGameManager:
 
         instruction_y = self.HEIGHT - 80
         for instruction in instructions:
-            instruction_surface = self.ui_renderer.small_font.render(instruction, True, MENU_TEXT)
+            instruction_surface = render_text(self.ui_renderer.small_font, instruction, MENU_TEXT)
             instruction_rect = instruction_surface.get_rect(center=(self.WIDTH // 2, instruction_y))
             self.screen.blit(instruction_surface, instruction_rect)
             instruction_y += 20
@@ -1647,12 +1746,12 @@ class EnhancedGameManager:
         """Draw the enhanced character sheet with equipment details"""
         self.screen.fill(MENU_BG)
 
-        title = self.ui_renderer.large_font.render("CHARACTER SHEET", True, WHITE)
+        title = render_text(self.ui_renderer.large_font, "CHARACTER SHEET", WHITE)
         title_rect = title.get_rect(center=(self.WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
 
         if not self.character_manager.character_data:
-            no_char_text = self.ui_renderer.font.render("No character loaded!", True, WHITE)
+            no_char_text = render_text(self.ui_renderer.font, "No character loaded!", WHITE)
             no_char_rect = no_char_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
             self.screen.blit(no_char_text, no_char_rect)
             return
@@ -1710,12 +1809,12 @@ class EnhancedGameManager:
                 color = WHITE
                 font_to_use = self.ui_renderer.small_font
 
-            text = font_to_use.render(info, True, color)
+            text = render_text(font_to_use, info, color)
             self.screen.blit(text, (50, y_pos))
             y_pos += 22
 
         # Right column - Equipment
-        equipment_title = self.ui_renderer.font.render("EQUIPPED ITEMS:", True, MENU_SELECTED)
+        equipment_title = render_text(self.ui_renderer.font, "EQUIPPED ITEMS:", MENU_SELECTED)
         self.screen.blit(equipment_title, (400, 100))
 
         equip_y = 130
@@ -1740,16 +1839,16 @@ class EnhancedGameManager:
             item_color = MENU_SELECTED if (hasattr(self,
                                                    'selected_equipment_slot') and slot_index == self.selected_equipment_slot) else WHITE
 
-            slot_text = self.ui_renderer.small_font.render(f"{slot_display}:", True, slot_color)
+            slot_text = render_text(self.ui_renderer.small_font, f"{slot_display}:", slot_color)
             self.screen.blit(slot_text, (400, equip_y))
 
-            item_text = self.ui_renderer.small_font.render(item_name, True, item_color)
+            item_text = render_text(self.ui_renderer.small_font, item_name, item_color)
             self.screen.blit(item_text, (520, equip_y))
 
             # Show item stats
             item_info = inventory_manager.get_item_info(item_name)
             if item_info.get("stats"):
-                stats_text = self.ui_renderer.small_font.render(f"({item_info['stats']})", True, GREEN)
+                stats_text = render_text(self.ui_renderer.small_font, f"({item_info['stats']})", GREEN)
                 self.screen.blit(stats_text, (400, equip_y + 15))
                 equip_y += 40
             else:
@@ -1757,7 +1856,7 @@ class EnhancedGameManager:
 
         # Show unequip instructions
         if equipped_items:
-            unequip_text = self.ui_renderer.small_font.render("[Q] Unequip selected slot", True, YELLOW)
+            unequip_text = render_text(self.ui_renderer.small_font, "[Q] Unequip selected slot", YELLOW)
             self.screen.blit(unequip_text, (400, equip_y + 20))
 
         # Instructions
@@ -1768,7 +1867,7 @@ class EnhancedGameManager:
 
         instruction_y = self.HEIGHT - 60
         for instruction in instructions:
-            instruction_surface = self.ui_renderer.small_font.render(instruction, True, MENU_TEXT)
+            instruction_surface = render_text(self.ui_renderer.small_font, instruction, MENU_TEXT)
             instruction_rect = instruction_surface.get_rect(center=(self.WIDTH // 2, instruction_y))
             self.screen.blit(instruction_surface, instruction_rect)
             instruction_y += 20
@@ -1777,7 +1876,7 @@ class EnhancedGameManager:
         """Draw help screen"""
         self.screen.fill(MENU_BG)
 
-        title = self.ui_renderer.large_font.render("HELP", True, WHITE)
+        title = render_text(self.ui_renderer.large_font, "HELP", WHITE)
         title_rect = title.get_rect(center=(self.WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
 
@@ -1807,7 +1906,7 @@ class EnhancedGameManager:
             if len(display_line) > 70:
                 display_line = display_line[:67] + "..."
 
-            text = font_to_use.render(display_line, True, color)
+            text = render_text(font_to_use, display_line, color)
             screen_center = self.WIDTH // 2
             text_rect = text.get_rect(center=(screen_center, y_pos))
             self.screen.blit(text, text_rect)
@@ -1815,7 +1914,7 @@ class EnhancedGameManager:
             line_count += 1
 
         # Instructions
-        instruction = self.ui_renderer.small_font.render("Press ESC or H to return", True, MENU_TEXT)
+        instruction = render_text(self.ui_renderer.small_font, "Press ESC or H to return", MENU_TEXT)
         instruction_rect = instruction.get_rect(center=(self.WIDTH // 2, self.HEIGHT - 30))
         self.screen.blit(instruction, instruction_rect)
 
@@ -1823,14 +1922,80 @@ class EnhancedGameManager:
         """Load settings - placeholder for compatibility"""
         pass
 
+    def get_object_counts(self):
+        """Get counts of live world objects for the debug overlay"""
+        return {
+            "Enemies": self.entity_store.count_active("enemy"),
+            "Treasures": self.entity_store.count_active("treasure"),
+            "Trees": len(self.trees),
+            "Rocks/Metal": len(self.rocks) + len(self.metals),
+            "Streams/Brush": len(self.streams) + len(self.brushes),
+            "Shops/Rests": len(self.shops) + len(self.rests),
+            "Dungeons": len(self.dungeons),
+            "Particles": len(self.particles.particles),
+            "Damage texts": len(self.damage_texts),
+            "Timers": len(self.timer_wheel.pending),
+            "Map chunks": len(self.tile_map.chunks),
+            "Cached levels": len(self.level_cache.instances),
+            "Unsaved": len(self.autosave.dirty)
+        }
+
+    def get_debug_objects(self):
+        """Get every world object that has a collision rectangle"""
+        return (self.trees + self.rocks + self.metals + self.streams + self.brushes +
+                self.enemies + self.treasures + self.shops + self.rests + self.dungeons)
+
+    def store_previous_positions(self):
+        """Remember player and camera positions before a logic step (for render interpolation)"""
+        self.previous_positions = (self.animated_player.x, self.animated_player.y, self.camera.x, self.camera.y)
+
+    def report_screen_changes(self):
+        """Report the animated areas of the static screens to the display presenter"""
+        presenter = self.display_presenter
+        if not presenter.is_active(self.current_state):
+            return
+        if self.profiler.enabled:
+            presenter.invalidate()  # The overlay changes every frame
+        elif self.current_state == GameState.MAIN_MENU:
+            option_rect = self.ui_renderer.get_menu_option_rect(self.MAIN_MENU_OPTIONS[self.selected_option],
+                                                                self.selected_option)
+            presenter.watch("menu_selection", self.ui_renderer.get_selection_pulse(self.animation_timer),
+                            option_rect.inflate(12, 8))  # Largest pulse plus the border
+        elif self.current_state == GameState.LEVEL_SELECT and self.level_select_screen:
+            screen = self.level_select_screen
+            presenter.watch("level_selection", screen.get_selection_pulse(),
+                            screen.get_level_rect(screen.selected_level - 1).inflate(12, 8))
+
+    def draw_interpolated(self, alpha):
+        """Draw with player and camera positions blended between the last two logic steps"""
+        if self.previous_positions is None or self.current_state not in (GameState.GAME_BOARD, GameState.CRAFTING):
+            self.draw()
+            return
+
+        current_positions = (self.animated_player.x, self.animated_player.y, self.camera.x, self.camera.y)
+        blended = []
+        for previous, current in zip(self.previous_positions, current_positions):
+            if abs(current - previous) > self.MAX_INTERPOLATION_DISTANCE:
+                blended.append(current)  # Teleport (level change, respawn) - don't smear across the map
+            else:
+                blended.append(int(round(previous + (current - previous) * alpha)))
+
+        player_x, player_y, camera_x, camera_y = blended
+        self.animated_player.x, self.animated_player.y = player_x, player_y
+        self.camera.x, self.camera.y = camera_x, camera_y
+        try:
+            self.draw()
+        finally:
+            # Restore the real simulation positions
+            self.animated_player.x, self.animated_player.y, self.camera.x, self.camera.y = current_positions
+
     def draw(self):
         """Draw current state"""
         if self.current_state == GameState.OPENING:
             self.draw_opening_screen()
 
         elif self.current_state == GameState.MAIN_MENU:
-            menu_options = ["Start Game", "Level Select", "Settings", "Help", "Quit"]
-            self.ui_renderer.draw_enhanced_menu(self.screen, "MAGITECH RPG", menu_options,
+            self.ui_renderer.draw_enhanced_menu(self.screen, "MAGITECH RPG", self.MAIN_MENU_OPTIONS,
                                                 self.selected_option, "Choose your destiny!",
                                                 self.animation_timer)
 
@@ -1859,7 +2024,7 @@ class EnhancedGameManager:
             else:
                 # Fallback
                 self.screen.fill(MENU_BG)
-                error_text = self.ui_renderer.font.render("Level select not available!", True, RED)
+                error_text = render_text(self.ui_renderer.font, "Level select not available!", RED)
                 error_rect = error_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
                 self.screen.blit(error_text, error_rect)
 
@@ -1869,7 +2034,7 @@ class EnhancedGameManager:
             else:
                 # Fallback if settings system not available
                 self.screen.fill(MENU_BG)
-                error_text = self.ui_renderer.font.render("Settings system not available!", True, RED)
+                error_text = render_text(self.ui_renderer.font, "Settings system not available!", RED)
                 error_rect = error_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
                 self.screen.blit(error_text, error_rect)
 
@@ -1879,7 +2044,7 @@ class EnhancedGameManager:
             else:
                 # Fallback if store system not available
                 self.screen.fill(MENU_BG)
-                error_text = self.ui_renderer.font.render("Store system not available!", True, RED)
+                error_text = render_text(self.ui_renderer.font, "Store system not available!", RED)
                 error_rect = error_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
                 self.screen.blit(error_text, error_rect)
 
@@ -1894,7 +2059,6 @@ class EnhancedGameManager:
 
     def run(self):
         """Main game loop"""
-        clock = pygame.time.Clock()
         running = True
 
         changelog = load_changelog_text()
@@ -1910,26 +2074,54 @@ class EnhancedGameManager:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # Window contents were lost, present the next frame in full
+                    self.display_presenter.invalidate()
                 else:
                     # Use new event handler
                     result = self.handle_event(event)
                     if result is False:
                         running = False
+                    if event.type in (pygame.KEYDOWN, pygame.TEXTINPUT):
+                        self.display_presenter.invalidate()  # Input can change anything on a static screen
+
+            # Update game logic in fixed steps, however fast we are rendering
+            steps = self.game_clock.tick()
+            self.profiler.begin_frame()
+            with self.profiler.section("update"):
+                for _ in range(steps):
+                    self.store_previous_positions()
+                    self.update()
+                self.autosave.update()  # Save what changed once per save_interval
+
+            # Static screens report their animated areas; with nothing to report the frame is skipped
+            self.report_screen_changes()
+            if not self.display_presenter.needs_redraw(self.current_state):
+                self.display_presenter.skip(self.current_state)
+                self.profiler.end_frame()
+                continue
 
-            # Update game logic
-            self.update()
+            # Draw everything, blending movement between the last two logic steps
+            with self.profiler.section("draw"):
+                self.draw_interpolated(self.game_clock.get_alpha())
 
-            # Draw everything
-            self.draw()
+            # Profiler / debug overlay on top of everything
+            if self.profiler.enabled:
+                self.profiler.draw_overlay(self.screen, self.game_clock.get_fps(), self.get_object_counts())
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(15)
+            # Update display (only changed areas on static screens when dirty-rect mode is on)
+            with self.profiler.section("present"):
+                self.display_presenter.present(self.screen, self.current_state)
+            self.profiler.end_frame()
 
         # Save progression before quitting
         if hasattr(self, 'level_manager'):
             self.level_manager.save_progression()
 
+        self.autosave.flush()
+        self.save_queue.close()  # Wait for queued saves to reach the disk
+        self.storage.close()
+        self.tile_map.close()
         pygame.quit()
         sys.exit()
 
@@ -1939,11 +2131,15 @@ if __name__ == "__main__":
     # Create necessary files and directories
     create_sample_files()
 
+    game = None
     try:
         # Start the enhanced game
         game = EnhancedGameManager()
         game.run()
     except Exception as e:
         print(f"Game error: {e}")
+        if game is not None:
+            game.autosave.flush()  # Keep the unsaved changes
+            game.save_queue.close()
         pygame.quit()
         sys.exit()
\ No newline at end of file